@@ -0,0 +1,42 @@
+"""
+Per-neighbour cost of SolutionQualityInfo construction.
+
+Compares lazy value strings (default) with eager rendering, which is what construction did before
+(`str(position)` for every neighbour).
+
+Run as `python -m benchmarks.quality_allocation [position_size] [neighbours]`.
+"""
+import sys
+import tracemalloc
+from time import perf_counter
+
+import numpy as np
+
+from tabusearch.solution.quality.lib import custom_metric
+
+
+def measure(positions, eager: bool) -> tuple[float, float]:
+    metric = custom_metric('sum', lambda x: float(x.sum()))
+
+    tracemalloc.start()
+    start = perf_counter()
+    qualities = metric(positions)
+    if eager:
+        for quality in qualities:
+            quality._str
+    elapsed = perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed / len(positions), peak / len(positions)
+
+
+def main(size: int = 10_000, neighbours: int = 1_000):
+    positions = list(np.random.default_rng(0).integers(-100, 100, (neighbours, size)))
+    for label, eager in (('eager', True), ('lazy', False)):
+        seconds, bytes_ = measure(positions, eager)
+        print(f'{label:>5}: {seconds * 1e6:9.1f} us, {bytes_ / 1024:8.2f} KiB per neighbour')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
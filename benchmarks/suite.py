@@ -0,0 +1,258 @@
+"""
+Benchmark suite of the search hot loop.
+
+Measures per-call time of the engine components with scaling sweeps over the dimension and the neighbourhood size:
+mutation behaviours, `SolutionFactory` evaluation, filtering combinators, `TabuSearch.choose`
+and end-to-end `optimize` (timed per iteration) on the Rosenbrock and Zakharov functions and a QAP instance.
+
+Run as `python -m benchmarks.suite [--filter SUBSTRING] [--quick] [--save FILE] [--compare FILE] [--tolerance 0.25]`.
+With `--compare`, timings are compared with a saved baseline, and the exit code is 1 if any case
+is slower than the baseline by more than the tolerance (a fraction).
+"""
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Callable, Iterator
+
+import numpy as np
+
+from tabusearch import TabuSearch
+from tabusearch.memory.filtering.aspiration import AspirationCriterion, AspirationBoundType
+from tabusearch.memory.filtering.attribute import SwapTabuMatrix
+from tabusearch.memory.filtering.tabu import TabuList
+from tabusearch.mutation.base import MutationBehaviour
+from tabusearch.mutation.neighbourhood import NearestNeighboursMutation, FullAxisShiftMutation
+from tabusearch.mutation.pemutation import Swap2Mutation, Swap3Mutation
+from tabusearch.solution.factory import SolutionFactory
+from tabusearch.solution.quality.lib import custom_metric, custom_vectorized_metric
+
+
+@dataclass
+class Case:
+    """
+    Benchmark case: `setup` prepares the state and returns the measured function without arguments.
+    Timings are reported per `calls` (e.g. per iteration of an optimization).
+    """
+    name: str
+    params: dict
+    setup: Callable[[], Callable[[], object]]
+    calls: int = 1
+
+    @property
+    def id(self) -> str:
+        return self.name + ''.join(f'[{key}={value}]' for key, value in self.params.items())
+
+
+def rosenbrock(x):
+    return (100.0 * (x[1:] - x[:-1] ** 2.0) ** 2.0 + (1 - x[:-1]) ** 2.0).sum()
+
+
+def zakharov(x):
+    weighted = np.sum(0.5 * (1 + np.arange(len(x))) * x)
+    return np.sum(x ** 2) + weighted ** 2 + weighted ** 4
+
+
+def qap_metric(n: int, seed: int = 0):
+    """
+    Vectorized metric of a random quadratic assignment problem instance of size n.
+    """
+    rng = np.random.default_rng(seed)
+    flows, distances = rng.random((n, n)), rng.random((n, n))
+
+    def cost(permutations: np.ndarray) -> np.ndarray:
+        return (flows * distances[permutations[:, :, np.newaxis], permutations[:, np.newaxis, :]]).sum(axis=(1, 2))
+
+    return custom_vectorized_metric('qap', cost, minimized=True)
+
+
+def measure(fn: Callable[[], object], min_time: float, repeat: int) -> float:
+    """
+    The best of `repeat` measurements of the mean call time, each lasting at least `min_time` seconds.
+    """
+    number, elapsed = 1, 0.
+    while True:
+        start = perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (perf_counter() - start) / number)
+    return best
+
+
+def mutation_cases(sizes: list[int]) -> Iterator[Case]:
+    behaviours: dict[str, Callable[[bool], MutationBehaviour]] = {
+        'NearestNeighbours': NearestNeighboursMutation, 'FullAxisShift': FullAxisShiftMutation,
+        'Swap2': Swap2Mutation, 'Swap3': Swap3Mutation}
+    for name, behaviour in behaviours.items():
+        for batched in (False, True):
+            for n in sizes if name != 'Swap3' else [size for size in sizes if size <= 50]:
+                def setup(behaviour=behaviour, batched=batched, n=n):
+                    mutation = behaviour(batched)
+                    pivot = SolutionFactory(custom_metric('sum', np.sum)).initial(np.random.permutation(n))
+                    return lambda: mutation.mutate(pivot)
+
+                yield Case(f'mutate.{name}', dict(batched=batched, n=n), setup)
+
+
+def factory_cases(sizes: list[int]) -> Iterator[Case]:
+    for n in sizes:
+        for columnar in (False, True):
+            def setup(n=n, columnar=columnar):
+                factory = SolutionFactory(custom_metric('rosenbrock', rosenbrock, minimized=True))
+                generated = [('NN', NearestNeighboursMutation(columnar).mutate(factory.initial(np.zeros(n))))]
+                # qualities of solutions are evaluated lazily, so they are forced to be comparable with columnar ones
+                return (lambda: factory.neighbourhood(generated)) if columnar \
+                    else (lambda: [float(solution.quality) for solution in factory(generated)])
+
+            yield Case('factory.evaluate', dict(columnar=columnar, neighbours=2 * n), setup)
+
+
+def filtering_cases(sizes: list[int]) -> Iterator[Case]:
+    for n in sizes:
+        for combinator in ('otherwise', 'unite', 'intersect'):
+            for columnar in (False, True):
+                def setup(n=n, combinator=combinator, columnar=columnar):
+                    factory = SolutionFactory(custom_metric('rosenbrock', rosenbrock, minimized=True))
+                    pivot = factory.initial(np.zeros(n))
+                    generated = [('NN', NearestNeighboursMutation(columnar).mutate(pivot))]
+                    neighbours = factory.neighbourhood(generated) if columnar else factory(generated)
+                    tabu, aspiration = TabuList(n), AspirationCriterion(AspirationBoundType.Greater)
+                    aspiration.memorize(pivot)
+                    for solution in (neighbours.solutions() if columnar else neighbours)[::2]:
+                        tabu.memorize(solution)
+
+                    criterion = getattr(tabu, combinator)(aspiration)
+                    return (lambda: criterion.mask(neighbours)) if columnar else (lambda: criterion.filter(neighbours))
+
+                yield Case(f'filter.{combinator}', dict(columnar=columnar, neighbours=2 * n), setup)
+
+
+def choose_cases(sizes: list[int]) -> Iterator[Case]:
+    for n in sizes:
+        for columnar, selection in ((False, None), (False, lambda k: min(2, k - 1)), (True, None)):
+            def setup(n=n, columnar=columnar, selection=selection):
+                search = TabuSearch(NearestNeighboursMutation(columnar),
+                                    custom_metric('rosenbrock', rosenbrock, minimized=True),
+                                    selection=selection, columnar_evaluation=columnar)
+                pivot = search.solution_factory.initial(np.random.random(n))
+                neighbours = search.get_neighbours(pivot)
+                neighbours = neighbours if columnar else list(neighbours)
+                return lambda: search.choose(neighbours, pivot)
+
+            yield Case('choose', dict(columnar=columnar, sorted=selection is not None, neighbours=2 * n), setup)
+
+
+def optimize_cases(sizes: list[int], iterations: int) -> Iterator[Case]:
+    for function in (rosenbrock, zakharov):
+        for n in sizes:
+            for columnar in (False, True):
+                def setup(function=function, n=n, columnar=columnar):
+                    x0 = np.random.default_rng(0).uniform(-2, 2, n)
+
+                    def optimize():
+                        TabuSearch([NearestNeighboursMutation(columnar), FullAxisShiftMutation(columnar)],
+                                   custom_metric(function.__name__, function, minimized=True),
+                                   convergence_criterion=iterations, tabu_time=n,
+                                   columnar_evaluation=columnar).optimize(x0)
+
+                    return optimize
+
+                yield Case(f'optimize.{function.__name__}', dict(columnar=columnar, n=n), setup, iterations)
+
+    for n in [size for size in sizes if size <= 50]:
+        for tabu_matrix in (False, True):
+            def setup(n=n, tabu_matrix=tabu_matrix):
+                x0 = np.random.default_rng(0).permutation(n)
+
+                def optimize():
+                    TabuSearch(Swap2Mutation(batched=True), qap_metric(n), convergence_criterion=iterations,
+                               tabu_time=n // 4, columnar_evaluation=True,
+                               tabu_memory=SwapTabuMatrix(n, n // 4) if tabu_matrix else None).optimize(x0)
+
+                return optimize
+
+            yield Case('optimize.qap', dict(tabu_matrix=tabu_matrix, n=n), setup, iterations)
+
+
+def cases(quick: bool = False) -> Iterator[Case]:
+    """
+    All the benchmark cases. Quick mode uses small sizes only (e.g. to check the suite itself).
+    """
+    sizes = [10, 20] if quick else [10, 100, 1000]
+    iterations = 3 if quick else 20
+    yield from mutation_cases(sizes)
+    yield from factory_cases(sizes)
+    yield from filtering_cases(sizes)
+    yield from choose_cases(sizes)
+    # the end-to-end cost grows with the number of iterations, so the sweeps are smaller
+    yield from optimize_cases(sizes[:2] if quick else [10, 50, 100], iterations)
+
+
+def run(name_filter: str = '', quick: bool = False, min_time: float = 0.2, repeat: int = 3,
+        report: Callable[[str, float], None] | None = None) -> dict[str, float]:
+    """
+    Runs the benchmark cases.
+    :param name_filter: Substring of case ids to run.
+    :param quick: Whether to run small sizes only.
+    :param min_time: Minimal duration of a measurement.
+    :param repeat: Number of measurements (the best one is taken).
+    :param report: Function, which is called with id and seconds per call of every case.
+    :return: Seconds per call (or per iteration for optimization) of the cases by their ids.
+    """
+    timings = {}
+    for case in cases(quick):
+        if name_filter in case.id:
+            np.random.seed(0)
+            timings[case.id] = measure(case.setup(), min_time, repeat) / case.calls
+            if report is not None:
+                report(case.id, timings[case.id])
+    return timings
+
+
+def regressions(timings: dict[str, float], baseline: dict[str, float], tolerance: float) -> dict[str, float]:
+    """
+    Cases, slower than the baseline by more than `tolerance`, along with their slowdown ratios.
+    """
+    return {case_id: seconds / baseline[case_id] for case_id, seconds in timings.items()
+            if case_id in baseline and seconds > baseline[case_id] * (1 + tolerance)}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmarks of the search hot loop.')
+    parser.add_argument('--filter', default='', help='substring of the case ids to run')
+    parser.add_argument('--quick', action='store_true', help='run small sizes only')
+    parser.add_argument('--min-time', type=float, default=0.2, help='minimal duration of a measurement, s')
+    parser.add_argument('--repeat', type=int, default=3, help='number of measurements per case')
+    parser.add_argument('--save', help='JSON file to save the timings to')
+    parser.add_argument('--compare', help='JSON file with baseline timings')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown against the baseline')
+    args = parser.parse_args(argv)
+
+    timings = run(args.filter, args.quick, args.min_time, args.repeat,
+                  report=lambda case_id, seconds: print(f'{case_id:<70} {seconds * 1e6:12.1f} us'))
+
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump(timings, file, indent=1)
+    if args.compare:
+        with open(args.compare) as file:
+            slower = regressions(timings, json.load(file), args.tolerance)
+        for case_id, ratio in slower.items():
+            print(f'REGRESSION {case_id}: {ratio:.2f}x slower than the baseline')
+        return 1 if slower else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1 +1,2 @@
-from tabusearch.tabu_search import TabuSearch
\ No newline at end of file
+from tabusearch.tabu_search import TabuSearch
+from tabusearch.parallel import ParallelTabuSearch, CooperativeTabuSearch
@@ -0,0 +1,239 @@
+import csv
+import json
+import os
+from abc import ABC, abstractmethod
+from collections import deque
+from copy import copy
+from typing import Iterator, Literal
+
+import numpy as np
+from numpy.typing import NDArray
+
+from tabusearch.solution.base import Solution
+from tabusearch.solution.quality.batch import is_float_ordered
+
+# Columnar history record: iteration number (0 for the initial solution), float representation of the quality
+# (NaN, if qualities are not ordered by it, e.g. aggregated ones), code of the move mutation type
+# (see `ColumnarHistory.move_names`, -1 if choice failed) and whether a move was made
+HISTORY_DTYPE = np.dtype([('iteration', np.int64), ('quality', np.float64), ('move', np.int32), ('accepted', bool)])
+
+
+class HistoryRecorder(ABC):
+    """
+    Records the search trajectory: the initial solution and the chosen solution of every iteration
+    (None, if choice failed).
+    """
+    iterations: int
+
+    def __init__(self):
+        self.iterations = 0
+
+    def reset(self):
+        """
+        Clears the history before a new run.
+        """
+        self.iterations = 0
+
+    def record(self, solution: Solution | None):
+        """
+        Records the next solution of the trajectory.
+        :param solution: Chosen solution or None, if choice failed.
+        """
+        self._record(solution)
+        self.iterations += 1
+
+    def close(self):
+        """
+        Finishes recording of a run (e.g. flushes buffered records).
+        """
+        pass
+
+    @abstractmethod
+    def _record(self, solution: Solution | None):
+        ...
+
+
+class NoHistory(HistoryRecorder):
+    """
+    Does not keep the history, only counts the iterations.
+    """
+    def _record(self, solution: Solution | None):
+        pass
+
+
+class SolutionHistory(HistoryRecorder):
+    """
+    Keeps (shallow copies of) the recorded solutions.
+    If `size` is passed, keeps only the last `size` solutions in a ring buffer,
+    otherwise the whole trajectory (memory grows with the number of iterations).
+    """
+    def __init__(self, size: int | None = None):
+        """
+        Initializes solution history.
+        :param size: Size of the ring buffer. Unbounded by default.
+        """
+        if size is not None and size < 1:
+            raise ValueError(f'History size should be positive. Was {size}.')
+        super().__init__()
+        self._solutions: deque[Solution | None] = deque(maxlen=size)
+
+    def reset(self):
+        super().reset()
+        self._solutions.clear()
+
+    def _record(self, solution: Solution | None):
+        self._solutions.append(copy(solution))
+
+    def __len__(self) -> int:
+        return len(self._solutions)
+
+    def __iter__(self) -> Iterator[Solution | None]:
+        return iter(self._solutions)
+
+    def __getitem__(self, item: int | slice) -> Solution | None | list[Solution | None]:
+        return list(self._solutions)[item] if isinstance(item, slice) else self._solutions[item]
+
+
+class ColumnarHistory(HistoryRecorder):
+    """
+    Keeps the history as compact records (see `HISTORY_DTYPE`) instead of solutions,
+    so positions and quality objects of the trajectory are not kept alive.
+    """
+    move_names: list[str]
+
+    def __init__(self, initial_capacity: int = 1024):
+        """
+        Initializes columnar history.
+        :param initial_capacity: Initial number of records, the buffer is doubled when it is exhausted.
+        """
+        if initial_capacity < 1:
+            raise ValueError(f'Initial capacity should be positive. Was {initial_capacity}.')
+        super().__init__()
+        self._initial_capacity = initial_capacity
+        self._records = np.empty(initial_capacity, dtype=HISTORY_DTYPE)
+        self._size = 0
+        self.move_names = []
+        self._move_codes: dict[str, int] = {}
+
+    def reset(self):
+        super().reset()
+        self._records = np.empty(self._initial_capacity, dtype=HISTORY_DTYPE)
+        self._size = 0
+
+    @property
+    def records(self) -> NDArray:
+        """
+        Structured array of the kept records (see `HISTORY_DTYPE`).
+        """
+        return self._records[:self._size]
+
+    def move_name(self, code: int) -> str | None:
+        """
+        Name of the move mutation type by its code (None for a failed choice).
+        """
+        return self.move_names[code] if code >= 0 else None
+
+    def _record(self, solution: Solution | None):
+        if self._size == len(self._records):
+            self._records = np.resize(self._records, 2 * len(self._records))
+        self._records[self._size] = self._as_record(solution)
+        self._size += 1
+
+    def _as_record(self, solution: Solution | None) -> tuple[int, float, int, bool]:
+        if solution is None:
+            return self.iterations, np.nan, -1, False
+
+        name = solution.id.parent_name
+        code = self._move_codes.get(name)
+        if code is None:
+            code = self._move_codes[name] = len(self.move_names)
+            self.move_names.append(name)
+        quality = float(solution.quality) if is_float_ordered(solution.quality) else np.nan
+        return self.iterations, quality, code, True
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class StreamingHistory(ColumnarHistory):
+    """
+    Appends the columnar records to a file in chunks of `chunk_size`, keeping only the current chunk in memory.
+    CSV files keep move names, `.npy` files - consecutive arrays of `HISTORY_DTYPE` records with move codes,
+    while the move names are kept in a JSON sidecar file `<path>.moves.json` (see `load` and `load_move_names`).
+    The file is opened only to append a chunk, so the recorder stays picklable.
+    """
+    def __init__(self, path: str | os.PathLike, file_format: Literal['csv', 'npy'] = 'csv', chunk_size: int = 4096):
+        """
+        Initializes streaming history.
+        :param path: Path of the history file. It is overwritten on every run.
+        :param file_format: Format of the file.
+        :param chunk_size: Number of records, buffered before writing.
+        """
+        if file_format not in ('csv', 'npy'):
+            raise ValueError(f'Argument file_format should be "csv" or "npy". Was "{file_format}".')
+        super().__init__(chunk_size)
+        self.path = path
+        self._file_format = file_format
+        self._written = 0
+
+    def reset(self):
+        super().reset()
+        self._written = 0
+        with open(self.path, 'w', newline='') as file:
+            if self._file_format == 'csv':
+                csv.writer(file).writerow(HISTORY_DTYPE.names)
+        if self._file_format == 'npy':
+            self._write_move_names()
+
+    def close(self):
+        self._flush()
+
+    def __len__(self) -> int:
+        return self._written + self._size
+
+    @staticmethod
+    def load(path: str | os.PathLike) -> NDArray:
+        """
+        Loads records of a `.npy` history file.
+        """
+        chunks = []
+        with open(path, 'rb') as file:
+            while file.peek(1):
+                chunks.append(np.load(file))
+        return np.concatenate(chunks) if chunks else np.empty(0, dtype=HISTORY_DTYPE)
+
+    @staticmethod
+    def load_move_names(path: str | os.PathLike) -> list[str]:
+        """
+        Loads move names of a `.npy` history file, indexed by the move codes of its records.
+        """
+        with open(_move_names_path(path)) as file:
+            return json.load(file)
+
+    def _record(self, solution: Solution | None):
+        if self._size == self._initial_capacity:
+            self._flush()
+        super()._record(solution)
+
+    def _flush(self):
+        if not self._size:
+            return
+
+        if self._file_format == 'csv':
+            with open(self.path, 'a', newline='') as file:
+                csv.writer(file).writerows((iteration, quality, self.move_name(move), accepted)
+                                           for iteration, quality, move, accepted in self.records.tolist())
+        else:
+            with open(self.path, 'ab') as file:
+                np.save(file, self.records)
+            self._write_move_names()
+        self._written += self._size
+        self._size = 0
+
+    def _write_move_names(self):
+        with open(_move_names_path(self.path), 'w') as file:
+            json.dump(self.move_names, file)
+
+
+def _move_names_path(path: str | os.PathLike) -> str:
+    return os.fspath(path) + '.moves.json'
@@ -0,0 +1,146 @@
+from time import perf_counter
+from typing import Callable, Iterator
+
+from tabusearch.solution.base import Solution
+from tabusearch.solution.neighbourhood import Neighbourhood
+
+
+class SearchObserver:
+    """
+    Observer of the search phases, passed to `TabuSearch(..., observers=[...])`.
+    Every hook does nothing by default, override the needed ones.
+    Each hook takes the search as the first argument.
+    Streamed neighbourhoods are generated lazily and reported chunk by chunk
+    (`on_evaluated` and `on_filtered` for every chunk).
+    """
+    def on_iteration_start(self, search, iteration: int, x: Solution):
+        """
+        Called before generation of the neighbourhood of the current solution `x`.
+        """
+        pass
+
+    def on_neighbours_generated(self, search, generated: list[tuple[str, list | object]] | Iterator):
+        """
+        Called after mutation: `generated` are mutations along with names of their generators (lazy for streaming).
+        """
+        pass
+
+    def on_evaluated(self, search, neighbours: list[Solution] | Neighbourhood):
+        """
+        Called after evaluation of the neighbours (before their filtering).
+        """
+        pass
+
+    def on_filtered(self, search, admissible: list[Solution] | Neighbourhood):
+        """
+        Called after filtering of the evaluated neighbours by the tabu and aspiration criteria.
+        """
+        pass
+
+    def on_selected(self, search, choice: Solution | None):
+        """
+        Called after selection of the next solution (None, if no neighbours were admissible).
+        """
+        pass
+
+    def on_converged(self, search, x: Solution):
+        """
+        Called, when the search is converged at solution `x`.
+        """
+        pass
+
+
+class SearchProfiler(SearchObserver):
+    """
+    Low-overhead timers of the search phases and counters of the neighbourhood:
+    - timers of mutation, evaluation, filtering and selection - time since the previous hook;
+    - counters of iterations, evaluated and admissible neighbours, failed choices,
+      tabu hits (neighbours rejected by the tabu criterion),
+      aspiration overrides (tabu neighbours, allowed by aspiration) and evaluation cache hits and misses.
+    Qualities of non-columnar solutions can be evaluated lazily (e.g. `custom_metric`), then their evaluation
+    is accounted in the phase, which compares them first. Use `columnar_evaluation` to time evaluation separately.
+    For streaming, mutation is timed with evaluation, and selection of a chunk - with evaluation of the next one.
+    Usage:
+    ```
+    profiler = SearchProfiler()
+    TabuSearch(..., observers=[profiler]).optimize(x0)
+    print(profiler.summary())
+    ```
+    """
+    timers: dict[str, float]
+    counters: dict[str, int]
+
+    def __init__(self, count_tabu: bool = True, clock: Callable[[], float] = perf_counter):
+        """
+        Initializes profiler.
+        :param count_tabu: Whether to count tabu hits and aspiration overrides. It requires an additional check
+          of the neighbours by the tabu criterion (not accounted in the timers).
+        :param clock: Function, which returns current time in seconds.
+        """
+        self._count_tabu = count_tabu
+        self._clock = clock
+        self.timers = dict.fromkeys(('mutation', 'evaluation', 'filtering', 'selection'), 0.)
+        self.counters = dict.fromkeys(('iterations', 'neighbours', 'admissible', 'failed_choices', 'tabu_hits',
+                                       'aspiration_overrides', 'cache_hits', 'cache_misses'), 0)
+
+        self._last = 0.
+        self._chunk_allowed_by_tabu = 0
+        self._cache_start: tuple[int, int] | None = None
+
+    def on_iteration_start(self, search, iteration: int, x: Solution):
+        self.counters['iterations'] += 1
+        cache_info = search.solution_factory.quality_factory.cache_info()
+        if cache_info is not None and self._cache_start is None:
+            self._cache_start = cache_info.hits, cache_info.misses
+        self._last = self._clock()
+
+    def on_neighbours_generated(self, search, generated: list[tuple[str, list | object]] | Iterator):
+        self._lap('mutation')
+
+    def on_evaluated(self, search, neighbours: list[Solution] | Neighbourhood):
+        self._lap('evaluation')
+        self.counters['neighbours'] += len(neighbours)
+        if self._count_tabu:
+            self._chunk_allowed_by_tabu = int(search.tabu.mask(neighbours).sum()) \
+                if isinstance(neighbours, Neighbourhood) \
+                else len(search.tabu.filter(neighbours))
+            self.counters['tabu_hits'] += len(neighbours) - self._chunk_allowed_by_tabu
+            self._last = self._clock()
+
+    def on_filtered(self, search, admissible: list[Solution] | Neighbourhood):
+        self._lap('filtering')
+        self.counters['admissible'] += len(admissible)
+        if self._count_tabu:
+            # admissible neighbours, which are not allowed by tabu, are allowed by aspiration
+            self.counters['aspiration_overrides'] += len(admissible) - self._chunk_allowed_by_tabu
+
+    def on_selected(self, search, choice: Solution | None):
+        self._lap('selection')
+        self.counters['failed_choices'] += choice is None
+        cache_info = search.solution_factory.quality_factory.cache_info()
+        if cache_info is not None:
+            self.counters['cache_hits'] = cache_info.hits - self._cache_start[0]
+            self.counters['cache_misses'] = cache_info.misses - self._cache_start[1]
+
+    def summary(self) -> dict[str, dict[str, float | int]]:
+        """
+        Timers (seconds per phase) and counters.
+        """
+        return dict(timers=dict(self.timers), counters=dict(self.counters))
+
+    def prometheus(self, prefix: str = 'tabusearch') -> str:
+        """
+        Timers and counters in Prometheus text exposition format.
+        :param prefix: Prefix of the metric names.
+        """
+        lines = [f'# TYPE {prefix}_phase_seconds_total counter']
+        lines.extend(f'{prefix}_phase_seconds_total{{phase="{phase}"}} {seconds!r}'
+                     for phase, seconds in self.timers.items())
+        for name, value in self.counters.items():
+            lines.extend((f'# TYPE {prefix}_{name}_total counter', f'{prefix}_{name}_total {value}'))
+        return '\n'.join(lines) + '\n'
+
+    def _lap(self, phase: str):
+        now = self._clock()
+        self.timers[phase] += now - self._last
+        self._last = now
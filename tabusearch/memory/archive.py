@@ -0,0 +1,134 @@
+from operator import attrgetter
+from typing import Callable, Generic, Iterator, Literal, NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+from sortedcontainers import SortedKeyList
+
+from tabusearch.solution.base import Solution
+from tabusearch.solution.quality.pareto import crowding_distance, hypervolume_contributions
+from tabusearch.typing_ import TData
+
+
+class _Entry(NamedTuple):
+    first: float
+    scores: NDArray[float]
+    solution: Solution
+
+
+def quality_floats(solution: Solution) -> NDArray[float]:
+    """
+    Float representations of the metrics of a solution quality, compared per metric
+    (see `per_metric_comparison_aggregation`).
+    """
+    return solution.quality.floats
+
+
+class ParetoArchive(Generic[TData]):
+    """
+    Bounded archive of non-dominated solutions - multi-objective hall of fame.
+    A solution is archived, if no archived solution dominates (or equals) it, and it drops the archived solutions,
+    which it dominates. When the archive is overflowed, the most crowded solution is dropped
+    (the smallest crowding distance or exclusive hypervolume contribution).
+    The front is kept sorted by the first metric, so for 2 metrics the dominance check takes O(log n)
+    (against the neighbours in the sorted front only), for more metrics - O(n) vectorized.
+    A full archive recomputes crowding (or contributions) of the whole front to drop a solution,
+    so then every accepted insertion takes O(n log n) - keep the capacity moderate.
+    Iteration order is ascending by the first metric, so the last solution is the best by it.
+    """
+    capacity: int
+
+    def __init__(self, capacity: int = 100, truncation: Literal['crowding', 'hypervolume'] = 'crowding',
+                 reference: NDArray[float] | tuple[float, ...] | None = None,
+                 scores: Callable[[Solution[TData]], NDArray[float]] = quality_floats):
+        """
+        Initializes Pareto archive.
+        :param capacity: Maximal number of archived solutions.
+        :param truncation: How to choose a solution to drop on overflow: by crowding distance
+          or by exclusive hypervolume contribution (only for 2 metrics).
+        :param reference: Reference point for hypervolume (dominated by all the solutions). Required for hypervolume.
+        :param scores: Function of a solution, which returns float representations of its metrics (greater is better).
+          Defaults to the floats of qualities, compared per metric.
+        """
+        if capacity < 1:
+            raise ValueError(f'Capacity should be positive. Was {capacity}.')
+        if truncation not in ('crowding', 'hypervolume'):
+            raise ValueError(f'Argument truncation should be "crowding" or "hypervolume". Was "{truncation}".')
+        if truncation == 'hypervolume' and (reference is None or len(reference) != 2):
+            raise ValueError('Hypervolume truncation requires a reference point of 2 metrics.')
+
+        self.capacity = capacity
+        self._truncation = truncation
+        self._reference = None if reference is None else np.asarray(reference, dtype=np.float64)
+        self._scores = scores
+        self._entries = SortedKeyList(key=attrgetter('first'))
+        self._matrix: NDArray[float] | None = None
+
+    def add(self, solution: Solution[TData]) -> bool:
+        """
+        Archives solution, if it is not dominated.
+        :return: Whether the solution was archived.
+        """
+        scores = np.asarray(self._scores(solution), dtype=np.float64)
+        entry = _Entry(float(scores[0]), scores, solution)
+        added = self._add_2d(entry) if len(scores) == 2 else self._add_nd(entry)
+        if added:
+            self._matrix = None
+            if len(self._entries) > self.capacity:
+                self._truncate()
+        return added
+
+    @property
+    def scores(self) -> NDArray[float]:
+        """
+        (n_solutions, n_metrics) matrix of the archived solutions scores in the archive order.
+        """
+        if self._matrix is None:
+            self._matrix = np.array([entry.scores for entry in self._entries], dtype=np.float64)
+        return self._matrix
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Solution[TData]]:
+        return (entry.solution for entry in self._entries)
+
+    def __getitem__(self, item: int) -> Solution[TData]:
+        return self._entries[item].solution
+
+    def _add_2d(self, entry: _Entry) -> bool:
+        # the front is sorted by ascending first metric, so the second metric is descending
+        i = self._entries.bisect_key_left(entry.first)
+        if i < len(self._entries) and self._entries[i].scores[1] >= entry.scores[1]:
+            # the first solution with not worse first metric has the best second metric among such ones
+            return False
+        if i < len(self._entries) and self._entries[i].first == entry.first:
+            del self._entries[i]
+
+        start = i
+        while start > 0 and self._entries[start - 1].scores[1] <= entry.scores[1]:
+            start -= 1
+        del self._entries[start:i]
+
+        self._entries.add(entry)
+        return True
+
+    def _add_nd(self, entry: _Entry) -> bool:
+        if len(self._entries):
+            matrix = self.scores
+            if (matrix >= entry.scores).all(axis=1).any():
+                return False
+            # not dominated by any archived solution, so is better by some metric than each not worse one
+            for i in np.flatnonzero((entry.scores >= matrix).all(axis=1))[::-1].tolist():
+                del self._entries[i]
+
+        self._entries.add(entry)
+        return True
+
+    def _truncate(self):
+        if self._truncation == 'hypervolume':
+            crowding = hypervolume_contributions(self.scores, self._reference)
+        else:
+            crowding = crowding_distance(self.scores)
+        del self._entries[int(np.argmin(crowding))]
+        self._matrix = None
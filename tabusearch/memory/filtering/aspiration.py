@@ -1,13 +1,15 @@
 from abc import ABC
 from enum import Enum, auto
 from operator import gt, ge, attrgetter
-from typing import Iterable, Set, Callable, Optional
+from typing import Iterable, Callable, Optional
 
+import numpy as np
 from numpy import NAN
+from numpy.typing import NDArray
 
 from tabusearch.memory.filtering.base import FilteringMemoryCriterion
 from tabusearch.solution.base import Solution
-from tabusearch.solution.id import SolutionId
+from tabusearch.solution.neighbourhood import Neighbourhood
 from tabusearch.solution.quality.base import BaseSolutionQualityInfo
 from tabusearch.solution.quality.factory import SolutionQualityFactory
 
@@ -21,10 +23,13 @@ class AspirationBoundType(Enum):
 
 
 class AspirationCriterion(FilteringMemoryCriterion, ABC):
+    """
+    Allows solutions, which aspiration exceeds the best memorized one.
+    To evaluate aspiration only for solutions, dropped by tabu, combine it as `tabu.otherwise(aspiration)`.
+    """
     _aspiration_bound: BaseSolutionQualityInfo
 
     _aspiration_comparison: Callable[[BaseSolutionQualityInfo, BaseSolutionQualityInfo], bool]
-    # TODO: consider calculating _get_solution_aspiration only for solutions dropped by tabu
     _get_solution_aspiration: Callable[[Solution], BaseSolutionQualityInfo]
 
     def __init__(self, bound_type: Optional[AspirationBoundType] = None,
@@ -34,15 +39,25 @@ class AspirationCriterion(FilteringMemoryCriterion, ABC):
         self._aspiration_comparison = ge if bound_type is AspirationBoundType.GreaterEquals else gt
         self._get_solution_aspiration = attrgetter('quality') if move_aspiration is None else move_aspiration
         self._aspiration_bound = NAN
+        self._aspires_by_quality = move_aspiration is None
 
     def memorize(self, move: Solution):
         if self._aspiration_bound is NAN or self._is_aspired(move):
             self._aspiration_bound = move.quality
 
-    def _criterion(self, x: Iterable[Solution]) -> Set[SolutionId]:
-        return {s.id for s in x} \
+    def _criterion(self, x: list[Solution]) -> Iterable[bool]:
+        return (True for _ in x) \
             if self._aspiration_bound is NAN \
-            else {s.id for s in x if self._is_aspired(s)}
+            else map(self._is_aspired, x)
+
+    def mask(self, x: Neighbourhood) -> NDArray[bool]:
+        if self._aspiration_bound is NAN:
+            mask = np.ones(len(x), dtype=bool)
+        elif self._aspires_by_quality:
+            mask = self._aspiration_comparison(x.qualities.scores, float(self._aspiration_bound))
+        else:
+            return super().mask(x)
+        return ~mask if self._inverted else mask
 
     def _is_aspired(self, new: Solution):
         return self._aspiration_comparison(self._get_solution_aspiration(new), self._aspiration_bound)
@@ -0,0 +1,162 @@
+from abc import ABC, abstractmethod
+from functools import partial
+from typing import Callable, Dict, List, Hashable, Literal
+
+import numpy as np
+from numpy.typing import NDArray
+
+from tabusearch.memory.filtering.base import BaseFilteringMemoryCriterion
+from tabusearch.memory.filtering.tabu import constant_tabu_time
+from tabusearch.mutation.base import MutationBatch
+from tabusearch.solution.base import Solution
+from tabusearch.solution.move import Move
+from tabusearch.solution.neighbourhood import LazyColumn, Neighbourhood
+
+
+class MoveAttributeTabuMemory(BaseFilteringMemoryCriterion, ABC):
+    """
+    Short-term memory, which makes tabu attributes of moves rather than solution ids.
+    Requires solutions to have `move` (i.e., to be generated by batched mutation behaviours).
+    Neighbourhoods are checked by the index arrays of their mutation batches, without `Move` per neighbour.
+    """
+    _iteration: int
+    _tabu_time_getter: Callable[[Solution], int]
+
+    def __init__(self, tabu_time_getter: Callable[[Solution], int] | int):
+        super().__init__()
+        self._iteration = 0
+        self._tabu_time_getter = tabu_time_getter if callable(tabu_time_getter) \
+            else partial(constant_tabu_time, tabu_time_getter)
+
+    @abstractmethod
+    def _tabu_mask(self, idx: NDArray[int], new: NDArray) -> NDArray[bool]:
+        """
+        Checks, which moves are tabu.
+        :param idx: (k, m) indices of the elements, changed by the moves.
+        :param new: (k, m) new values of the changed elements.
+        :return: Boolean mask of tabu moves.
+        """
+        ...
+
+    @abstractmethod
+    def _memorize_attributes(self, move: Move, expiry: int):
+        """
+        Makes attributes of the selected move tabu until `expiry` iteration.
+        :param move: Move of the selected solution.
+        :param expiry: The first iteration, in which the attributes are not tabu.
+        """
+        ...
+
+    def _allowed_mask(self, x: list[Solution]) -> NDArray[bool]:
+        return self._allowed_moves_mask([s.move for s in x])
+
+    def mask(self, x: Neighbourhood) -> NDArray[bool]:
+        if not isinstance(x.moves, LazyColumn):
+            return self._filter_moves_mask(x.moves)
+
+        masks = [~self._tabu_mask(part.idx, part.values) if isinstance(part, MutationBatch)
+                 else self._allowed_moves_mask(part)
+                 for part in x.moves.parts]
+        mask = np.concatenate([np.ones(0, bool), *masks])
+        return ~mask if self._inverted else mask
+
+    def memorize(self, move: Solution):
+        self._iteration += 1
+        tabu_time = self._tabu_time_getter(move)
+        if move.move is not None and tabu_time > 0:
+            self._memorize_attributes(move.move, self._iteration + tabu_time)
+
+    def _filter_moves_mask(self, moves: list[Move | None]) -> NDArray[bool]:
+        mask = self._allowed_moves_mask(moves)
+        return ~mask if self._inverted else mask
+
+    def _allowed_moves_mask(self, moves: list[Move | None]) -> NDArray[bool]:
+        if any(m is None for m in moves):
+            raise ValueError(f'{type(self).__name__} requires solutions with moves. '
+                             'Use batched mutation behaviours to generate them.')
+        if not moves:
+            return np.ones(0, bool)
+        if len({len(m.idx) for m in moves}) == 1:
+            return ~self._tabu_mask(np.array([m.idx for m in moves]), np.array([m.new for m in moves]))
+        # moves of different generators can change different numbers of elements
+        return np.fromiter((not self._tabu_mask(m.idx[np.newaxis], m.new[np.newaxis])[0] for m in moves),
+                           bool, len(moves))
+
+
+class AttributeTabuList(MoveAttributeTabuMemory):
+    """
+    Tabu list of move attributes, keyed by compact tuples of integers (and values).
+    Attributes:
+      - 'reversal' (classical): after a move, assigning its old values back to the changed indices is tabu;
+      - 'indices': after a move, changing the same set of indices is tabu.
+    """
+    _expiry: Dict[Hashable, int]
+    _expiring: Dict[int, List[Hashable]]
+
+    def __init__(self, tabu_time_getter: Callable[[Solution], int] | int,
+                 attributes: Literal['reversal', 'indices'] = 'reversal'):
+        if attributes not in ('reversal', 'indices'):
+            raise ValueError(f'Argument attributes should be "reversal" or "indices". Was "{attributes}".')
+
+        super().__init__(tabu_time_getter)
+        self._reversal = attributes == 'reversal'
+        self._expiry = {}
+        self._expiring = {}
+
+    def _tabu_mask(self, idx: NDArray[int], new: NDArray) -> NDArray[bool]:
+        mask = np.zeros(len(idx), bool)
+        expiry, iteration = self._expiry, self._iteration
+        if not expiry:
+            return mask
+
+        # only the moves, which change the memorized indices, are looked up
+        if self._reversal:
+            touched = np.flatnonzero(np.isin(idx, [i for i, _ in expiry]).any(axis=1))
+            mask[touched] = [any(expiry.get(a, 0) > iteration for a in zip(move_idx, move_new))
+                             for move_idx, move_new in zip(idx[touched].tolist(), new[touched].tolist())]
+        else:
+            touched = np.flatnonzero(np.isin(idx, [i for a in expiry for i in a]).all(axis=1))
+            mask[touched] = [expiry.get(tuple(sorted(move_idx)), 0) > iteration for move_idx in idx[touched].tolist()]
+        return mask
+
+    def memorize(self, move: Solution):
+        super().memorize(move)
+        for a in self._expiring.pop(self._iteration, ()):
+            # the attribute could be re-memorized later with another expiry
+            if self._expiry.get(a) == self._iteration:
+                del self._expiry[a]
+
+    def _memorize_attributes(self, move: Move, expiry: int):
+        attributes = zip(move.idx.tolist(), move.old.tolist()) \
+            if self._reversal \
+            else [tuple(sorted(move.idx.tolist()))]
+        for a in attributes:
+            self._expiry[a] = expiry
+            self._expiring.setdefault(expiry, []).append(a)
+
+
+class SwapTabuMatrix(MoveAttributeTabuMemory):
+    """
+    Tabu memory for moves, which change two elements (e.g., `Swap2Mutation`).
+    Keeps a preallocated matrix `tabu_until[i, j]` of iterations, until which swap of elements i and j is tabu,
+    so that checking a mutation batch is a single array read.
+    """
+    tabu_until: NDArray[int]
+
+    def __init__(self, size: int, tabu_time_getter: Callable[[Solution], int] | int):
+        """
+        Initializes tabu matrix.
+        :param size: Size of mutated solutions.
+        :param tabu_time_getter: Tabu time or function of selected solution, which returns its tabu time.
+        """
+        super().__init__(tabu_time_getter)
+        self.tabu_until = np.zeros((size, size), dtype=np.int64)
+
+    def _tabu_mask(self, idx: NDArray[int], new: NDArray) -> NDArray[bool]:
+        if idx.ndim != 2 or idx.shape[1] != 2:
+            raise ValueError('SwapTabuMatrix supports only moves, which change two elements.')
+        return self.tabu_until[idx.min(axis=1), idx.max(axis=1)] > self._iteration
+
+    def _memorize_attributes(self, move: Move, expiry: int):
+        i, j = sorted(move.idx.tolist())
+        self.tabu_until[i, j] = expiry
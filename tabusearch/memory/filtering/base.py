@@ -1,59 +1,93 @@
-from _operator import attrgetter, itemgetter
 from abc import ABC, abstractmethod
 from copy import copy
-from functools import wraps, reduce
-from typing import Iterable, Set, Tuple, List, Callable
+from functools import reduce
+from itertools import compress
+from typing import Iterable, Callable, List
+
+import numpy as np
+from numpy.typing import NDArray
 
 from tabusearch.memory.base import BaseMemoryCriterion
-from tabusearch.solution.id import SolutionId
 from tabusearch.solution.base import Solution
+from tabusearch.solution.neighbourhood import Neighbourhood
 
 
 class BaseFilteringMemoryCriterion(BaseMemoryCriterion, ABC):
+    """
+    Memory criterion, which filters proposed solutions.
+    Filtering is implemented via boolean masks of allowed solutions, so that criteria are combined vectorized.
+    """
     _inverted: bool
 
     def __init__(self):
         self._inverted = False
 
-    @abstractmethod
-    def filter(self, x: Iterable[Solution]) -> Iterable[Solution]:
+    def filter(self, x: Iterable[Solution]) -> list[Solution]:
         """
         Filters solutions due to conditions of the MemoryCriterion.
         :param x: Proposed set (collection) of solutions.
         :return: Subset of allowed solutions.
         """
+        x = x if isinstance(x, list) else list(x)
+        return list(compress(x, self._filter_mask(x)))
+
+    def _filter_mask(self, x: list[Solution]) -> NDArray[bool]:
+        """
+        Like filter, but returns boolean mask of allowed solutions.
+        :param x: Proposed solutions.
+        :return: Boolean mask of allowed solutions.
+        """
+        mask = self._allowed_mask(x)
+        return ~mask if self._inverted else mask
 
     @abstractmethod
-    def _filter_list_idx(self, x: Iterable[Solution]) -> Set[int]:
+    def _allowed_mask(self, x: list[Solution]) -> NDArray[bool]:
         """
-        Like filter, but uses solutions ids in ordered list, rather than solution ids via _solution_id_getter
-        :param x:
-        :return:
+        Checks, which solutions are allowed by the criterion (not accounting its inversion).
+        :param x: Proposed solutions.
+        :return: Boolean mask of allowed solutions.
         """
         ...
 
-    @abstractmethod
+    def mask(self, x: Neighbourhood) -> NDArray[bool]:
+        """
+        Filters columnar neighbourhood due to conditions of the MemoryCriterion.
+        By default, materializes solutions of the neighbourhood. Override to filter it vectorized.
+        :param x: Proposed neighbourhood.
+        :return: Boolean mask of allowed neighbours.
+        """
+        return self._filter_mask(x.solutions())
+
     def _negate_criterion(self):
         """
         Negates criterion, i.e. subtracts its former return value from the input set of solutions.
         """
-        ...
+        self._inverted = not self._inverted
 
     def unite(self, other: 'BaseFilteringMemoryCriterion') -> 'BaseFilteringMemoryCriterion':
         """
         Represents union of criteria.
         :param other: other criterion
-        :return: CumulativeMemoryCriterion, which `.filter()` returns union of sets, filtered by the criteria.
+        :return: CumulativeMemoryCriterion, which allows solutions, allowed by any of the criteria.
         """
-        return CumulativeFilteringMemoryCriterion(set.union, self, other)
+        return CumulativeFilteringMemoryCriterion(np.logical_or, self, other)
 
     def intersect(self, other: 'BaseFilteringMemoryCriterion') -> 'BaseFilteringMemoryCriterion':
         """
         Represents intersection of criteria.
         :param other: other criterion
-        :return: CumulativeMemoryCriterion, which `.filter()` returns intersection of sets, filtered by the criteria.
+        :return: CumulativeMemoryCriterion, which allows solutions, allowed by all the criteria.
+        """
+        return CumulativeFilteringMemoryCriterion(np.logical_and, self, other)
+
+    def otherwise(self, other: 'BaseFilteringMemoryCriterion') -> 'BaseFilteringMemoryCriterion':
+        """
+        Represents ordered short-circuit union of criteria: `other` is checked only for solutions, rejected by this one.
+        Allows the same solutions as `unite`, but skips `other` evaluation for solutions, allowed by this criterion.
+        :param other: other criterion
+        :return: OrderedUnionFilteringMemoryCriterion.
         """
-        return CumulativeFilteringMemoryCriterion(set.intersection, self, other)
+        return OrderedUnionFilteringMemoryCriterion(self, other)
 
     def inverted(self) -> 'BaseFilteringMemoryCriterion':
         """
@@ -66,42 +100,20 @@ class BaseFilteringMemoryCriterion(BaseMemoryCriterion, ABC):
 
 
 class FilteringMemoryCriterion(BaseFilteringMemoryCriterion, ABC):
+    """
+    Filtering memory criterion, which checks every solution separately.
+    """
     @abstractmethod
-    def _criterion(self, x: Iterable[Solution]) -> Set[SolutionId]:
+    def _criterion(self, x: list[Solution]) -> Iterable[bool]:
         """
-        Returns a set of ids, which allowed by this criterion type. The set can have intersection with ids of x
-        :param x:
-        :return:
+        Checks, which solutions are allowed by this criterion type.
+        :param x: Proposed solutions.
+        :return: Whether every solution is allowed, in order of `x`.
         """
         ...
 
-    def filter(self, x: Iterable[Solution]) -> Iterable[Solution]:
-        good_idx, move_idx = self._get_all_and_good_move_idx(x)
-        return [move for move, idx in zip(x, move_idx) if idx in good_idx]
-
-    def _filter_list_idx(self, x: Iterable[Solution]) -> Set[int]:
-        good_idx, move_idx = self._get_all_and_good_move_idx(x)
-        return {i for i, idx in enumerate(move_idx) if idx in good_idx}
-
-    def _negate_criterion(self):
-        def negated_criterion(criterion):
-            @wraps(criterion)
-            def wrapper(_self: FilteringMemoryCriterion, x: Iterable[Solution]) -> Set[SolutionId]:
-                return {el.id for el in x}.difference(criterion(_self, x))
-
-            return wrapper
-
-        # noinspection PyUnresolvedReferences
-        self._criterion = self._criterion.__wrapped__ \
-            if self._inverted else \
-            negated_criterion(self._criterion)
-        self._inverted = not self._inverted
-
-    def _get_all_and_good_move_idx(self, x: Iterable[Solution]) -> Tuple[Set[SolutionId], List[SolutionId]]:
-        move_idx = list(map(attrgetter('id'), x))
-        # noinspection PyArgumentList
-        good_idx = self._criterion(x)
-        return good_idx, move_idx
+    def _allowed_mask(self, x: list[Solution]) -> NDArray[bool]:
+        return np.fromiter(self._criterion(x), dtype=bool, count=len(x))
 
 
 class CumulativeFilteringMemoryCriterion(BaseFilteringMemoryCriterion):
@@ -109,29 +121,59 @@ class CumulativeFilteringMemoryCriterion(BaseFilteringMemoryCriterion):
     Used to accumulate multiple memory criteria
     """
 
-    def __init__(self, operation: Callable[[set, set], set], *criteria):
+    def __init__(self, operation: Callable[[NDArray[bool], NDArray[bool]], NDArray[bool]], *criteria):
+        """
+        Initializes cumulative criterion.
+        :param operation: Boolean masks operation (e.g., `np.logical_or`). Set operations are converted to them.
+        :param criteria: Accumulated criteria.
+        """
         assert len(criteria) > 0
         super().__init__()
 
-        self._operation = operation
+        self._operation = _MASK_OPERATIONS.get(operation, operation)
         self._criteria: List[BaseFilteringMemoryCriterion] = list(criteria)
 
-    def filter(self, x: Iterable[Solution]) -> Iterable[Solution]:
-        x = x if isinstance(x, list) else list(x)
-        good_list_idx = self._filter_list_idx(x)
-        num = len(good_list_idx)
-        return itemgetter(*good_list_idx)(x) if num > 1 else \
-            ((x[good_list_idx.pop()],) if num else [])
-
     def memorize(self, move: Solution):
         for c in self._criteria:
             c.memorize(move)
 
-    def _filter_list_idx(self, x: Iterable[Solution]) -> Set[int]:
-        x = x if isinstance(x, list) else list(x)
+    def _allowed_mask(self, x: list[Solution]) -> NDArray[bool]:
+        return reduce(self._operation, [c._filter_mask(x) for c in self._criteria])
 
-        res = reduce(self._operation, [c._filter_list_idx(x) for c in self._criteria])
-        return set(range(len(x))).difference(res) if self._inverted else res
+    def mask(self, x: Neighbourhood) -> NDArray[bool]:
+        res = reduce(self._operation, [c.mask(x) for c in self._criteria])
+        return ~res if self._inverted else res
 
-    def _negate_criterion(self):
-        self._inverted = not self._inverted
+
+class OrderedUnionFilteringMemoryCriterion(BaseFilteringMemoryCriterion):
+    """
+    Union of two criteria, which checks the second criterion only for solutions, rejected by the first one
+    (e.g., aspiration of tabu moves).
+    """
+
+    def __init__(self, first: BaseFilteringMemoryCriterion, second: BaseFilteringMemoryCriterion):
+        super().__init__()
+        self._first = first
+        self._second = second
+
+    def memorize(self, move: Solution):
+        self._first.memorize(move)
+        self._second.memorize(move)
+
+    def _allowed_mask(self, x: list[Solution]) -> NDArray[bool]:
+        mask = self._first._filter_mask(x)
+        rejected = np.flatnonzero(~mask)
+        if len(rejected):
+            mask[rejected] = self._second._filter_mask([x[i] for i in rejected.tolist()])
+        return mask
+
+    def mask(self, x: Neighbourhood) -> NDArray[bool]:
+        mask = self._first.mask(x)
+        rejected = np.flatnonzero(~mask)
+        if len(rejected):
+            mask[rejected] = self._second.mask(x.take(rejected))
+        return ~mask if self._inverted else mask
+
+
+# Boolean mask counterparts of set operations, accepted by CumulativeFilteringMemoryCriterion
+_MASK_OPERATIONS = {set.union: np.logical_or, set.intersection: np.logical_and}
@@ -1,33 +1,63 @@
-from typing import Iterable, Set, Callable, Dict
+from functools import partial
+from typing import Iterable, Callable, Dict, List
+
+import numpy as np
+from numpy.typing import NDArray
 
 from tabusearch.memory.filtering.base import FilteringMemoryCriterion
 from tabusearch.solution.base import Solution
 from tabusearch.solution.id import SolutionId
+from tabusearch.solution.neighbourhood import Neighbourhood
 
 
 # TODO: introduce library of tabu time getters and a convenient way to pass them to TabuList ctor
 
 
+def constant_tabu_time(tabu_time: int, _: Solution) -> int:
+    """
+    Tabu time getter, which gives the same tabu time to every move.
+    Module-level (used via `partial`), so that tabu memories stay picklable.
+    """
+    return tabu_time
+
+
 class TabuList(FilteringMemoryCriterion):
     """
     Represents short-term memory in Tabu Search algorithm (tabu list).
+    A memorized move stays tabu during its tabu time (number of next memorized moves).
+    Instead of counting down every entry on each memorization, the list stores the iteration,
+    in which each entry expires, and drops entries lazily from buckets of expiring iterations.
     """
 
-    _timers: Dict[SolutionId, int]
+    _expiry: Dict[SolutionId, int]
+    _expiring: Dict[int, List[SolutionId]]
+    _iteration: int
     _tabu_time_getter:  Callable[[Solution], int]
 
     def __init__(self, tabu_time_getter: Callable[[Solution], int] | int):
         super().__init__()
-        self._timers = {}
-        self._tabu_time_getter = tabu_time_getter if callable(tabu_time_getter) else (lambda _: tabu_time_getter)
+        self._expiry = {}
+        self._expiring = {}
+        self._iteration = 0
+        self._tabu_time_getter = tabu_time_getter if callable(tabu_time_getter) \
+            else partial(constant_tabu_time, tabu_time_getter)
+
+    def _criterion(self, x: list[Solution]) -> Iterable[bool]:
+        return (s.id not in self._expiry for s in x)
 
-    def _criterion(self, x: Iterable[Solution]) -> Set[SolutionId]:
-        return {id_ for id_ in [s.id for s in x] if id_ not in self._timers}
+    def mask(self, x: Neighbourhood) -> NDArray[bool]:
+        mask = np.fromiter((id_ not in self._expiry for id_ in x.ids), dtype=bool, count=len(x))
+        return ~mask if self._inverted else mask
 
     def memorize(self, move: Solution):
-        for k, v in list(self._timers.items()):
-            if v == 1:
-                del self._timers[k]
-            else:
-                self._timers[k] -= 1
-        self._timers[move.id] = self._tabu_time_getter(move)
+        self._iteration += 1
+        for id_ in self._expiring.pop(self._iteration, ()):
+            # the entry could be re-memorized later with another expiry
+            if self._expiry.get(id_) == self._iteration:
+                del self._expiry[id_]
+
+        tabu_time = self._tabu_time_getter(move)
+        if tabu_time > 0:
+            expiry = self._iteration + tabu_time
+            self._expiry[move.id] = expiry
+            self._expiring.setdefault(expiry, []).append(move.id)
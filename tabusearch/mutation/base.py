@@ -1,25 +1,116 @@
 from abc import ABC, abstractmethod
-from typing import Generic
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Generic, Iterator
+
+import numpy as np
+from numpy.typing import NDArray
 
 from tabusearch.solution.base import Solution
+from tabusearch.solution.move import Move
 from tabusearch.typing_ import TData
 
 
+@dataclass
+class MutationBatch:
+    """
+    Neighbourhood of a single pivot, represented by integer arrays instead of per-neighbour copies.
+    k-th mutation assigns `values[k]` to the pivot elements at `idx[k]`.
+    Positions of all the neighbours are materialized on demand as one 2D ndarray (one row per mutation),
+    or one by one with `position` (e.g., when the batch is delta evaluated, and only the selected neighbour is needed).
+    """
+    pivot: NDArray
+    # (k, m) indices of the changed elements
+    idx: NDArray[int]
+    # (k, m) new values of the changed elements
+    values: NDArray
+    # (k, d) compact integer move descriptors, used to name the mutations
+    descriptors: NDArray[int]
+    # Optional names for values in the first descriptors column (e.g., direction signs)
+    marks: dict[int, str] | None = None
+
+    def __len__(self):
+        return len(self.idx)
+
+    @cached_property
+    def positions(self) -> NDArray:
+        """
+        (k, n) matrix of mutated positions - the pivot broadcast with mutated elements put in place.
+        """
+        positions = np.repeat(self.pivot[np.newaxis], len(self), axis=0)
+        np.put_along_axis(positions, self.idx, self.values, axis=1)
+        return positions
+
+    @cached_property
+    def old(self) -> NDArray:
+        """
+        (k, m) values of the changed elements in the pivot.
+        """
+        return self.pivot[self.idx]
+
+    def position(self, i: int) -> NDArray:
+        """
+        Mutated position of i-th mutation.
+        """
+        position = self.pivot.copy()
+        position[self.idx[i]] = self.values[i]
+        return position
+
+    def move(self, i: int) -> Move:
+        """
+        Describes i-th mutation as a `Move` (changed indices with their old and new values).
+        """
+        return Move(self.idx[i], self.old[i], self.values[i])
+
+    def moves(self) -> list[Move]:
+        """
+        Describes every mutation as a `Move`.
+        """
+        return list(map(Move, self.idx, self.old, self.values))
+
+    def take(self, items: NDArray[int] | NDArray[bool]) -> 'MutationBatch':
+        """
+        Subset of the batch.
+        :param items: Indices or boolean mask of the mutations to keep.
+        """
+        return MutationBatch(self.pivot, self.idx[items], self.values[items], self.descriptors[items], self.marks)
+
+    def mutations(self) -> list[tuple[NDArray, ...]]:
+        """
+        The batch in list-based mutations format - positions (rows of `positions`) with their str name components.
+        """
+        return [(position, *suffix) for position, suffix in zip(self.positions, self.suffixes())]
+
+    def suffixes(self) -> Iterator[tuple[str, ...]]:
+        """
+        Str name components of mutations, same as list-based mutations generate.
+        """
+        for descriptor in self.descriptors.tolist():
+            if self.marks:
+                descriptor[0] = self.marks[descriptor[0]]
+            yield tuple(map(str, descriptor))
+
+
 class MutationBehaviour(ABC, Generic[TData]):
     _mutation_type: str = None
+    _batched: bool = False
+
+    def __init__(self, mutation_type: str, batched: bool = False):
+        if batched and type(self)._generate_batch is MutationBehaviour._generate_batch:
+            raise ValueError(f'{type(self).__name__} does not support batched mode.')
 
-    def __init__(self, mutation_type: str):
         self._mutation_type = mutation_type
+        self._batched = batched
 
-    def mutate(self, pivot: Solution) -> list[tuple[TData, str]]:
+    def mutate(self, pivot: Solution) -> list[tuple[TData, str]] | MutationBatch:
         """
         Main interface for generation of new solution space.
         :param pivot: Previous solution, whom neighbourhood should be found.
-        :return: New solution space.
+        :return: New solution space. `MutationBatch`, if the behaviour is batched.
         """
         # TODO: erase
         # return [self._solution_factory(*mutation) for mutation in self._generate_mutations(pivot.position)]
-        return self._generate_mutations(pivot.position)
+        return self._generate_batch(pivot.position) if self._batched else self._generate_mutations(pivot.position)
 
     @property
     def mutation_type(self) -> str:
@@ -28,6 +119,13 @@ class MutationBehaviour(ABC, Generic[TData]):
         """
         return self._mutation_type
 
+    @property
+    def batched(self) -> bool:
+        """
+        Whether the behaviour generates `MutationBatch` instead of list of mutations.
+        """
+        return self._batched
+
     @abstractmethod
     def _generate_mutations(self, x: TData) -> list[tuple[TData, str]]:
         """
@@ -36,3 +134,22 @@ class MutationBehaviour(ABC, Generic[TData]):
         :return: Collection of all possible mutation positions in tuples with their str name components
         """
         ...
+
+    def _generate_batch(self, x: NDArray) -> MutationBatch:
+        """
+        Returns all possible mutations of 1D array as a single batch. Override to support batched mode.
+        :param x: 1D numpy ndarray
+        :return: Batch of all possible mutations
+        """
+        raise NotImplementedError
+
+    def _sample_batch(self, x: NDArray, count: int, rng: np.random.Generator) -> MutationBatch | None:
+        """
+        Uniformly samples mutations of 1D array without generation of all of them.
+        Override to let `SampledMutation` sample in time, which does not depend on the neighbourhood size.
+        :param x: 1D numpy ndarray
+        :param count: Maximal number of sampled mutations
+        :param rng: Generator of random numbers
+        :return: Batch of distinct sampled mutations in generation order or None, if sampling is not supported
+        """
+        return None
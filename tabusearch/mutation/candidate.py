@@ -0,0 +1,250 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Hashable
+
+import numpy as np
+from numpy.typing import NDArray
+
+from tabusearch.mutation.base import MutationBehaviour, MutationBatch
+from tabusearch.solution.base import Solution
+from tabusearch.typing_ import TData
+
+# Mutations of a pivot in either of the mutation behaviour output formats
+Mutations = MutationBatch | list[tuple[TData, str]]
+
+
+class CandidateListMutation(MutationBehaviour[TData], ABC):
+    """
+    Wraps a mutation behaviour and restricts its neighbourhood to a candidate list.
+    The wrapped mutation keeps its name and (batched or list-based) output format.
+    If the wrapped mutation supports batched mode, the full neighbourhood is generated as a `MutationBatch`
+    (index arrays only) and just the candidates are materialized.
+    Wrappers can be nested: the outer one chooses among the candidates of the inner one.
+    """
+    _mutation: MutationBehaviour[TData]
+
+    def __init__(self, mutation: MutationBehaviour[TData]):
+        super().__init__(mutation.mutation_type)
+        self._mutation = mutation
+        self._batched = mutation.batched
+
+    @property
+    def mutation(self) -> MutationBehaviour[TData]:
+        """
+        The wrapped mutation behaviour.
+        """
+        return self._mutation
+
+    def mutate(self, pivot: Solution) -> list[tuple[TData, str]] | MutationBatch:
+        restricted = self._restricted(pivot)
+        if isinstance(restricted, MutationBatch) and not self._batched:
+            return restricted.mutations()
+        return restricted
+
+    def _restricted(self, pivot: Solution) -> Mutations:
+        """
+        Candidate mutations (as a batch, if the wrapped mutation supports batched mode).
+        """
+        neighbourhood = self._neighbourhood(pivot)
+        candidates = self._candidates(pivot, neighbourhood)
+
+        if isinstance(neighbourhood, MutationBatch):
+            return neighbourhood.take(candidates)
+        return [neighbourhood[i] for i in _as_indices(candidates)]
+
+    def _neighbourhood(self, pivot: Solution) -> Mutations:
+        """
+        Neighbourhood, which the candidates are chosen from: the full neighbourhood of the wrapped mutation
+        or the candidates of the wrapped candidate list.
+        """
+        if isinstance(self._mutation, CandidateListMutation):
+            return self._mutation._restricted(pivot)
+        return self._generate_batch(pivot.position) if _supports_batch(self._mutation) \
+            else self._generate_mutations(pivot.position)
+
+    def _generate_mutations(self, x: TData) -> list[tuple[TData, str]]:
+        """
+        Full (not restricted) neighbourhood of the wrapped mutation.
+        """
+        return self._mutation._generate_mutations(x)
+
+    def _generate_batch(self, x: NDArray) -> MutationBatch:
+        """
+        Full (not restricted) neighbourhood of the wrapped mutation.
+        """
+        return self._mutation._generate_batch(x)
+
+    @abstractmethod
+    def _candidates(self, pivot: Solution, neighbourhood: Mutations) -> NDArray[int] | NDArray[bool]:
+        """
+        Chooses the candidate mutations.
+        :param pivot: Solution, which neighbourhood is generated.
+        :param neighbourhood: Full neighbourhood.
+        :return: Indices or boolean mask of the candidates (in generation order).
+        """
+        ...
+
+
+class SampledMutation(CandidateListMutation[TData]):
+    """
+    Uniformly samples at most `budget` mutations of the wrapped mutation behaviour (without replacement).
+    The sampled mutations keep their generation order.
+    Mutations, which support sampling (e.g. `Swap2Mutation` and `Swap3Mutation`), are sampled directly,
+    so the sampling time does not depend on the neighbourhood size. Others generate the full neighbourhood first.
+    """
+    def __init__(self, mutation: MutationBehaviour[TData], budget: int,
+                 seed: int | np.random.Generator | None = None):
+        """
+        Initializes SampledMutation.
+        :param mutation: Wrapped mutation behaviour.
+        :param budget: Maximal number of mutations per iteration.
+        :param seed: Seed or generator of random numbers.
+        """
+        if budget < 1:
+            raise ValueError(f'Budget should be positive. Was {budget}.')
+        super().__init__(mutation)
+        self._budget = budget
+        self._rng = np.random.default_rng(seed)
+
+    def _neighbourhood(self, pivot: Solution) -> Mutations:
+        if not isinstance(self._mutation, CandidateListMutation):
+            sampled = self._mutation._sample_batch(pivot.position, self._budget, self._rng)
+            if sampled is not None:
+                return sampled
+        return super()._neighbourhood(pivot)
+
+    def _candidates(self, pivot: Solution, neighbourhood: Mutations) -> NDArray[int]:
+        if len(neighbourhood) <= self._budget:
+            return np.arange(len(neighbourhood))
+        return np.sort(self._rng.choice(len(neighbourhood), self._budget, replace=False))
+
+
+class EliteCandidateMutation(CandidateListMutation[TData]):
+    """
+    Restricts the wrapped mutation behaviour to the elite candidate list -
+    `size` best mutations of the full neighbourhood, refreshed every `refresh_every` iterations.
+    Between refreshes, the mutations are identified by their move descriptors (batched) or names (list-based),
+    so e.g. the best `(i, j)` swaps are reapplied to the following pivots.
+    The list is also refreshed, when none of its mutations is applicable to the pivot.
+    """
+    def __init__(self, mutation: MutationBehaviour[TData],
+                 metric: Callable[[list[TData]], list],
+                 size: int, refresh_every: int = 10):
+        """
+        Initializes EliteCandidateMutation.
+        :param mutation: Wrapped mutation behaviour.
+        :param metric: Metric, which ranks the full neighbourhood on refresh
+          (the search metric, e.g. created with `custom_metric`). Delta and batch evaluation are used, if supported.
+        :param size: Size of the candidate list.
+        :param refresh_every: Number of iterations (`mutate` calls) between refreshes.
+        """
+        if size < 1 or refresh_every < 1:
+            raise ValueError(f'Size and refresh period should be positive. Were {size} and {refresh_every}.')
+        super().__init__(mutation)
+        self._metric = metric
+        self._size = size
+        self._refresh_every = refresh_every
+
+        self._iteration = 0
+        self._elite: NDArray | set[Hashable] | None = None
+
+    def _candidates(self, pivot: Solution, neighbourhood: Mutations) -> NDArray[int] | NDArray[bool]:
+        keys = _keys(neighbourhood)
+        refresh = self._elite is None or self._iteration % self._refresh_every == 0
+        self._iteration += 1
+
+        if not refresh:
+            candidates = np.isin(keys, self._elite) if isinstance(neighbourhood, MutationBatch) \
+                else np.fromiter((key in self._elite for key in keys), dtype=bool, count=len(keys))
+            if candidates.any():
+                return candidates
+
+        return self._refresh(pivot, neighbourhood, keys)
+
+    def _refresh(self, pivot: Solution, neighbourhood: Mutations, keys: NDArray | list) -> NDArray[int]:
+        if len(neighbourhood) <= self._size:
+            elite = np.arange(len(neighbourhood))
+        else:
+            scores = self._scores(pivot, neighbourhood)
+            elite = np.sort(np.argpartition(scores, -self._size)[-self._size:])
+
+        self._elite = keys[elite] if isinstance(neighbourhood, MutationBatch) else {keys[i] for i in elite}
+        return elite
+
+    def _scores(self, pivot: Solution, neighbourhood: Mutations) -> NDArray[float]:
+        """
+        Float representations of the neighbours qualities (greater is better).
+        """
+        if isinstance(neighbourhood, MutationBatch) and hasattr(self._metric, 'evaluate_delta'):
+            return self._metric.evaluate_delta(pivot.quality.value, neighbourhood.idx, neighbourhood.old,
+                                               neighbourhood.values).scores
+
+        positions = neighbourhood.positions if isinstance(neighbourhood, MutationBatch) \
+            else [position for position, *_ in neighbourhood]
+        if hasattr(self._metric, 'evaluate_batch'):
+            return self._metric.evaluate_batch(positions).scores
+        return np.fromiter(map(float, self._metric(positions)), dtype=np.float64, count=len(positions))
+
+
+class DontLookBitsMutation(CandidateListMutation[TData]):
+    """
+    "Don't look bits" restriction of the wrapped mutation behaviour.
+    Only mutations, changing recently improved elements, are generated - i.e. elements, changed by a move,
+    which improved the pivot during the last `window` iterations.
+    If there are no such elements (on start or stagnation), the full neighbourhood is generated.
+    """
+    def __init__(self, mutation: MutationBehaviour[TData], window: int = 1):
+        """
+        Initializes DontLookBitsMutation.
+        :param mutation: Wrapped mutation behaviour.
+        :param window: Number of iterations, an improved element is looked at.
+        """
+        if window < 1:
+            raise ValueError(f'Window should be positive. Was {window}.')
+        super().__init__(mutation)
+        self._window = window
+
+        self._iteration = 0
+        self._previous: Solution | None = None
+        self._look_until: NDArray[int] | None = None
+
+    def _candidates(self, pivot: Solution, neighbourhood: Mutations) -> NDArray[bool]:
+        self._update_bits(pivot)
+        look = self._look_until > self._iteration
+        self._iteration += 1
+
+        if not look.any():
+            return np.ones(len(neighbourhood), dtype=bool)
+        if isinstance(neighbourhood, MutationBatch):
+            return look[neighbourhood.idx].any(axis=1)
+        return np.fromiter(((look & (position != pivot.position)).any() for position, *_ in neighbourhood),
+                           dtype=bool, count=len(neighbourhood))
+
+    def _update_bits(self, pivot: Solution):
+        previous, self._previous = self._previous, pivot
+        if previous is None or len(previous.position) != len(pivot.position):
+            self._look_until = np.zeros(len(pivot.position), dtype=int)
+            return
+
+        if pivot.quality > previous.quality:
+            self._look_until[previous.position != pivot.position] = self._iteration + self._window
+
+
+def _supports_batch(mutation: MutationBehaviour) -> bool:
+    if isinstance(mutation, CandidateListMutation):
+        return _supports_batch(mutation.mutation)
+    return type(mutation)._generate_batch is not MutationBehaviour._generate_batch
+
+
+def _as_indices(candidates: NDArray[int] | NDArray[bool]) -> NDArray[int]:
+    return np.flatnonzero(candidates) if candidates.dtype == bool else candidates
+
+
+def _keys(neighbourhood: Mutations) -> NDArray | list[tuple[str, ...]]:
+    """
+    Identifiers of the mutations, comparable between pivots:
+    move descriptors rows (viewed as scalars) for batches and names for list-based mutations.
+    """
+    if isinstance(neighbourhood, MutationBatch):
+        descriptors = np.ascontiguousarray(neighbourhood.descriptors)
+        return descriptors.view(np.dtype((np.void, descriptors.dtype.itemsize * descriptors.shape[1]))).ravel()
+    return [tuple(suffix) for _, *suffix in neighbourhood]
@@ -3,9 +3,12 @@ from enum import IntEnum
 from functools import partialmethod
 from typing import Callable, Generic
 
+import numpy as np
+from numpy.typing import NDArray
+
 from tabusearch.mutation.base import MutationBehaviour
 from tabusearch.utils.decorators import return_self_method
-from typing_ import TData
+from tabusearch.typing_ import TData
 
 
 class MutationDirection(IntEnum):
@@ -59,14 +62,25 @@ class BidirectionalMutationBehaviour(MutationBehaviour[TData], ABC, Generic[TDat
     to_bidirectional = partialmethod(direction.fset, MutationDirection.Bidirectional)
     def reverse_direction(self): self._direction = self._direction.reversed()
 
+    @property
+    def _direction_signs(self) -> NDArray[int]:
+        """
+        Signs of the enabled directions in order of generation (negative first).
+        """
+        return np.array([sign for sign, enabled in ((-1, self._direction.is_negative),
+                                                    (1, self._direction.is_positive))
+                         if enabled])
+
     def __init__(self, mutation_type: str,
-                 mutation_direction: MutationDirection | None = None):
+                 mutation_direction: MutationDirection | None = None,
+                 batched: bool = False):
         """
         Initializes BidirectionalMutationBehaviour.
         :param mutation_type: Name of mutation
         :param mutation_direction: Direction of mutation. MutationDirection.Positive by default
+        :param batched: Whether to generate mutations as a single `MutationBatch`
         """
-        super().__init__(mutation_type)
+        super().__init__(mutation_type, batched)
         if mutation_direction:
             self._direction = mutation_direction
 
@@ -1,13 +1,17 @@
 from functools import partial
 from operator import add
 
+import numpy as np
 from numpy.typing import NDArray
 
+from tabusearch.mutation.base import MutationBatch
 from tabusearch.mutation.directed import BidirectionalMutationBehaviour
 
 # TODO: consider moving from classes to functions, passed to superclass ctor
 #  (as these classes implement only one function)
 
+SIGN_MARKS = {-1: '-', 1: '+'}
+
 
 class NearestNeighboursMutation(BidirectionalMutationBehaviour[NDArray]):
     """
@@ -15,9 +19,11 @@ class NearestNeighboursMutation(BidirectionalMutationBehaviour[NDArray]):
     ```
     [0,0,0] -> [1,0,0], [0,1,0], [0,0,1] and/or [-1,0,0], [0,-1,0], [0,0,-1]
     ```
+    In batched mode, all the neighbours are emitted as the pivot broadcast plus/minus identity matrix
+    with `(sign, index)` move descriptors.
     """
-    def __init__(self):
-        super().__init__('NN')
+    def __init__(self, batched: bool = False):
+        super().__init__('NN', batched=batched)
 
     def _generate_one_direction_mutations(self, x: NDArray, negative: bool) -> list[tuple[NDArray, str, str]]:
         inc = partial(add, 1)
@@ -32,6 +38,11 @@ class NearestNeighboursMutation(BidirectionalMutationBehaviour[NDArray]):
             r.append((x_, mark, str(i)))
         return r
 
+    def _generate_batch(self, x: NDArray) -> MutationBatch:
+        signs = np.repeat(self._direction_signs, len(x))
+        idx = np.tile(np.arange(len(x)), len(self._direction_signs))[:, np.newaxis]
+        return MutationBatch(x, idx, x[idx] + signs[:, np.newaxis], np.column_stack((signs, idx)), SIGN_MARKS)
+
 
 class FullAxisShiftMutation(BidirectionalMutationBehaviour[NDArray]):
     """
@@ -39,9 +50,10 @@ class FullAxisShiftMutation(BidirectionalMutationBehaviour[NDArray]):
     ```
     [0,0,0] -> [1,1,1] and/or [-1,-1,-1]
     ```
+    In batched mode, the shifted positions are emitted as a single batch with `(sign,)` move descriptors.
     """
-    def __init__(self):
-        super().__init__('FullShift')
+    def __init__(self, batched: bool = False):
+        super().__init__('FullShift', batched=batched)
 
     def _generate_one_direction_mutation(self, x: NDArray, negative: bool) -> tuple[NDArray, str]:
         inc = partial(add, 1)
@@ -49,6 +61,11 @@ class FullAxisShiftMutation(BidirectionalMutationBehaviour[NDArray]):
 
         return (dec(x), '-') if negative else (inc(x), '+')
 
+    def _generate_batch(self, x: NDArray) -> MutationBatch:
+        signs = self._direction_signs[:, np.newaxis]
+        idx = np.broadcast_to(np.arange(len(x)), (len(signs), len(x)))
+        return MutationBatch(x, idx, x[np.newaxis] + signs, signs, SIGN_MARKS)
+
 # TODO: implement PivotOppositeShiftMutation,
 #  when all elements before some index are shifted one side,
 #  and all elements after shifted opposite side.
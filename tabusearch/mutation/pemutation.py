@@ -1,32 +1,111 @@
+from math import ceil, comb
+
+import numpy as np
 from numpy.typing import NDArray
 
-from tabusearch.mutation.base import MutationBehaviour
+from tabusearch.mutation.base import MutationBehaviour, MutationBatch
 from tabusearch.mutation.directed import BidirectionalMutationBehaviour
 
 # TODO: consider moving from classes to functions, passed to superclass ctor
 #  (as these classes implement only one function). Think twice on Swap3Mutation
 
 
+ROTATION_MARKS = {-1: 'l', 1: 'r'}
+# Columns of a triple, which values are put to the triple positions on left (-1) / right (1) rotation
+_ROTATIONS = {-1: [1, 2, 0], 1: [2, 0, 1]}
+# Rounds of rejection sampling of swapped indices, before falling back to enumeration of all of them
+_SAMPLING_ROUNDS = 8
+
+
+def swap2_indices(x: NDArray) -> NDArray[int]:
+    """
+    Finds all pairs of positions, whose (non-equal) elements can be swapped.
+    :param x: 1D numpy ndarray
+    :return: (k, 2) array of `(i, j)` index pairs, `i < j`, ordered lexicographically
+    """
+    i, j = np.triu_indices(len(x), 1)
+    non_equal = x[i] != x[j]
+    return np.column_stack((i[non_equal], j[non_equal]))
+
+
+def swap3_indices(x: NDArray) -> NDArray[int]:
+    """
+    Finds all triplets of positions without equal elements.
+    :param x: 1D numpy ndarray
+    :return: (k, 3) array of `(i, j, k)` index triplets, `i < j < k`, ordered lexicographically
+    """
+    n = len(x)
+    if n < 3:
+        return np.empty((0, 3), dtype=int)
+
+    # Pairs (j, k) are ordered by j, so the pairs with `j > i` form the tail of the pairs array
+    j, k = np.triu_indices(n, 1)
+    first = np.arange(n - 2)
+    tails_starts = (first + 1) * n - (first + 1) * (first + 2) // 2
+    tails_lengths = len(j) - tails_starts
+    i = np.repeat(first, tails_lengths)
+    pairs = np.arange(len(i)) - np.repeat(np.cumsum(tails_lengths) - tails_lengths - tails_starts, tails_lengths)
+    j, k = j[pairs], k[pairs]
+
+    xi, xj, xk = x[i], x[j], x[k]
+    non_equal = (xi != xj) & (xj != xk) & (xk != xi)
+    return np.column_stack((i[non_equal], j[non_equal], k[non_equal]))
+
+
+def sample_swap_indices(x: NDArray, size: int, count: int, rng: np.random.Generator) -> NDArray[int]:
+    """
+    Uniformly samples distinct index tuples of `swap2_indices` (size 2) or `swap3_indices` (size 3)
+    by rejection of random tuples with equal indices or elements, so the cost depends on `count`, not on `len(x)`.
+    Small neighbourhoods (and ones with too many equal elements) are enumerated.
+    :param x: 1D numpy ndarray
+    :param size: Size of the tuples
+    :param count: Maximal number of sampled tuples
+    :param rng: Generator of random numbers
+    :return: (k, size) array of index tuples, `k <= count`, ordered lexicographically
+    """
+    n = len(x)
+    if comb(n, size) > 4 * count:
+        columns = np.triu_indices(size, 1)
+        sampled = np.empty((0, size), dtype=int)
+        for _ in range(_SAMPLING_ROUNDS):
+            draws = np.sort(rng.integers(n, size=(2 * count, size)), axis=1)
+            values = x[draws]
+            valid = (values[:, columns[0]] != values[:, columns[1]]).all(axis=1) \
+                & (np.diff(draws, axis=1) > 0).all(axis=1)
+            sampled = np.unique(np.concatenate((sampled, draws[valid])), axis=0)
+            if len(sampled) >= count:
+                return _choice(sampled, count, rng)
+
+    return _choice(swap2_indices(x) if size == 2 else swap3_indices(x), count, rng)
+
+
+def _choice(indices: NDArray[int], count: int, rng: np.random.Generator) -> NDArray[int]:
+    if len(indices) <= count:
+        return indices
+    return indices[np.sort(rng.choice(len(indices), count, replace=False))]
+
+
 class Swap2Mutation(MutationBehaviour[NDArray]):
     """
     Implements mutation behaviour, in which all pairs of (non-equal) elements are permuted in different solutions.
+    In batched mode, the mutations are described by `(i, j)` index pairs.
     """
-    def __init__(self):
-        super().__init__('Swap2')
+    def __init__(self, batched: bool = False):
+        super().__init__('Swap2', batched)
 
     def _generate_mutations(self, x: NDArray) -> list[tuple[NDArray, str]]:
-        r = []
-        for i in range(len(x) - 1):
-            for j in range(i + 1, len(x)):
-                if x[i] == x[j]:
-                    continue
+        # noinspection PyTypeChecker
+        return self._generate_batch(x).mutations()
 
-                _x = x.copy()
-                _x[[i, j]] = _x[[j, i]]
-                r.append((_x, str(i), str(j)))
+    def _generate_batch(self, x: NDArray) -> MutationBatch:
+        return self._batch(x, swap2_indices(x))
 
-        # noinspection PyTypeChecker
-        return r
+    def _sample_batch(self, x: NDArray, count: int, rng: np.random.Generator) -> MutationBatch:
+        return self._batch(x, sample_swap_indices(x, 2, count, rng))
+
+    @staticmethod
+    def _batch(x: NDArray, idx: NDArray[int]) -> MutationBatch:
+        return MutationBatch(x, idx, x[idx[:, ::-1]], idx)
 
 
 class Swap3Mutation(BidirectionalMutationBehaviour[NDArray]):
@@ -34,42 +113,37 @@ class Swap3Mutation(BidirectionalMutationBehaviour[NDArray]):
     Implements mutation behaviour, in which all triplets (without equal elements)
     can be permuted in all two possible ways:
     ```([1,2,3] -> [2,3,1] and/or [3,1,2])``` in different solutions.
+    In batched mode, the mutations are described by `(rotation, i, j, k)`, where rotation is -1 (left) or 1 (right).
+    The neighbourhood size is O(n^3): about 20k neighbours for n = 40, 8.9M for n = 300.
+    In batched mode with columnar and delta evaluation (`batch_delta`), positions of the neighbours
+    are not materialized, so a neighbour costs about half a kilobyte (its id, move arrays and quality) regardless of n.
+    It is still too much for hundreds of elements, so restrict long neighbourhoods with candidate lists:
+    `SampledMutation` samples the triplets directly, so its cost does not depend on n.
     """
-    def __init__(self):
-        super().__init__('Swap3Single')
+    def __init__(self, batched: bool = False):
+        super().__init__('Swap3Single', batched=batched)
 
     # Override default logics to reduce cycle initializations
     def _generate_mutations(self, x: NDArray) -> list[tuple[NDArray, str]]:
-        r = []
-        for i in range(len(x) - 2):
-            for j in range(i + 1, len(x) - 1):
-                for k in range(j + 1, len(x)):
-                    xi, xj, xk = x[[i, j, k]]
-                    if xi != xj != xk != xi:
-                        self._add_permute(r, x, [i, j, k], [xi, xj, xk])
-
-        return r
-
-    def _add_permute(self, container, x, idx, values):
-        if self.direction.is_negative:
-            container.append(self._generate_one_permute(x, idx, values, True))
-        if self.direction.is_positive:
-            container.append(self._generate_one_permute(x, idx, values, False))
-
-    def _generate_one_permute(self, x, idx, values, negative: bool) -> tuple[NDArray, str]:
-        values = self._rotate(values, negative)
-        x = x.copy()
-        x[idx] = values
-        n = 'l' if negative else 'r'
         # noinspection PyTypeChecker
-        return x, n, *list(map(str, idx))
+        return self._generate_batch(x).mutations()
 
-    @staticmethod
-    def _rotate(lst: list, direction_left: bool):
-        if direction_left:
-            return lst[1:] + [lst[0]]
-        else:
-            return [lst[-1]] + lst[:-1]
+    def _generate_batch(self, x: NDArray) -> MutationBatch:
+        return self._batch(x, swap3_indices(x))
+
+    def _sample_batch(self, x: NDArray, count: int, rng: np.random.Generator) -> MutationBatch:
+        # both rotations of the sampled triplets are sampled, then the extra ones are dropped
+        batch = self._batch(x, sample_swap_indices(x, 3, ceil(count / len(self._direction_signs)), rng))
+        return batch.take(_choice(np.arange(len(batch)), count, rng))
+
+    def _batch(self, x: NDArray, triples: NDArray[int]) -> MutationBatch:
+        signs = self._direction_signs
+        rotations = np.array([_ROTATIONS[sign] for sign in signs.tolist()], dtype=int)
+        # Both rotations of a triplet go one after another, left first
+        idx = np.repeat(triples, len(signs), axis=0)
+        signs = np.tile(signs, len(triples))
+        values = x[np.take_along_axis(idx, np.tile(rotations, (len(triples), 1)), axis=1)]
+        return MutationBatch(x, idx, values, np.column_stack((signs, idx)), ROTATION_MARKS)
 
 # TODO: implement Reposition1Mutation
 #  [1,2,3,4,5,6,7,8,9,0] -> Reposition1Mutation(5, 2) -> [0,1,6,3,4,5,7,8,9,0]
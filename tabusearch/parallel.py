@@ -0,0 +1,338 @@
+import multiprocessing
+import queue
+import random
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from copy import copy
+from itertools import repeat
+from operator import attrgetter
+from os import cpu_count
+from typing import Callable, Generic, Literal, NamedTuple, Sequence
+
+import numpy as np
+
+from tabusearch.history import HistoryRecorder
+from tabusearch.solution.base import Solution
+from tabusearch.solution.quality.cache import position_key
+from tabusearch.tabu_search import TabuSearch
+from tabusearch.typing_ import TData
+
+
+class RunResult(NamedTuple):
+    """
+    Result of a single tabu search run.
+    """
+    best: Solution
+    # History recorder of the run (by default, chosen solutions of every iteration, starting with the initial solution)
+    history: HistoryRecorder
+    seed: int
+
+
+class ParallelTabuSearch(Generic[TData]):
+    """
+    Multi-start runner, which optimizes from several initial solutions with independent `TabuSearch` instances
+    in a pool of workers and returns the global best.
+    Every run creates its own search with `search_factory`, so in process mode the factory
+    (not the search with its metric closures) should be picklable, e.g., a module-level function or its `partial`.
+    Usage:
+    ```
+    def create_search() -> TabuSearch:
+        return TabuSearch(NearestNeighboursMutation(), custom_metric('f', f, minimized=True))
+
+    best = ParallelTabuSearch(create_search).optimize([x0, x1, x2])
+    ```
+    """
+    results: list[RunResult]
+
+    def __init__(self, search_factory: Callable[[], TabuSearch[TData]],
+                 executor: Literal['process', 'thread'] = 'process',
+                 max_workers: int | None = None):
+        """
+        Initializes multi-start runner.
+        :param search_factory: Function without arguments, which creates `TabuSearch` for a run.
+        :param executor: Whether to run searches in processes or in threads.
+        :param max_workers: Number of workers. Defaults to the number of CPUs.
+        """
+        if executor not in ('process', 'thread'):
+            raise ValueError(f'Argument executor should be "process" or "thread". Was "{executor}".')
+
+        self._search_factory = search_factory
+        self._use_processes = executor == 'process'
+        self._max_workers = max_workers or cpu_count() or 1
+        self.results = []
+
+    def optimize(self, x0: Sequence[TData] | Callable[[np.random.Generator], TData],
+                 n_runs: int | None = None, seed: int | None = None) -> Solution[TData]:
+        """
+        Runs the searches and selects the best found solution.
+        :param x0: Initial solutions of the runs or function, which generates initial solution from random generator
+          (it is called in the worker and should be picklable in process mode).
+        :param n_runs: Number of runs. Required, if `x0` is a function, otherwise, should be equal to number
+          of solutions (defaults to it).
+        :param seed: Seed of the runs. Every run gets its own seed, spawned from it,
+          which seeds the generator, passed to `x0`, and in process mode `random` and `numpy.random` of the worker.
+          The global generators are shared by threads, so in thread mode the runs are reproducible
+          only if the searches do not use them (e.g. seed their random components explicitly).
+        :return: The best solution among the runs. Results of every run are kept in `results`.
+        """
+        if callable(x0):
+            if n_runs is None:
+                raise ValueError('Argument n_runs should be passed, if x0 is a function.')
+            initial = repeat(x0, n_runs)
+        else:
+            if n_runs is not None and n_runs != len(x0):
+                raise ValueError(f'Argument n_runs should be equal to number of initial solutions {len(x0)}.'
+                                 f' Was {n_runs}.')
+            n_runs = len(x0)
+            initial = x0
+
+        seeds = [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(seed).spawn(n_runs)]
+        self.results = self._run_all(list(initial), seeds)
+        return self.best
+
+    def _run_all(self, initial: list[TData | Callable[[np.random.Generator], TData]],
+                 seeds: list[int]) -> list[RunResult]:
+        """
+        Runs the searches.
+        :param initial: Initial solutions (or their generators) of the runs.
+        :param seeds: Seeds of the runs.
+        :return: Results of the runs in the same order.
+        """
+        executor_type = ProcessPoolExecutor if self._use_processes else ThreadPoolExecutor
+        with executor_type(min(self._max_workers, len(seeds)) or 1) as executor:
+            return list(executor.map(_run, repeat(self._search_factory), initial, seeds, repeat(self._use_processes)))
+
+    @property
+    def best(self) -> Solution[TData] | None:
+        """
+        The best solution among the runs (the first of equal ones).
+        """
+        return max(self.results, key=attrgetter('best.quality')).best if self.results else None
+
+    @property
+    def histories(self) -> list[HistoryRecorder]:
+        """
+        History recorders of every run.
+        """
+        return [result.history for result in self.results]
+
+
+class CooperativeTabuSearch(ParallelTabuSearch[TData]):
+    """
+    Cooperative multi-start runner: the searches run concurrently (one worker per run)
+    and every `exchange_interval` iterations send their `n_elites` best solutions (from `hall_of_fame`)
+    to other searches through queues:
+      - 'ring' topology: to the next search;
+      - 'broadcast' topology: to all the other searches.
+    Received elites are added to the hall of fame of the search. Besides, the search can adopt one of them
+    as its current solution (memorized as a move):
+      - 'best': restarts from the best received elite, if it is better than the current solution;
+      - 'random': restarts from a random received elite (diversification);
+      - 'none': only keeps the elites in the hall of fame.
+    The exchange is asynchronous, so the searches never wait for each other and converge independently.
+    If a search fails, the other ones are stopped and its error is raised.
+    """
+    # Interval in seconds, with which the runner checks, that the workers without results are alive
+    _poll_interval = 0.5
+
+    def __init__(self, search_factory: Callable[[], TabuSearch[TData]],
+                 executor: Literal['process', 'thread'] = 'process',
+                 exchange_interval: int = 10,
+                 topology: Literal['ring', 'broadcast'] = 'ring',
+                 n_elites: int = 1,
+                 adopt: Literal['best', 'random', 'none'] = 'best',
+                 max_workers: int | None = None):
+        """
+        Initializes cooperative multi-start runner.
+        :param search_factory: Function without arguments, which creates `TabuSearch` for a run.
+        :param executor: Whether to run searches in processes or in threads.
+        :param exchange_interval: Number of iterations between exchanges.
+        :param topology: Which searches the elites are sent to.
+        :param n_elites: Number of the best solutions, sent on exchange.
+        :param adopt: How the search uses the received elites.
+        :param max_workers: Maximal number of workers. The searches should run concurrently,
+          so a larger number of runs is rejected. Unbounded, if None.
+        """
+        if topology not in ('ring', 'broadcast'):
+            raise ValueError(f'Argument topology should be "ring" or "broadcast". Was "{topology}".')
+        if adopt not in ('best', 'random', 'none'):
+            raise ValueError(f'Argument adopt should be "best", "random" or "none". Was "{adopt}".')
+        if exchange_interval < 1 or n_elites < 1:
+            raise ValueError('Exchange interval and number of elites should be positive.'
+                             f' Were {exchange_interval} and {n_elites}.')
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f'Argument max_workers should be positive. Was {max_workers}.')
+
+        super().__init__(search_factory, executor)
+        self._max_workers = max_workers
+        self._exchange_interval = exchange_interval
+        self._topology = topology
+        self._n_elites = n_elites
+        self._adopt = adopt
+
+    def _run_all(self, initial: list[TData | Callable[[np.random.Generator], TData]],
+                 seeds: list[int]) -> list[RunResult]:
+        n_runs = len(seeds)
+        if self._max_workers is not None and n_runs > self._max_workers:
+            raise ValueError(f'Cooperative searches run concurrently, so number of runs should not exceed'
+                             f' max_workers {self._max_workers}. Was {n_runs}.')
+
+        context = multiprocessing.get_context() if self._use_processes else None
+        inboxes = [context.Queue() if context else queue.SimpleQueue() for _ in range(n_runs)]
+        results = context.Queue() if context else queue.SimpleQueue()
+        stop = context.Event() if context else threading.Event()
+
+        workers = [(context.Process if context else threading.Thread)(
+                        target=_cooperate,
+                        args=(i, self._search_factory, x0, seed, self._use_processes,
+                              _Exchange(inboxes, self._targets(i, n_runs), self._exchange_interval,
+                                        self._n_elites, self._adopt, stop),
+                              results))
+                   for i, (x0, seed) in enumerate(zip(initial, seeds))]
+
+        ordered: list[RunResult | None] = [None] * n_runs
+        try:
+            for worker in workers:
+                worker.start()
+
+            pending = set(range(n_runs))
+            while pending:
+                # a worker puts its result before exit, so a dead worker without result in the empty queue has crashed
+                dead = [i for i in pending if not workers[i].is_alive()]
+                try:
+                    i, result = results.get(timeout=self._poll_interval)
+                except queue.Empty:
+                    if dead:
+                        exitcode = getattr(workers[dead[0]], 'exitcode', None)
+                        raise RuntimeError(f'Search {dead[0]} exited without result (exit code {exitcode}).')
+                    continue
+                if isinstance(result, BaseException):
+                    raise result
+                ordered[i] = result
+                pending.discard(i)
+        finally:
+            stop.set()
+            for worker in workers:
+                if worker.is_alive() and context:
+                    worker.terminate()
+                if worker.ident is not None:
+                    worker.join()
+        return ordered
+
+    def _targets(self, i: int, n_runs: int) -> list[int]:
+        if n_runs == 1:
+            return []
+        return [(i + 1) % n_runs] if self._topology == 'ring' else [j for j in range(n_runs) if j != i]
+
+
+class _Exchange(NamedTuple):
+    """
+    Exchange settings of a cooperative search.
+    """
+    inboxes: list
+    targets: list[int]
+    interval: int
+    n_elites: int
+    adopt: str
+    # Event, which stops the search at the next iteration (when other searches failed)
+    stop: object = None
+
+
+def _cooperate(index: int, search_factory: Callable[[], TabuSearch[TData]],
+               x0: TData | Callable[[np.random.Generator], TData], seed: int, seed_globals: bool,
+               exchange: _Exchange, results):
+    try:
+        results.put((index, _run_cooperatively(index, search_factory, x0, seed, exchange, seed_globals)))
+    except BaseException as e:
+        results.put((index, e))
+
+
+def _run_cooperatively(index: int, search_factory: Callable[[], TabuSearch[TData]],
+                       x0: TData | Callable[[np.random.Generator], TData], seed: int,
+                       exchange: _Exchange, seed_globals: bool = True) -> RunResult:
+    for inbox in exchange.inboxes:
+        if hasattr(inbox, 'cancel_join_thread'):
+            # elites, sent to the finished searches, are never read, and should not block the process exit
+            inbox.cancel_join_thread()
+
+    x0 = _seed(x0, seed, seed_globals)
+    rng = np.random.default_rng(seed)
+
+    search = search_factory()
+    steps = search.iterate(x0)
+    x = next(steps)
+    iteration = 0
+    try:
+        while True:
+            iteration += 1
+            if exchange.stop is not None and exchange.stop.is_set():
+                break
+            restart = None
+            if iteration % exchange.interval == 0:
+                elites = list(search.hall_of_fame)[-exchange.n_elites:]
+                if elites:
+                    for target in exchange.targets:
+                        exchange.inboxes[target].put(elites)
+                restart = _adopt(search, x, _receive(exchange.inboxes[index]), exchange.adopt, rng)
+            x = steps.send(restart)
+    except StopIteration:
+        pass
+
+    return RunResult(search.hall_of_fame[-1], search.history, seed)
+
+
+def _receive(inbox) -> list[Solution]:
+    received = []
+    while not inbox.empty():
+        try:
+            received.extend(inbox.get_nowait())
+        except queue.Empty:
+            break
+    return received
+
+
+def _adopt(search: TabuSearch[TData], x: Solution[TData], elites: list[Solution[TData]], adopt: str,
+           rng: np.random.Generator) -> Solution[TData] | None:
+    """
+    Adds received elites to the hall of fame of the search and chooses the one to restart from.
+    """
+    known = {position_key(s.position) for s in search.hall_of_fame}
+    new_elites = []
+    for elite in elites:
+        key = position_key(elite.position)
+        if key not in known:
+            known.add(key)
+            new_elites.append(elite)
+
+    adopted = None
+    if new_elites and adopt == 'random':
+        adopted = new_elites[rng.integers(len(new_elites))]
+    elif new_elites and adopt == 'best':
+        best = max(new_elites, key=attrgetter('quality'))
+        adopted = best if best.quality > x.quality else None
+
+    for elite in new_elites:
+        # the adopted elite gets to the hall of fame as a memorized move
+        if elite is not adopted:
+            search.add_to_hall_of_fame(elite)
+    return copy(adopted) if adopted is not None else None
+
+
+def _run(search_factory: Callable[[], TabuSearch[TData]],
+         x0: TData | Callable[[np.random.Generator], TData], seed: int, seed_globals: bool = True) -> RunResult:
+    x0 = _seed(x0, seed, seed_globals)
+
+    search = search_factory()
+    best = search.optimize(x0)
+    return RunResult(best, search.history, seed)
+
+
+def _seed(x0: TData | Callable[[np.random.Generator], TData], seed: int, seed_globals: bool) -> TData:
+    """
+    Seeds the run and generates its initial solution, if `x0` is a function.
+    The global generators are process-wide, so they are seeded only if the run has its own process.
+    """
+    if seed_globals:
+        random.seed(seed)
+        np.random.seed(seed)
+    return x0(np.random.default_rng(seed)) if callable(x0) else x0
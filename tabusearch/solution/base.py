@@ -3,6 +3,7 @@ from typing import Generic
 from dataclasses import dataclass
 
 from tabusearch.solution.id import SolutionId
+from tabusearch.solution.move import Move
 from tabusearch.solution.quality.base import BaseSolutionQualityInfo
 from tabusearch.typing_ import TData
 
@@ -12,6 +13,8 @@ class Solution(Generic[TData]):
     id: SolutionId
     position: TData
     quality: BaseSolutionQualityInfo
+    # Move from the mutated solution. Known for batched mutations only
+    move: Move | None = None
 
     def __repr__(self):
         return f'{{{self.id}}}:{self.quality}: {self.position}'
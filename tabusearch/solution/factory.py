@@ -1,10 +1,17 @@
-from itertools import chain
-from typing import Callable, Iterable, Generic
+from itertools import chain, islice
+from typing import Callable, Iterable, Iterator, Generic, Sequence
 
+import numpy as np
+
+from tabusearch.mutation.base import MutationBatch
 from tabusearch.solution.base import Solution
 from tabusearch.solution.id import SolutionId
+from tabusearch.solution.move import Move
+from tabusearch.solution.neighbourhood import LazyColumn, Neighbourhood
 from tabusearch.solution.quality.aggregated import BaseAggregatedSolutionQualityInfo
 from tabusearch.solution.quality.base import BaseSolutionQualityInfo
+from tabusearch.solution.quality.batch import QualityBatch
+from tabusearch.solution.quality.cache import QualityCache
 from tabusearch.solution.quality.factory import SolutionQualityFactory
 from tabusearch.typing_ import TData
 
@@ -18,22 +25,239 @@ class SolutionFactory(Generic[TData]):
                  metrics_aggregation: Callable[[Iterable[Iterable[BaseSolutionQualityInfo]]],
                                                Iterable[BaseAggregatedSolutionQualityInfo]]
                                       | None = None,
-                 use_simple_ids: bool = False):
+                 use_simple_ids: bool = False,
+                 cache: QualityCache | None = None):
         self.quality_factory = SolutionQualityFactory(*metrics,
-                                                      metrics_aggregation=metrics_aggregation)
+                                                      metrics_aggregation=metrics_aggregation,
+                                                      cache=cache)
         self._use_simple_ids = use_simple_ids
 
-    def __call__(self, generated: list[tuple[str, list[tuple[TData, str]]]]) -> list[Solution[TData]]:
-        solutions: list[tuple[SolutionId, TData]] = list(chain(*[[(self._id_factory(generator_name, *name_suffix), position)
-                                                                  for position, *name_suffix in solutions]
-                                                                 for generator_name, solutions in generated]))
+    def __call__(self, generated: list[tuple[str, list[tuple[TData, str]] | MutationBatch]],
+                 pivot: Solution[TData] | None = None) -> list[Solution[TData]]:
+        """
+        Creates solutions from generated mutations.
+        :param generated: Mutations (either list or `MutationBatch`) along with names of their generators.
+        :param pivot: The mutated solution. If passed and the metric supports delta evaluation,
+          batched mutations are evaluated incrementally, other mutations - fully.
+        :return: Solutions in order of the mutations.
+        """
+        ids, parts = self._collect(generated)
+        positions = self._solutions_positions(parts, pivot)
+
+        qualities = self._evaluate(parts, positions, pivot)
+        return [Solution(solution_id, position, quality, move)
+                for solution_id, position, quality, move in zip(ids, positions, qualities, self._moves(parts))]
+
+    def neighbourhood(self, generated: list[tuple[str, list[tuple[TData, str]] | MutationBatch]],
+                      pivot: Solution[TData] | None = None) -> Neighbourhood[TData]:
+        """
+        Like `__call__`, but creates columnar `Neighbourhood` with `QualityBatch`, not materializing solutions.
+        Metrics should produce float-ordered qualities.
+        Positions and moves of delta evaluated batches are not materialized (see `LazyColumn`).
+        """
+        ids, parts = self._collect(generated)
+        positions = self._positions(parts, pivot)
+
+        qualities = self._evaluate_batch(parts, positions, pivot)
+        return Neighbourhood(ids, positions, self._moves(parts), qualities)
+
+    def stream(self, generated: Iterable[tuple[str, list[tuple[TData, str]] | MutationBatch]],
+               chunk_size: int, pivot: Solution[TData] | None = None) -> Iterator[Neighbourhood[TData]]:
+        """
+        Like `neighbourhood`, but lazily evaluates the mutations in chunks of at most `chunk_size` neighbours.
+        Positions of batched mutations are materialized per chunk only, so the memory is bounded by the chunk size
+        only for batched mutation behaviours: list-based ones build positions of all their neighbours before chunking.
+        :param generated: Mutations along with names of their generators. Can be lazy.
+        :param chunk_size: Maximal number of neighbours in a chunk.
+        :param pivot: The mutated solution (for delta evaluation).
+        :return: Columnar neighbourhoods of the chunks in order of the mutations.
+        """
+        assert chunk_size > 0, f'chunk_size should be positive, was {chunk_size}.'
+
+        for generator_name, mutations in generated:
+            for start in range(0, len(mutations), chunk_size):
+                chunk = mutations.take(slice(start, start + chunk_size)) \
+                    if isinstance(mutations, MutationBatch) \
+                    else mutations[start:start + chunk_size]
+                yield self.neighbourhood([(generator_name, chunk)], pivot=pivot)
+
+    async def call_async(self, generated: list[tuple[str, list[tuple[TData, str]] | MutationBatch]],
+                         pivot: Solution[TData] | None = None) -> list[Solution[TData]]:
+        """
+        Like `__call__`, but supports async metrics, evaluating the neighbours concurrently
+        (see `SolutionQualityFactory.evaluate_async`).
+        """
+        ids, parts = self._collect(generated)
+        positions = self._solutions_positions(parts, pivot)
 
-        qualities = self.quality_factory([position for _, position in solutions])
-        return [Solution(solution_id, position, quality)
-                for (solution_id, position), quality in zip(solutions, qualities)]
+        qualities = await self._evaluate_async(parts, positions, pivot)
+        return [Solution(solution_id, position, quality, move)
+                for solution_id, position, quality, move in zip(ids, positions, qualities, self._moves(parts))]
+
+    async def neighbourhood_async(self, generated: list[tuple[str, list[tuple[TData, str]] | MutationBatch]],
+                                  pivot: Solution[TData] | None = None) -> Neighbourhood[TData]:
+        """
+        Like `neighbourhood`, but supports async metrics (see `call_async`).
+        """
+        ids, parts = self._collect(generated)
+        positions = self._positions(parts, pivot)
+
+        qualities = await self._evaluate_batch_async(parts, positions, pivot)
+        return Neighbourhood(ids, positions, self._moves(parts), qualities)
 
     def initial(self, position: TData) -> Solution[TData]:
         return Solution(SolutionId('Init'), position, self.quality_factory.single(position))
 
-    def _id_factory(self, generator_name: str, *solution_suffix: str):
-        return SolutionId(generator_name) if self._use_simple_ids else SolutionId(generator_name, *solution_suffix)
+    async def initial_async(self, position: TData) -> Solution[TData]:
+        return Solution(SolutionId('Init'), position, await self.quality_factory.single_async(position))
+
+    def _collect(self, generated: list[tuple[str, list[tuple[TData, str]] | MutationBatch]]) \
+            -> tuple[list[SolutionId], list[list[TData] | MutationBatch]]:
+        """
+        Collects ids, along with positions (or the batch) of every generator.
+        """
+        ids: list[SolutionId] = []
+        parts: list[list[TData] | MutationBatch] = []
+        for generator_name, mutations in generated:
+            if isinstance(mutations, MutationBatch):
+                ids.extend(self._id_factory(generator_name, *descriptor, marks=mutations.marks)
+                           for descriptor in mutations.descriptors.tolist())
+                parts.append(mutations)
+            else:
+                ids.extend(self._id_factory(generator_name, *name_suffix) for _, *name_suffix in mutations)
+                parts.append([position for position, *_ in mutations])
+        return ids, parts
+
+    def _positions(self, parts: list[list[TData] | MutationBatch], pivot: Solution[TData] | None) -> Sequence[TData]:
+        """
+        Positions of the mutations. Positions of delta evaluated batches are not materialized
+        (only the accessed ones are, e.g. of the selected neighbour), so that a neighbour costs O(1) instead of O(n).
+        """
+        if self._supports_delta(pivot) and any(isinstance(p, MutationBatch) for p in parts):
+            return LazyColumn(parts, MutationBatch.position)
+        return self._join_positions(parts)
+
+    def _solutions_positions(self, parts: list[list[TData] | MutationBatch],
+                             pivot: Solution[TData] | None) -> Sequence[TData]:
+        """
+        Like `_positions`, but materialized, as every solution keeps its position.
+        Rows are materialized once, so that solutions and their qualities share them.
+        """
+        positions = self._positions(parts, pivot)
+        return list(positions) if isinstance(positions, LazyColumn) else positions
+
+    def _evaluate(self, parts: list[list[TData] | MutationBatch], positions: Sequence[TData],
+                  pivot: Solution[TData] | None) -> Iterable[BaseSolutionQualityInfo]:
+        """
+        Evaluates positions of every generator, using delta evaluation, where possible.
+        """
+        if not self._supports_delta(pivot):
+            return self.quality_factory(positions)
+
+        fully_evaluated = self._join_fully_evaluated(parts)
+        return self._combine(parts, positions, pivot,
+                             self.quality_factory(fully_evaluated) if len(fully_evaluated) else ())
+
+    async def _evaluate_async(self, parts: list[list[TData] | MutationBatch], positions: Sequence[TData],
+                              pivot: Solution[TData] | None) -> Iterable[BaseSolutionQualityInfo]:
+        """
+        Like `_evaluate`, but evaluates fully evaluated positions with async metrics.
+        """
+        if not self._supports_delta(pivot):
+            return await self.quality_factory.evaluate_async(positions)
+
+        fully_evaluated = self._join_fully_evaluated(parts)
+        return self._combine(parts, positions, pivot,
+                             await self.quality_factory.evaluate_async(fully_evaluated) if len(fully_evaluated) else ())
+
+    def _evaluate_batch(self, parts: list[list[TData] | MutationBatch], positions: Sequence[TData],
+                        pivot: Solution[TData] | None) -> QualityBatch:
+        """
+        Like `_evaluate`, but evaluates into `QualityBatch`.
+        """
+        if not self._supports_delta(pivot):
+            return self.quality_factory.batch(positions)
+
+        fully_evaluated = self._join_fully_evaluated(parts)
+        return self._combine_batch(parts, pivot,
+                                   self.quality_factory.batch(fully_evaluated) if len(fully_evaluated) else None)
+
+    async def _evaluate_batch_async(self, parts: list[list[TData] | MutationBatch], positions: Sequence[TData],
+                                    pivot: Solution[TData] | None) -> QualityBatch:
+        """
+        Like `_evaluate_batch`, but evaluates fully evaluated positions with async metrics.
+        """
+        if not self._supports_delta(pivot):
+            return await self.quality_factory.batch_async(positions)
+
+        fully_evaluated = self._join_fully_evaluated(parts)
+        return self._combine_batch(parts, pivot,
+                                   await self.quality_factory.batch_async(fully_evaluated)
+                                   if len(fully_evaluated) else None)
+
+    def _supports_delta(self, pivot: Solution[TData] | None) -> bool:
+        return pivot is not None and self.quality_factory.supports_delta(pivot.quality)
+
+    def _join_fully_evaluated(self, parts: list[list[TData] | MutationBatch]) -> Sequence[TData]:
+        """
+        Joins positions of the generators without batches (which are not delta evaluated).
+        """
+        return self._join_positions([p for p in parts if not isinstance(p, MutationBatch)])
+
+    def _combine(self, parts: list[list[TData] | MutationBatch], positions: Sequence[TData], pivot: Solution[TData],
+                 full_qualities: Iterable[BaseSolutionQualityInfo]) -> Iterable[BaseSolutionQualityInfo]:
+        """
+        Combines qualities of fully evaluated generators with delta evaluated ones in order of generators.
+        """
+        full_qualities = iter(full_qualities)
+        offsets = np.cumsum([0, *map(len, parts)]).tolist()
+        # full qualities are consumed in order of generators, so islice picks the ones of each generator
+        return chain.from_iterable(self.quality_factory.delta(pivot.quality, positions[start:end],
+                                                              p.idx, p.old, p.values)
+                                   if isinstance(p, MutationBatch)
+                                   else islice(full_qualities, len(p))
+                                   for p, start, end in zip(parts, offsets, offsets[1:]))
+
+    def _combine_batch(self, parts: list[list[TData] | MutationBatch], pivot: Solution[TData],
+                       full_qualities: QualityBatch | None) -> QualityBatch:
+        """
+        Like `_combine`, but combines `QualityBatch` parts.
+        """
+        qualities, offset = [], 0
+        for p in parts:
+            if isinstance(p, MutationBatch):
+                qualities.append(self.quality_factory.delta_batch(pivot.quality, p.idx, p.old, p.values))
+            else:
+                qualities.append(full_qualities.take(slice(offset, offset + len(p))))
+                offset += len(p)
+
+        if any(q.materialized for q in qualities):
+            qualities = [q.materialize(LazyColumn([p], MutationBatch.position) if isinstance(p, MutationBatch) else p)
+                         for q, p in zip(qualities, parts)]
+        return QualityBatch.concatenate(qualities)
+
+    @staticmethod
+    def _join_positions(parts: list[Sequence[TData] | MutationBatch]) -> Sequence[TData]:
+        """
+        Joins positions of several mutation behaviours.
+        Batched positions are kept (or concatenated) as a single 2D ndarray, so that metrics could consume it directly.
+        """
+        positions = [p.positions if isinstance(p, MutationBatch) else p for p in parts]
+        if positions and all(isinstance(p, np.ndarray) for p in positions):
+            return positions[0] if len(positions) == 1 else np.concatenate(positions)
+        return list(chain.from_iterable(positions))
+
+    @staticmethod
+    def _moves(parts: list[list[TData] | MutationBatch]) -> Sequence[Move | None]:
+        """
+        Moves of the mutations: lazy for batches, None for the other mutations.
+        """
+        moves = [p if isinstance(p, MutationBatch) else [None] * len(p) for p in parts]
+        if any(isinstance(p, MutationBatch) for p in parts):
+            return LazyColumn(moves, MutationBatch.move)
+        return list(chain.from_iterable(moves))
+
+    def _id_factory(self, generator_name: str, *solution_suffix: str | int, marks: dict[int, str] | None = None):
+        return SolutionId(generator_name) \
+            if self._use_simple_ids \
+            else SolutionId(generator_name, *solution_suffix, marks=marks)
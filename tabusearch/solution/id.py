@@ -1,15 +1,70 @@
 class SolutionId:
-    def __init__(self, parent_name: str, *solution_idx: str):
-        self._str = f'{parent_name}({",".join(solution_idx)})' if len(solution_idx) else parent_name
-        self._hash = hash(self._str)
+    """
+    Identity of a solution: name of the generating mutation type along with name components of the mutation.
+    Stored as a compact tuple of the mutation type index and components (e.g., integer indices),
+    so hashing and comparison do not require formatting. The string is rendered only on demand.
+    Components are normalized, so that ids of the same mutation are equal, whether they are built
+    from str name components (list-based mutations) or from integer descriptors with marks (batched mutations).
+    """
+    __slots__ = ('_key', '_hash', '_str')
+
+    _type_names: list[str] = []
+    _type_indices: dict[str, int] = {}
+
+    def __init__(self, parent_name: str, *solution_idx: str | int, marks: dict[int, str] | None = None):
+        """
+        Initializes solution id.
+        :param parent_name: Name of the mutation type.
+        :param solution_idx: Name components of the mutation (str or int).
+        :param marks: Optional names for values of the first component (e.g., direction signs).
+        """
+        type_index = SolutionId._type_indices.get(parent_name)
+        if type_index is None:
+            type_index = SolutionId._type_indices[parent_name] = len(SolutionId._type_names)
+            SolutionId._type_names.append(parent_name)
+
+        self._key = (type_index, marks[solution_idx[0]], *solution_idx[1:]) \
+            if marks and solution_idx \
+            else (type_index, *map(_normalized_component, solution_idx))
+        self._hash = None
+        self._str = None
+
+    @property
+    def parent_name(self) -> str:
+        """
+        Name of the mutation type.
+        """
+        return SolutionId._type_names[self._key[0]]
 
     def __eq__(self, other: 'SolutionId'):
         assert issubclass(type(other), SolutionId), 'Can only check equality of SolutionId with another SolutionId' \
                                                     f' ({type(other).__name__} was passed)'
-        return hash(self) == hash(other)
+        return self._key == other._key
 
     def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(self._key)
         return self._hash
 
     def __str__(self):
+        if self._str is None:
+            type_index, *solution_idx = self._key
+            parent_name = SolutionId._type_names[type_index]
+            self._str = f'{parent_name}({",".join(map(str, solution_idx))})' if len(solution_idx) else parent_name
         return self._str
+
+    def __reduce__(self):
+        # the type index is specific to the process, so the id is pickled by the type name
+        type_index, *solution_idx = self._key
+        return _restore_solution_id, (type(self), SolutionId._type_names[type_index], tuple(solution_idx))
+
+
+def _restore_solution_id(cls, parent_name: str, solution_idx: tuple) -> SolutionId:
+    return cls(parent_name, *solution_idx)
+
+
+def _normalized_component(component: str | int) -> str | int:
+    """
+    Integer name component (e.g. index) is stored as int, whether it was passed as str or int.
+    """
+    return int(component) if isinstance(component, str) and component.lstrip('-').isdigit() else component
@@ -0,0 +1,16 @@
+from typing import NamedTuple
+
+from numpy.typing import NDArray
+
+
+class Move(NamedTuple):
+    """
+    Description of a mutation move: which elements of the pivot were changed and how.
+    Used to evaluate neighbours incrementally (see `custom_metric` `delta` argument).
+    """
+    # Indices of the changed elements
+    idx: NDArray[int]
+    # Values of the changed elements in the pivot
+    old: NDArray
+    # Values of the changed elements in the neighbour
+    new: NDArray
@@ -0,0 +1,161 @@
+from itertools import chain, repeat
+from typing import Callable, Generic, Iterator, Sequence, TypeVar
+
+import numpy as np
+from numpy.typing import NDArray
+
+from tabusearch.mutation.base import MutationBatch
+from tabusearch.solution.base import Solution
+from tabusearch.solution.id import SolutionId
+from tabusearch.solution.move import Move
+from tabusearch.solution.quality.batch import QualityBatch
+from tabusearch.typing_ import TData
+
+T = TypeVar('T')
+
+
+class LazyColumn(Sequence[T]):
+    """
+    Column of neighbours (positions or moves), joined from the mutations of several generators.
+    Items of `MutationBatch` parts are materialized on access only, so that a delta evaluated neighbourhood
+    keeps neither a (k, n) positions matrix nor a `Move` per neighbour - just the batch index arrays.
+    """
+    _parts: list[Sequence[T] | MutationBatch]
+    _item: Callable[[MutationBatch, int], T]
+    _offsets: NDArray[int]
+
+    def __init__(self, parts: list[Sequence[T] | MutationBatch], item: Callable[[MutationBatch, int], T]):
+        """
+        Initializes lazy column.
+        :param parts: Materialized items (list or ndarray) or `MutationBatch` of every generator.
+        :param item: Function of a batch and an index, which materializes item of the batch (e.g. `MutationBatch.move`).
+        """
+        self._parts = parts
+        self._item = item
+        self._offsets = np.cumsum([0, *map(len, parts)])
+
+    def __len__(self):
+        return int(self._offsets[-1])
+
+    @property
+    def parts(self) -> list[Sequence[T] | MutationBatch]:
+        """
+        Materialized items or `MutationBatch` of every generator (e.g. to read the batch arrays at once).
+        """
+        return self._parts
+
+    def __getitem__(self, i: int) -> T:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(f'Index {i} is out of range of column of {len(self)} items.')
+        part_idx = int(np.searchsorted(self._offsets, i, side='right')) - 1
+        part, i = self._parts[part_idx], i - int(self._offsets[part_idx])
+        return self._item(part, i) if isinstance(part, MutationBatch) else part[i]
+
+    def __iter__(self) -> Iterator[T]:
+        return chain.from_iterable(map(self._item, repeat(part), range(len(part))) if isinstance(part, MutationBatch)
+                                   else part
+                                   for part in self._parts)
+
+    def take(self, idx: NDArray[int]) -> 'LazyColumn[T]':
+        """
+        Selects items by indices, keeping batched parts lazy.
+        Consecutive indices of the same part (e.g. sorted ones) are taken from it at once.
+        """
+        part_idx = np.searchsorted(self._offsets, idx, side='right') - 1
+        runs = np.flatnonzero(np.diff(part_idx, prepend=-1)) if len(idx) else np.empty(0, dtype=int)
+        return LazyColumn([_take(self._parts[part], local)
+                           for part, local in zip(part_idx[runs].tolist(),
+                                                  np.split(idx - self._offsets[part_idx], runs[1:]))],
+                          self._item)
+
+    @classmethod
+    def concatenate(cls, columns: list[Sequence[T]], item: Callable[[MutationBatch, int], T]) -> 'LazyColumn[T]':
+        """
+        Joins columns (lazy or materialized) into one lazy column.
+        """
+        return cls([part for column in columns
+                    for part in (column._parts if isinstance(column, LazyColumn) else [column])], item)
+
+
+class Neighbourhood(Generic[TData]):
+    """
+    Columnar representation of evaluated neighbours: their ids, positions, moves and `QualityBatch`.
+    `Solution` objects are materialized on demand only (e.g., for the selected neighbour).
+    Positions and moves of delta evaluated batches are `LazyColumn`s, materialized per neighbour.
+    """
+    ids: list[SolutionId]
+    positions: Sequence[TData]
+    moves: Sequence[Move | None]
+    qualities: QualityBatch
+
+    def __init__(self, ids: list[SolutionId], positions: Sequence[TData], moves: Sequence[Move | None],
+                 qualities: QualityBatch):
+        assert len(ids) == len(positions) == len(moves) == len(qualities), \
+            'Neighbourhood columns should have the same lengths.'
+
+        self.ids = ids
+        self.positions = positions
+        self.moves = moves
+        self.qualities = qualities
+
+    @classmethod
+    def concatenate(cls, neighbourhoods: list['Neighbourhood[TData]']) -> 'Neighbourhood[TData]':
+        """
+        Concatenates neighbourhoods, evaluated with the same metric.
+        """
+        return cls(list(chain.from_iterable(n.ids for n in neighbourhoods)),
+                   _concatenate([n.positions for n in neighbourhoods], MutationBatch.position),
+                   _concatenate([n.moves for n in neighbourhoods], MutationBatch.move),
+                   QualityBatch.concatenate([n.qualities for n in neighbourhoods]))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def solution(self, i: int) -> Solution[TData]:
+        """
+        Materializes i-th neighbour.
+        """
+        position = self.positions[i]
+        return Solution(self.ids[i], position, self.qualities.quality(i, position), self.moves[i])
+
+    def solutions(self) -> list[Solution[TData]]:
+        """
+        Materializes all the neighbours.
+        """
+        return [Solution(*s) for s in zip(self.ids, self.positions, self.qualities.qualities(self.positions),
+                                          self.moves)]
+
+    def take(self, idx: NDArray[int] | NDArray[bool]) -> 'Neighbourhood[TData]':
+        """
+        Selects subset of the neighbourhood.
+        :param idx: Indices or boolean mask.
+        """
+        idx = np.asarray(idx)
+        if idx.dtype == bool:
+            idx = np.flatnonzero(idx)
+        return Neighbourhood([self.ids[i] for i in idx.tolist()], _take(self.positions, idx), _take(self.moves, idx),
+                             self.qualities.take(idx))
+
+
+def _take(column: Sequence[T] | MutationBatch, idx: NDArray[int]) -> Sequence[T] | MutationBatch:
+    """
+    Selects items of a column (or a part of `LazyColumn`) by indices.
+    """
+    if isinstance(column, np.ndarray):
+        return column[idx]
+    if isinstance(column, (LazyColumn, MutationBatch)):
+        return column.take(idx)
+    return [column[i] for i in idx.tolist()]
+
+
+def _concatenate(columns: list[Sequence[T]], item: Callable[[MutationBatch, int], T]) -> Sequence[T]:
+    """
+    Joins columns of several neighbourhoods, keeping lazy columns lazy.
+    """
+    if all(isinstance(c, np.ndarray) for c in columns):
+        return np.concatenate(columns)
+    if any(isinstance(c, LazyColumn) for c in columns):
+        return LazyColumn.concatenate(columns, item)
+    return list(chain.from_iterable(columns))
@@ -1,5 +1,5 @@
 from abc import ABC
-from functools import partialmethod
+from functools import partial, partialmethod
 from operator import eq, lt
 from typing import Callable, Iterable
 import math
@@ -23,27 +23,58 @@ class BaseAggregatedSolutionQualityInfo(BaseSolutionQualityInfo, ABC):
 
 
 class AggregateComparisonSolutionQualityInfo(BaseAggregatedSolutionQualityInfo):
-    def __init__(self, metrics, name: str, aggregation: [Callable[[Iterable[bool]], bool]]):
-        value_str = '\n'.join(list(map(str, metrics)))
-        super(BaseAggregatedSolutionQualityInfo, self).__init__(name, value_str)
-
+    """
+    Compares qualities per metric and aggregates the comparisons (e.g. `all` - better by every metric).
+    Float representations of the metrics are computed once and kept as a vector.
+    Such comparison is not a total order, so solutions of these qualities should be selected with Pareto ranking
+    (see `ParetoSolutionSelection`), not sorted.
+    """
+    def __init__(self, metrics, name: str, aggregation: [Callable[[NDArray[bool]], bool]],
+                 floats: NDArray[float] | None = None):
+        """
+        Initializes per metric comparison quality.
+        :param metrics: Compared metrics.
+        :param name: Name of the aggregation.
+        :param aggregation: Function of the per metric comparisons vector.
+        :param floats: Float representations of the metrics, if already computed (e.g. a row of metrics matrix).
+        """
         self._data = list(metrics)
+        super(BaseAggregatedSolutionQualityInfo, self).__init__(name, partial(_join_str, self._data))
+
         self._aggregation = aggregation
+        self._floats = floats
 
     @property
-    def _float_ndarray(self) -> NDArray[float]:
-        return np.array([float(m) for m in self._data])
+    def floats(self) -> NDArray[float]:
+        """
+        Float representations of the metrics (greater is better).
+        """
+        if self._floats is None:
+            self._floats = np.fromiter(map(float, self._data), dtype=np.float64, count=len(self._data))
+        return self._floats
 
     def _cmp_agg(self, other: 'AggregateComparisonSolutionQualityInfo', cmp):
-        return self._aggregation(cmp(self._float_ndarray, other._float_ndarray))
+        return self._aggregation(cmp(self.floats, other.floats))
 
     _equals_to = partialmethod(_cmp_agg, cmp=eq)
     _less_than = partialmethod(_cmp_agg, cmp=lt)
 
 
 class CompareAggregatedSolutionQualityInfo(SolutionQualityInfo, BaseAggregatedSolutionQualityInfo):
-    def __init__(self, metrics, name: str, aggregation: Callable[[Iterable[float]], float]):
-        value_str = '\n'.join(list(map(str, metrics)))
-        float_n = aggregation(map(float, metrics))
+    def __init__(self, metrics, name: str, aggregation: Callable[[Iterable[float]], float] | None = None,
+                 float_: float | None = None):
+        """
+        Initializes quality, ordered by aggregated float representations of the metrics.
+        :param metrics: Aggregated metrics.
+        :param name: Name of the aggregation.
+        :param aggregation: Function of float representations of the metrics. Not used, if `float_` is passed.
+        :param float_: Already aggregated value (e.g. computed for a matrix of metrics at once).
+        """
+        metrics = list(metrics)
+        float_n = aggregation(map(float, metrics)) if float_ is None else float_
+
+        super().__init__(metrics, name, float_n, False, _join_str)
+
 
-        super().__init__(list(metrics), name, float_n, False, value_str)
+def _join_str(metrics) -> str:
+    return '\n'.join(map(str, metrics))
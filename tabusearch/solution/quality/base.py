@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from functools import total_ordering
+from typing import Callable
 
 
 @total_ordering
@@ -7,9 +8,19 @@ class BaseSolutionQualityInfo(ABC):
     """
     Maximized quality metric. I.e., `better_solution_quality_metric > worse_solution_quality_metric`
     """
-    def __init__(self, name: str, value_str: str):
+    def __init__(self, name: str, value_str: str | Callable[[], str] | None):
         self.name = name
-        self._str = value_str
+        self._value_str = value_str
+
+    @property
+    def _str(self) -> str | None:
+        """
+        String representation of the quality value.
+        Rendered on first access only (a callable `value_str` is called once and memoized).
+        """
+        if callable(self._value_str):
+            self._value_str = self._value_str()
+        return self._value_str
 
     @abstractmethod
     def _equals_to(self, other) -> bool:
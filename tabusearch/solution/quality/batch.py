@@ -0,0 +1,201 @@
+from functools import partial
+from typing import Callable, Iterable, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from tabusearch.solution.quality.aggregated import CompareAggregatedSolutionQualityInfo
+from tabusearch.solution.quality.base import BaseSolutionQualityInfo
+from tabusearch.solution.quality.single import SolutionQualityInfo
+from tabusearch.typing_ import TData
+
+
+def is_float_ordered(quality: BaseSolutionQualityInfo) -> bool:
+    """
+    Checks, whether qualities of the type are ordered by their float representation.
+    """
+    quality_type = type(quality)
+    return isinstance(quality, SolutionQualityInfo) \
+        and quality_type._less_than is SolutionQualityInfo._less_than \
+        and quality_type._equals_to is SolutionQualityInfo._equals_to
+
+
+class QualityBatch:
+    """
+    Columnar qualities of several solutions - a float64 vector of metric values along with the metric metadata.
+    Ordered by `scores` (values, negated for minimized metrics), so filtering and selection can be vectorized.
+    Quality objects are materialized only on demand.
+    """
+    values: NDArray[np.float64]
+    name: str
+    minimized: bool
+
+    _quality_factory: Callable[..., BaseSolutionQualityInfo]
+    _qualities: NDArray[object] | None
+
+    def __init__(self, values: NDArray[float] | Sequence[float], name: str, minimized: bool = False,
+                 quality_factory: Callable[..., BaseSolutionQualityInfo] | None = None,
+                 qualities: NDArray[object] | None = None):
+        """
+        Initializes quality batch.
+        :param values: Metric values (not negated for minimized metrics).
+        :param name: Name of the metric.
+        :param minimized: Whether the metric is minimized.
+        :param quality_factory: Function of solution data and `float_` value, which materializes quality object.
+          Defaults to `SolutionQualityInfo` with batch name and `minimized`.
+        :param qualities: Already materialized quality objects, if any.
+        """
+        self.values = np.asarray(values, dtype=np.float64)
+        self.name = name
+        self.minimized = minimized
+        self._quality_factory = quality_factory or partial(SolutionQualityInfo, name=name, minimized=minimized)
+        self._qualities = qualities
+
+    @classmethod
+    def from_qualities(cls, qualities: Iterable[BaseSolutionQualityInfo]) -> 'QualityBatch':
+        """
+        Creates batch from quality objects. The objects should be float-ordered (see `is_float_ordered`).
+        """
+        qualities_array = np.empty(len(qualities := list(qualities)), dtype=object)
+        qualities_array[:] = qualities
+        if not all(map(is_float_ordered, qualities)):
+            raise TypeError('QualityBatch supports only qualities, ordered by their float representation.')
+
+        minimized = bool(qualities) and qualities[0]._minimized
+        values = np.fromiter((q.value for q in qualities), dtype=np.float64, count=len(qualities))
+        return cls(values, qualities[0].name if qualities else '', minimized, qualities=qualities_array)
+
+    @classmethod
+    def concatenate(cls, batches: list['QualityBatch']) -> 'QualityBatch':
+        """
+        Concatenates batches of the same metric. The batches should be either all materialized
+        or all not materialized with the same quality factory.
+        """
+        [first, *_] = batches
+        values = np.concatenate([b.values for b in batches])
+        if all(b.materialized for b in batches):
+            return QualityBatch(values, first.name, first.minimized, first._quality_factory,
+                                np.concatenate([b._qualities for b in batches]))
+        if any(b.materialized or type(b) is not type(first) or b._quality_factory is not first._quality_factory
+               for b in batches):
+            raise ValueError('Can concatenate only batches of the same metric.')
+        return first._concatenated(values, batches)
+
+    def _concatenated(self, values: NDArray[np.float64], batches: list['QualityBatch']) -> 'QualityBatch':
+        """
+        Not materialized batch of the concatenated `values` of `batches` (of the same type and metric as this one).
+        """
+        return QualityBatch(values, self.name, self.minimized, self._quality_factory)
+
+    @property
+    def scores(self) -> NDArray[np.float64]:
+        """
+        Comparable (maximized) representation of the values - same as float of the quality objects.
+        """
+        return -self.values if self.minimized else self.values
+
+    @property
+    def materialized(self) -> bool:
+        """
+        Whether the batch keeps quality objects.
+        """
+        return self._qualities is not None
+
+    def __len__(self):
+        return len(self.values)
+
+    def take(self, idx: NDArray[int] | NDArray[bool] | slice) -> 'QualityBatch':
+        """
+        Selects subset of the batch.
+        :param idx: Indices, boolean mask or slice.
+        """
+        return QualityBatch(self.values[idx], self.name, self.minimized, self._quality_factory,
+                            None if self._qualities is None else self._qualities[idx])
+
+    def quality(self, i: int, data: TData) -> BaseSolutionQualityInfo:
+        """
+        Materializes quality object of i-th solution.
+        :param i: Index of solution in the batch.
+        :param data: Data of the solution.
+        """
+        return self._qualities[i] \
+            if self._qualities is not None \
+            else self._quality_factory(data, float_=self.values[i].item())
+
+    def qualities(self, x: Sequence[TData]) -> list[BaseSolutionQualityInfo]:
+        """
+        Materializes quality objects of all the solutions.
+        :param x: Data of the solutions.
+        """
+        return list(self._qualities) \
+            if self._qualities is not None \
+            else [self._quality_factory(data, float_=value) for data, value in zip(x, self.values.tolist())]
+
+    def materialize(self, x: Sequence[TData]) -> 'QualityBatch':
+        """
+        Creates the same batch, which keeps quality objects.
+        :param x: Data of the solutions.
+        """
+        if self.materialized:
+            return self
+        qualities = np.empty(len(self), dtype=object)
+        qualities[:] = self.qualities(x)
+        return QualityBatch(self.values, self.name, self.minimized, self._quality_factory, qualities)
+
+    def top(self, k: int) -> NDArray[int]:
+        """
+        Indices of k best solutions in descending order of quality.
+        Solutions of equal quality are ordered from the latest to the first (as in reversed `SortedList`).
+        Selects candidates with `argpartition`, so takes linear time for small k.
+        """
+        scores = self.scores[::-1]
+        if k < len(scores):
+            threshold = scores[np.argpartition(-scores, k - 1)[:k]].min()
+            candidates = np.flatnonzero(scores >= threshold)
+        else:
+            candidates = np.arange(len(scores))
+        best = candidates[np.argsort(-scores[candidates], kind='stable')][:k]
+        return len(scores) - 1 - best
+
+
+class AggregatedQualityBatch(QualityBatch):
+    """
+    Columnar qualities, aggregated from the batches of several metrics at once (see `matrix_metrics_aggregation`).
+    Keeps the metric batches, so that aggregated quality objects are materialized from their qualities
+    without re-evaluation of the metrics.
+    """
+    metric_batches: list[QualityBatch]
+
+    def __init__(self, values: NDArray[float] | Sequence[float], name: str, metric_batches: list[QualityBatch],
+                 qualities: NDArray[object] | None = None):
+        """
+        Initializes aggregated quality batch.
+        :param values: Aggregated values (maximized).
+        :param name: Name of the aggregation.
+        :param metric_batches: Batches of the aggregated metrics, aligned with `values`.
+        :param qualities: Already materialized quality objects, if any.
+        """
+        super().__init__(values, name, quality_factory=CompareAggregatedSolutionQualityInfo, qualities=qualities)
+        self.metric_batches = metric_batches
+
+    def take(self, idx: NDArray[int] | NDArray[bool] | slice) -> 'AggregatedQualityBatch':
+        return AggregatedQualityBatch(self.values[idx], self.name, [b.take(idx) for b in self.metric_batches],
+                                      None if self._qualities is None else self._qualities[idx])
+
+    def quality(self, i: int, data: TData) -> BaseSolutionQualityInfo:
+        if self._qualities is not None:
+            return self._qualities[i]
+        return CompareAggregatedSolutionQualityInfo([b.quality(i, data) for b in self.metric_batches], self.name,
+                                                    float_=self.values[i].item())
+
+    def qualities(self, x: Sequence[TData]) -> list[BaseSolutionQualityInfo]:
+        if self._qualities is not None:
+            return list(self._qualities)
+        return [CompareAggregatedSolutionQualityInfo(metrics, self.name, float_=value)
+                for value, *metrics in zip(self.values.tolist(), *(b.qualities(x) for b in self.metric_batches))]
+
+    def _concatenated(self, values: NDArray[np.float64], batches: list['AggregatedQualityBatch']) \
+            -> 'AggregatedQualityBatch':
+        return AggregatedQualityBatch(values, self.name,
+                                      [QualityBatch.concatenate(list(metric_batches))
+                                       for metric_batches in zip(*(b.metric_batches for b in batches))])
@@ -0,0 +1,127 @@
+import pickle
+from collections import OrderedDict
+from functools import partial
+from hashlib import blake2b
+from typing import Callable, Hashable, NamedTuple, Sequence
+
+import numpy as np
+
+from tabusearch.solution.quality.base import BaseSolutionQualityInfo
+from tabusearch.typing_ import TData
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int | None
+    maxbytes: int | None
+    currsize: int
+    currbytes: int
+
+
+def position_key(x: TData) -> Hashable:
+    """
+    Fast content key of solution data.
+    ndarray is keyed by a digest of its bytes along with its dtype and shape.
+    Other hashable data is keyed by itself, unhashable - by a digest of its pickle.
+    """
+    if isinstance(x, np.ndarray):
+        return x.dtype.str, x.shape, blake2b(np.ascontiguousarray(x).data, digest_size=16).digest()
+    try:
+        hash(x)
+        return x
+    except TypeError:
+        return blake2b(pickle.dumps(x), digest_size=16).digest()
+
+
+class QualityCache:
+    """
+    Bounded LRU cache of metric evaluations, keyed by content of the evaluated solutions.
+    Only pure metrics (whose values depend on the solution alone) should be cached,
+    so `SolutionQualityFactory` caches the first evaluation layer only.
+    Missed ndarray solutions are evaluated as copies, so that a cached quality keeps alive only its own data
+    (not the whole batch matrix, which rows are views of), and `maxbytes` bounds the retained memory.
+    """
+    _entries: OrderedDict[tuple[Callable, Hashable], tuple[BaseSolutionQualityInfo, int]]
+
+    def __init__(self, maxsize: int | None = 100_000, maxbytes: int | None = None):
+        """
+        Initializes cache.
+        :param maxsize: Maximal number of cached qualities. Unbounded, if None.
+        :param maxbytes: Maximal total size of cached solutions data in bytes (for ndarray data). Unbounded, if None.
+        """
+        assert maxsize is None or maxsize > 0, f'maxsize should be positive, was {maxsize}.'
+        assert maxbytes is None or maxbytes > 0, f'maxbytes should be positive, was {maxbytes}.'
+
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+
+    def cached_metrics(self, metrics: list[Callable[[Sequence[TData]], list[BaseSolutionQualityInfo]]],
+                       x: Sequence[TData]) -> list[Callable[[Sequence[TData]], list[BaseSolutionQualityInfo]]]:
+        """
+        Wraps metrics to evaluate `x` through the cache. Keys of `x` are calculated once for all the metrics.
+        :param metrics: Metrics to wrap.
+        :param x: Solutions data, which will be evaluated.
+        :return: Wrapped metrics.
+        """
+        keys = [position_key(data) for data in x]
+        return [partial(self.evaluate, metric, keys=keys) for metric in metrics]
+
+    def evaluate(self, metric: Callable[[Sequence[TData]], list[BaseSolutionQualityInfo]],
+                 x: Sequence[TData], keys: list[Hashable] | None = None) -> list[BaseSolutionQualityInfo]:
+        """
+        Evaluates solutions with metric, taking cached qualities and evaluating the rest at once.
+        :param metric: Evaluated metric.
+        :param x: Solutions data.
+        :param keys: Pre-calculated `position_key`s of x.
+        :return: Solution qualities in the same order.
+        """
+        keys = keys if keys is not None else [position_key(data) for data in x]
+        result = [None] * len(keys)
+        missed: dict[Hashable, list[int]] = {}
+
+        for i, key in enumerate(keys):
+            entry = self._entries.get((metric, key))
+            if entry is None:
+                missed.setdefault(key, []).append(i)
+            else:
+                self._entries.move_to_end((metric, key))
+                result[i] = entry[0]
+        self.misses += len(missed)
+        self.hits += len(keys) - len(missed)
+
+        if missed:
+            missed_data = [x[idx[0]].copy() if isinstance(x[idx[0]], np.ndarray) else x[idx[0]]
+                           for idx in missed.values()]
+            for (key, idx), data, quality in zip(missed.items(), missed_data, metric(missed_data)):
+                for i in idx:
+                    result[i] = quality
+                self._put((metric, key), quality, data.nbytes if isinstance(data, np.ndarray) else 0)
+
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Statistics of the cache usage.
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, self.maxbytes, len(self._entries), self._bytes)
+
+    def clear(self):
+        """
+        Drops cached qualities and statistics.
+        """
+        self._entries.clear()
+        self._bytes = self.hits = self.misses = 0
+
+    def _put(self, key: tuple[Callable, Hashable], quality: BaseSolutionQualityInfo, nbytes: int):
+        self._entries[key] = quality, nbytes
+        self._bytes += nbytes
+
+        while self._entries and (self.maxsize is not None and len(self._entries) > self.maxsize
+                                 or self.maxbytes is not None and self._bytes > self.maxbytes):
+            _, (_, evicted_bytes) = self._entries.popitem(last=False)
+            self._bytes -= evicted_bytes
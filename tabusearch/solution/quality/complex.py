@@ -17,7 +17,13 @@ class ComplexSolutionQualityInfo(SolutionQualityInfo):
         self.full = full
 
         self.name = f'Complex [{main.name} ({full.name})]'
-        self._str = full._str
+
+    @property
+    def _str(self) -> str:
+        return self.full._str
+
+    def __getstate__(self):
+        return self.__dict__
 
     @property
     def value(self):
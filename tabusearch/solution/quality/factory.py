@@ -1,7 +1,15 @@
-from typing import Callable, Iterable, Generic
+import asyncio
+import inspect
+from typing import Callable, Iterable, Generic, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
 
 from tabusearch.solution.quality.aggregated import BaseAggregatedSolutionQualityInfo
 from tabusearch.solution.quality.base import BaseSolutionQualityInfo
+from tabusearch.solution.quality.batch import AggregatedQualityBatch, QualityBatch
+from tabusearch.solution.quality.cache import QualityCache, CacheInfo
+from tabusearch.solution.quality.single import SolutionQualityInfo
 from tabusearch.typing_ import TData
 
 
@@ -9,25 +17,83 @@ class SolutionQualityFactory(Generic[TData]):
     _evaluation_layers: list[tuple[
         list[Callable[[list[TData]], list[BaseSolutionQualityInfo]]],
         Callable[[Iterable[Iterable[BaseSolutionQualityInfo]]], Iterable[BaseAggregatedSolutionQualityInfo]] | None]]
+    _cache: QualityCache | None
 
     def __init__(self, *metrics: Callable[[list[TData]], list[BaseSolutionQualityInfo]],
                  metrics_aggregation: Callable[[Iterable[Iterable[BaseSolutionQualityInfo]]],
-                                               Iterable[BaseAggregatedSolutionQualityInfo]] | None = None):
+                                               Iterable[BaseAggregatedSolutionQualityInfo]] | None = None,
+                 cache: QualityCache | None = None):
+        """
+        Initializes solution quality factory.
+        :param metrics: Metrics to evaluate solutions with.
+        :param metrics_aggregation: Aggregation of metrics. Required, if several metrics passed.
+        :param cache: Optional cache of the metrics evaluations, keyed by solutions content.
+          Applied to `metrics` only (not to the evaluation layers, added later).
+        """
         if not metrics_aggregation and len(metrics) > 1:
             raise Exception('SolutionQualityFactory should be initialised either with one metric '
                             'or with several metrics and an aggregation.')
 
         self._evaluation_layers = [(list(metrics), metrics_aggregation)]
+        self._cache = cache
 
-    def __call__(self, x: list[TData]) \
+    def __call__(self, x: Sequence[TData]) \
             -> Iterable[BaseSolutionQualityInfo]:
+        """
+        Evaluates solutions.
+        :param x: Solutions data. Either list of data instances or a 2D ndarray with one solution per row.
+        :return: Solution qualities in the same order.
+        """
         evaluated: Iterable[BaseSolutionQualityInfo] | None = None
 
-        for metrics, aggregation in self._evaluation_layers:
+        for i, (metrics, aggregation) in enumerate(self._evaluation_layers):
+            if i == 0 and self._cache is not None:
+                metrics = self._cache.cached_metrics(metrics, x)
+            evaluated = self._apply_evaluation(x, metrics, aggregation, evaluated)
+
+        return evaluated
+
+    async def evaluate_async(self, x: Sequence[TData]) -> Iterable[BaseSolutionQualityInfo]:
+        """
+        Like `__call__`, but supports async metrics (`async def metric(x)`) in the first evaluation layer.
+        Metrics of the layer are evaluated concurrently, the other layers - as usual.
+        The cache is applied only if all the metrics of the layer are synchronous.
+        :param x: Solutions data.
+        :return: Solution qualities in the same order.
+        """
+        [(metrics, aggregation), *other_layers] = self._evaluation_layers
+        if self._cache is not None and not any(map(inspect.iscoroutinefunction, metrics)):
+            metrics = self._cache.cached_metrics(metrics, x)
+
+        evaluated = await asyncio.gather(*(_await_metric(metric, x) for metric in metrics))
+        evaluated = evaluated[0] if not aggregation else aggregation(zip(*evaluated))
+        for metrics, aggregation in other_layers:
             evaluated = self._apply_evaluation(x, metrics, aggregation, evaluated)
 
         return evaluated
 
+    async def batch_async(self, x: Sequence[TData]) -> QualityBatch:
+        """
+        Like `batch`, but supports async metrics (see `evaluate_async`).
+        """
+        [(metrics, aggregation), *other_layers] = self._evaluation_layers
+        if not other_layers and not aggregation and self._cache is None and hasattr(metrics[0], 'evaluate_batch_async'):
+            return await metrics[0].evaluate_batch_async(x)
+        return QualityBatch.from_qualities(await self.evaluate_async(x))
+
+    async def single_async(self, x: TData) -> BaseSolutionQualityInfo:
+        """
+        Like `single`, but supports async metrics (see `evaluate_async`).
+        """
+        [result] = await self.evaluate_async([x])
+        return result
+
+    def cache_info(self) -> CacheInfo | None:
+        """
+        Statistics of the evaluations cache usage. None, if the factory does not cache evaluations.
+        """
+        return self._cache and self._cache.cache_info()
+
     def single(self, x: TData) -> BaseSolutionQualityInfo:
         """
         Generates quality metric for single data instance.
@@ -37,6 +103,58 @@ class SolutionQualityFactory(Generic[TData]):
         [result] = self.__call__([x])
         return result
 
+    def supports_delta(self, base: BaseSolutionQualityInfo) -> bool:
+        """
+        Checks, whether neighbours of a solution with `base` quality can be evaluated incrementally.
+        It requires the only metric without aggregation, which was created with `delta` evaluation.
+        :param base: Quality of pivot solution.
+        :return: True, if `delta` can be used, otherwise, False.
+        """
+        [(metrics, aggregation), *other_layers] = self._evaluation_layers
+        return not other_layers and not aggregation and len(metrics) == 1 \
+            and hasattr(metrics[0], 'evaluate_delta') and isinstance(base, SolutionQualityInfo)
+
+    def delta(self, base: SolutionQualityInfo, x: Sequence[TData], idx: NDArray[int], old: NDArray, new: NDArray) \
+            -> list[BaseSolutionQualityInfo]:
+        """
+        Evaluates neighbours incrementally, as value of pivot plus the change, made by move.
+        Should be used only if `supports_delta` is True.
+        :param base: Quality of pivot solution.
+        :param x: Neighbours data (only to materialize quality objects).
+        :param idx: (k, m) indices of the elements, changed by the moves from pivot to each of the neighbours.
+        :param old: (k, m) values of the changed elements in the pivot.
+        :param new: (k, m) values of the changed elements in the neighbours.
+        :return: Solution qualities of the neighbours.
+        """
+        return self.delta_batch(base, idx, old, new).qualities(x)
+
+    def delta_batch(self, base: SolutionQualityInfo, idx: NDArray[int], old: NDArray, new: NDArray) -> QualityBatch:
+        """
+        Like `delta`, but returns columnar `QualityBatch`, so that the neighbours data is not needed.
+        """
+        [([metric], _)] = self._evaluation_layers
+        return metric.evaluate_delta(base.value, idx, old, new)
+
+    def batch(self, x: Sequence[TData]) -> QualityBatch:
+        """
+        Evaluates solutions into columnar `QualityBatch`.
+        Without allocating quality objects, if the factory has no cache and evaluation layers and either
+        the only metric without aggregation, which supports batch evaluation,
+        or metrics with batch evaluation and a matrix aggregation (see `matrix_metrics_aggregation`).
+        Otherwise, via quality objects (they should be ordered by float).
+        :param x: Solutions data.
+        :return: Qualities of the solutions in the same order.
+        """
+        [(metrics, aggregation), *other_layers] = self._evaluation_layers
+        if not other_layers and self._cache is None and all(hasattr(m, 'evaluate_batch') for m in metrics):
+            if not aggregation:
+                return metrics[0].evaluate_batch(x)
+            if hasattr(aggregation, 'aggregate_matrix'):
+                metric_batches = [m.evaluate_batch(x) for m in metrics]
+                matrix = np.column_stack([b.scores for b in metric_batches])
+                return AggregatedQualityBatch(aggregation.aggregate_matrix(matrix), aggregation.name, metric_batches)
+        return QualityBatch.from_qualities(self(x))
+
     def add_evaluation_layer(self, *metrics: Callable[[list[tuple[TData, BaseSolutionQualityInfo]]],
                                                       list[BaseSolutionQualityInfo]],
                              metrics_aggregation: Callable[[Iterable[Iterable[BaseSolutionQualityInfo]]],
@@ -75,3 +193,8 @@ class SolutionQualityFactory(Generic[TData]):
             evaluated_metrics = zip(*[m(x) for m in metrics])
 
         return metrics_aggregation(evaluated_metrics)
+
+
+async def _await_metric(metric: Callable, x: Sequence[TData]) -> list[BaseSolutionQualityInfo]:
+    result = metric(x)
+    return await result if inspect.isawaitable(result) else result
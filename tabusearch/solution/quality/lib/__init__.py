@@ -1,2 +1,4 @@
-from tabusearch.solution.quality.lib.single import sum_metric, custom_metric
+from tabusearch.solution.quality.lib.single import sum_metric, custom_metric, custom_vectorized_metric, \
+    custom_metric_parallel, custom_async_metric
+from tabusearch.solution.quality.lib.parallel import ParallelMetric
 from tabusearch.solution.quality.lib.aggregated import sum_metrics_aggregation, per_metric_comparison_aggregation
\ No newline at end of file
@@ -1,9 +1,9 @@
-from functools import partial
+from itertools import chain
 from numbers import Number
-from operator import mul
-from typing import Iterable, Callable, Literal
+from typing import Iterable, Callable, Literal, Sequence
 
 import numpy as np
+from numpy.typing import NDArray
 
 from tabusearch.solution.quality.aggregated import BaseAggregatedSolutionQualityInfo, \
     CompareAggregatedSolutionQualityInfo, \
@@ -12,72 +12,106 @@ from tabusearch.solution.quality.base import BaseSolutionQualityInfo
 from tabusearch.solution.quality.single import SolutionQualityInfo
 
 
-# TODO: add docstrings
+def metrics_matrix(solutions_metrics: Sequence[Sequence[BaseSolutionQualityInfo | float]]) -> NDArray[np.float64]:
+    """
+    Float representations of the metrics (greater is better) as (n_solutions, n_metrics) matrix.
+    :param solutions_metrics: Metrics of every solution (the same number for every solution).
+    """
+    n_metrics = len(solutions_metrics[0]) if len(solutions_metrics) else 0
+    return np.fromiter(map(float, chain.from_iterable(solutions_metrics)), dtype=np.float64,
+                       count=len(solutions_metrics) * n_metrics).reshape(len(solutions_metrics), n_metrics)
+
+
+def matrix_metrics_aggregation(name: str, aggregate_matrix: Callable[[NDArray[np.float64]], NDArray[np.float64]]) \
+        -> Callable[[Iterable[Iterable[SolutionQualityInfo]]], list[CompareAggregatedSolutionQualityInfo]]:
+    """
+    Creates aggregation, which aggregates the whole (n_solutions, n_metrics) matrix of metrics floats at once.
+    The returned aggregation also exposes `aggregate_matrix` and `name`, so that metrics with batch evaluation
+    can be aggregated without creating quality objects (see `SolutionQualityFactory.batch`).
+    :param name: Name of the aggregation.
+    :param aggregate_matrix: Function of the metrics matrix, which returns vector of aggregated values.
+    :return: Aggregation.
+    """
+    def iter_solutions(solutions_metrics: Iterable[Iterable[SolutionQualityInfo]]) \
+            -> list[CompareAggregatedSolutionQualityInfo]:
+        solutions_metrics = [list(solution_metrics) for solution_metrics in solutions_metrics]
+        aggregated = aggregate_matrix(metrics_matrix(solutions_metrics)).tolist()
+        return [CompareAggregatedSolutionQualityInfo(solution_metrics, name, float_=value)
+                for solution_metrics, value in zip(solutions_metrics, aggregated)]
+
+    iter_solutions.aggregate_matrix = aggregate_matrix
+    iter_solutions.name = name
+
+    return iter_solutions
+
 
 def sum_metrics_aggregation(name: str, weights: list[Number] | None = None) \
         -> Callable[[Iterable[Iterable[SolutionQualityInfo | float]]], list[BaseAggregatedSolutionQualityInfo]]:
-    if weights is None:
-        aggregation = sum
-    else:
-        def aggregation(metric_values: Iterable[float]):
-            return sum(map(mul, weights, metric_values))
+    """
+    Creates aggregation by (weighted) sum of float representations of the metrics.
+    """
+    weights = None if weights is None else np.asarray(weights, dtype=np.float64)
 
-    one_solution_metrics = partial(CompareAggregatedSolutionQualityInfo, name=name, aggregation=aggregation)
+    def aggregate_matrix(matrix: NDArray[np.float64]) -> NDArray[np.float64]:
+        return (matrix if weights is None else matrix * weights).sum(axis=1)
 
-    def iter_solutions(solutions_metrics: Iterable[Iterable[SolutionQualityInfo]]) \
-            -> list[CompareAggregatedSolutionQualityInfo]:
-        return list(map(one_solution_metrics, solutions_metrics))
-
-    return iter_solutions
+    return matrix_metrics_aggregation(name, aggregate_matrix)
 
 
 def normalized_weighted_metrics_aggregation(name: str, weights: list[Number]) \
         -> Callable[[list[Iterable[SolutionQualityInfo]]], list[BaseAggregatedSolutionQualityInfo]]:
+    """
+    Creates aggregation by weighted sum of the metrics, min-max normalized over the evaluated solutions.
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+
     # per-metrics matrix normalization
-    def get_weights(solutions_metrics: list[Iterable[SolutionQualityInfo]]) -> list[list[float]]:
-        matrix = np.array([[float(metric_value) for metric_value in solution_metrics]
-                           for solution_metrics in solutions_metrics])
-        if matrix.shape[0] == 1:
-            return (1 / matrix).tolist()
-        normalized = (matrix - matrix.min(axis=0)) / matrix.ptp(axis=0)
-        normalized = np.nan_to_num(normalized)
-        norm_weighted = normalized * weights
-        output_weights = norm_weighted / matrix
-        output_weights_list = np.nan_to_num(output_weights).tolist()
-        return output_weights_list
-
-    def aggregation(solution_metrics: Iterable[float], output_weights: list[float]) -> float:
-        return sum(map(mul, solution_metrics, output_weights))
-
-    one_solution_metrics = partial(CompareAggregatedSolutionQualityInfo, name=name)
-
-    def iter_solutions(solutions_metrics: list[Iterable[SolutionQualityInfo]]) \
-            -> list[CompareAggregatedSolutionQualityInfo]:
-        if not isinstance(solutions_metrics, list):
-            solutions_metrics = list(solutions_metrics)
-        output_weights = get_weights(solutions_metrics)
-        return [one_solution_metrics(mtrx, aggregation=partial(aggregation, output_weights=wghts))
-                for mtrx, wghts in zip(solutions_metrics, output_weights)]
+    def aggregate_matrix(matrix: NDArray[np.float64]) -> NDArray[np.float64]:
+        if not len(matrix):
+            return np.empty(0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if matrix.shape[0] == 1:
+                output_weights = 1 / matrix
+            else:
+                normalized = np.nan_to_num((matrix - matrix.min(axis=0)) / matrix.ptp(axis=0))
+                output_weights = np.nan_to_num(normalized * weights / matrix)
+            return (matrix * output_weights).sum(axis=1)
 
-    return iter_solutions
+    return matrix_metrics_aggregation(name, aggregate_matrix)
+
+
+def most(comparisons: NDArray[bool]) -> bool:
+    """
+    Whether the majority of comparisons is true.
+    """
+    return 2 * np.count_nonzero(comparisons) > len(comparisons)
 
 
-# TODO: re-write from list of metrics on matrix of them
 def per_metric_comparison_aggregation(name: str, aggregation: Literal['all', 'any', 'most']
-                                                              | Callable[[Iterable[bool]], bool] = 'all') \
-        -> Callable[[Iterable[BaseSolutionQualityInfo]], BaseAggregatedSolutionQualityInfo]:
-    def get_aggregation(s: str):
-        if s == 'all':
-            return all
-        if s == 'any':
-            return any
-        if s == 'most':
-            return lambda l: len([None for x in l if x]) / len(l)
-        raise ValueError(f'Argument aggregation should be "all", "any", "most" or callable. Was "{s}".')
-
-    try:
-        aggregation = get_aggregation(aggregation) if isinstance(aggregation, str) else aggregation
-    except ValueError as ve:
-        raise ve
-
-    return partial(AggregateComparisonSolutionQualityInfo, name=name, aggregation=aggregation)
+                                                              | Callable[[NDArray[bool]], bool] = 'all') \
+        -> Callable[[Iterable[Iterable[BaseSolutionQualityInfo]]], list[AggregateComparisonSolutionQualityInfo]]:
+    """
+    Creates aggregation, which compares solutions per metric and aggregates the comparisons.
+    The metrics matrix is built once, and every quality keeps its row, so comparisons do not re-evaluate floats.
+    :param name: Name of the aggregation.
+    :param aggregation: Aggregation of the per metric comparisons vector (one element per metric):
+      'all' (better by every metric), 'any', 'most' (by the majority of metrics) or a custom function.
+    :return: Aggregation.
+    """
+    if isinstance(aggregation, str):
+        if aggregation not in _COMPARISON_AGGREGATIONS:
+            raise ValueError(f'Argument aggregation should be "all", "any", "most" or callable. Was "{aggregation}".')
+        aggregation = _COMPARISON_AGGREGATIONS[aggregation]
+
+    def iter_solutions(solutions_metrics: Iterable[Iterable[BaseSolutionQualityInfo]]) \
+            -> list[AggregateComparisonSolutionQualityInfo]:
+        solutions_metrics = [list(solution_metrics) for solution_metrics in solutions_metrics]
+        matrix = metrics_matrix(solutions_metrics)
+        # rows are copied, so that a kept quality (e.g. in the hall of fame) does not keep the whole matrix
+        return [AggregateComparisonSolutionQualityInfo(solution_metrics, name, aggregation, floats.copy())
+                for solution_metrics, floats in zip(solutions_metrics, matrix)]
+
+    return iter_solutions
+
+
+_COMPARISON_AGGREGATIONS = {'all': np.all, 'any': np.any, 'most': most}
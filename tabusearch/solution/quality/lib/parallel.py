@@ -0,0 +1,134 @@
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from math import ceil
+from multiprocessing.shared_memory import SharedMemory
+from os import cpu_count
+from typing import Callable, Literal, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from tabusearch.solution.quality.batch import QualityBatch
+from tabusearch.solution.quality.single import SolutionQualityInfo
+from tabusearch.typing_ import TData
+
+
+class ParallelMetric:
+    """
+    Metric, which eagerly evaluates solutions in a pool of workers, splitting them into chunks.
+    In process mode, ndarray solutions are stacked and shared with the workers through shared memory,
+    so `evaluation` should be picklable (e.g., a module-level function).
+    Usage:
+    ```
+    with ParallelMetric('f', f, minimized=True) as metric:
+        TabuSearch(mutation_behaviour, metric).optimize(x0)
+    ```
+    """
+    _executor: Executor | None
+
+    def __init__(self, name: str, evaluation: Callable[[TData], float],
+                 executor: Literal['process', 'thread'] = 'process',
+                 max_workers: int | None = None,
+                 chunksize: int | None = None,
+                 **kwargs):
+        """
+        Initializes parallel metric. The pool of workers is started on the first evaluation.
+        :param name: Name of the metric.
+        :param evaluation: Function of single solution data, which returns its value.
+        :param executor: Whether to evaluate in processes or in threads.
+        :param max_workers: Number of workers. Defaults to the number of CPUs.
+        :param chunksize: Number of solutions, evaluated by a worker at once.
+          Defaults to splitting solutions in 4 chunks per worker.
+        :param kwargs: Other arguments for `SolutionQualityInfo`.
+        """
+        if executor not in ('process', 'thread'):
+            raise ValueError(f'Argument executor should be "process" or "thread". Was "{executor}".')
+
+        self._evaluation = evaluation
+        self._use_processes = executor == 'process'
+        self._max_workers = max_workers or cpu_count() or 1
+        self._chunksize = chunksize
+        self._name = name
+        self._minimized = bool(kwargs.get('minimized'))
+        self._single_factory = partial(SolutionQualityInfo, name=name, **kwargs)
+        self._executor = None
+
+    def __call__(self, x: Sequence[TData]) -> list[SolutionQualityInfo]:
+        return self.evaluate_batch(x).qualities(x)
+
+    def evaluate_batch(self, x: Sequence[TData]) -> QualityBatch:
+        """
+        Evaluates solutions in the pool of workers into `QualityBatch`.
+        """
+        return QualityBatch(self.evaluate(x), self._name, self._minimized, self._single_factory)
+
+    def evaluate(self, x: Sequence[TData]) -> list[float]:
+        """
+        Evaluates solutions in the pool of workers.
+        :param x: Solutions data.
+        :return: Values of the solutions in the same order.
+        """
+        if not len(x):
+            return []
+
+        bounds = self._chunk_bounds(len(x))
+        if self._use_processes and (isinstance(x, np.ndarray) or isinstance(x[0], np.ndarray)):
+            chunks = self._evaluate_shared(x if isinstance(x, np.ndarray) else np.stack(x), bounds)
+        else:
+            chunks = self.executor.map(_evaluate_chunk, [self._evaluation] * len(bounds),
+                                       [x[start:stop] for start, stop in bounds])
+        return [value for chunk in chunks for value in chunk]
+
+    @property
+    def executor(self) -> Executor:
+        """
+        The pool of workers. Started lazily.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self._max_workers) \
+                if self._use_processes \
+                else ThreadPoolExecutor(self._max_workers)
+        return self._executor
+
+    def close(self):
+        """
+        Shuts the pool of workers down. The metric can still be used after closing - a new pool will be started.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> 'ParallelMetric':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _chunk_bounds(self, n: int) -> list[tuple[int, int]]:
+        chunksize = self._chunksize or max(1, ceil(n / (4 * self._max_workers)))
+        return [(start, min(start + chunksize, n)) for start in range(0, n, chunksize)]
+
+    def _evaluate_shared(self, x: NDArray, bounds: list[tuple[int, int]]) -> list[list[float]]:
+        shm = SharedMemory(create=True, size=max(x.nbytes, 1))
+        try:
+            np.ndarray(x.shape, x.dtype, shm.buf)[:] = x
+            futures = [self.executor.submit(_evaluate_shared_chunk, self._evaluation,
+                                            shm.name, x.shape, x.dtype.str, start, stop)
+                       for start, stop in bounds]
+            return [f.result() for f in futures]
+        finally:
+            shm.close()
+            shm.unlink()
+
+
+def _evaluate_chunk(evaluation: Callable[[TData], float], x: Sequence[TData]) -> list[float]:
+    return [float(evaluation(data)) for data in x]
+
+
+def _evaluate_shared_chunk(evaluation: Callable[[NDArray], float],
+                           shm_name: str, shape: tuple[int, ...], dtype: str, start: int, stop: int) -> list[float]:
+    shm = SharedMemory(shm_name)
+    try:
+        return _evaluate_chunk(evaluation, np.ndarray(shape, dtype, shm.buf)[start:stop])
+    finally:
+        shm.close()
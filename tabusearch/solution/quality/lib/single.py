@@ -1,13 +1,16 @@
+import asyncio
 from functools import partial
-from multiprocessing.pool import ThreadPool
 from numbers import Number
-from typing import Iterable, Callable
+from typing import Awaitable, Iterable, Callable, Literal, Sequence
 
 import numpy as np
 from numpy import ndarray
 from numpy.typing import NDArray
 
 from tabusearch.typing_ import TData
+from tabusearch.solution.move import Move
+from tabusearch.solution.quality.batch import QualityBatch
+from tabusearch.solution.quality.lib.parallel import ParallelMetric
 from tabusearch.solution.quality.single import SolutionQualityInfo
 
 
@@ -24,23 +27,138 @@ def sum_metric(name: str, weights: NDArray[Number] | Iterable[Number] | None = N
     return iter_metric
 
 
-def custom_metric(name: str, evaluation: Callable[[TData], float], **kwargs) \
+def custom_metric(name: str, evaluation: Callable[[TData], float],
+                  delta: Callable[[float, Move], float] | None = None,
+                  batch_delta: Callable[[float, NDArray[int], NDArray, NDArray], NDArray[float]] | None = None,
+                  **kwargs) \
         -> Callable[[list[TData]], list[SolutionQualityInfo]]:
+    """
+    Creates metric, which evaluates every solution with `evaluation`.
+    :param name: Name of the metric.
+    :param evaluation: Function of single solution data, which returns its value.
+    :param delta: Optional incremental evaluation. Function of the pivot value and a `Move`,
+      which returns the change of value, made by the move.
+      If passed, neighbours with described moves are evaluated as `pivot value + delta`.
+    :param batch_delta: Optional vectorized incremental evaluation (preferred over `delta`).
+      Function of the pivot value and (k, m) arrays of changed indices, their old and new values of k moves,
+      which returns 1D array of the value changes. Then a batched neighbour costs O(m), not O(n).
+    :param kwargs: Other arguments for `SolutionQualityInfo`.
+    :return: Metric.
+    """
     single_factory = partial(SolutionQualityInfo, name=name, float_=evaluation, **kwargs)
+    batch_factory = _batch_factory(name, single_factory, **kwargs)
 
     def iter_metric(x: list[TData]) -> list[SolutionQualityInfo]:
         return list(map(single_factory, x))
 
+    def batch_metric(x: Sequence[TData]) -> QualityBatch:
+        return batch_factory(np.fromiter(map(evaluation, x), dtype=np.float64, count=len(x)))
+
+    iter_metric.evaluate_batch = batch_metric
+
+    if batch_delta:
+        iter_metric.evaluate_delta = _delta_evaluation(batch_factory, batch_delta)
+    elif delta:
+        def moves_delta(base_value: float, idx: NDArray[int], old: NDArray, new: NDArray) -> NDArray[float]:
+            return np.fromiter((delta(base_value, move) for move in map(Move, idx, old, new)),
+                               dtype=np.float64, count=len(idx))
+
+        iter_metric.evaluate_delta = _delta_evaluation(batch_factory, moves_delta)
+
     return iter_metric
 
 
-def custom_metric_parallel(name: str, evaluation: Callable[[TData], float], **kwargs) \
-        -> Callable[[list[TData]], list[SolutionQualityInfo]]:
-    single_factory = partial(SolutionQualityInfo, name=name, float_=evaluation, **kwargs)
-    pool = ThreadPool(4)
+def custom_vectorized_metric(name: str, evaluation: Callable[[NDArray], NDArray[float]],
+                             batch_delta: Callable[[float, NDArray[int], NDArray, NDArray], NDArray[float]]
+                                          | None = None,
+                             **kwargs) \
+        -> Callable[[NDArray | list[NDArray]], list[SolutionQualityInfo]]:
+    """
+    Creates metric, which evaluates all the solutions at once.
+    :param name: Name of the metric.
+    :param evaluation: Function of 2D ndarray (one solution per row), which returns 1D array of their values.
+    :param batch_delta: Optional vectorized incremental evaluation (see `custom_metric`).
+    :param kwargs: Other arguments for `SolutionQualityInfo`.
+    :return: Metric.
+    """
+    single_factory = partial(SolutionQualityInfo, name=name, **kwargs)
+    batch_factory = _batch_factory(name, single_factory, **kwargs)
+
+    def iter_metric(x: NDArray | list[NDArray]) -> list[SolutionQualityInfo]:
+        return batch_metric(x).qualities(x)
+
+    def batch_metric(x: NDArray | list[NDArray]) -> QualityBatch:
+        return batch_factory(evaluation(x if isinstance(x, ndarray) else np.stack(x)))
+
+    iter_metric.evaluate_batch = batch_metric
+    if batch_delta:
+        iter_metric.evaluate_delta = _delta_evaluation(batch_factory, batch_delta)
+
+    return iter_metric
 
-    def iter_metric(x: list[TData]) -> list[SolutionQualityInfo]:
-        return list(pool.map(single_factory, x))
+
+def custom_metric_parallel(name: str, evaluation: Callable[[TData], float],
+                           executor: Literal['process', 'thread'] = 'thread',
+                           max_workers: int | None = 4,
+                           chunksize: int | None = None,
+                           **kwargs) -> ParallelMetric:
+    """
+    Creates metric, which eagerly evaluates solutions in a pool of workers. See `ParallelMetric`.
+    The metric should be closed (or used as a context manager) to shut the pool down.
+    """
+    return ParallelMetric(name, evaluation, executor, max_workers, chunksize, **kwargs)
+
+
+def custom_async_metric(name: str, evaluation: Callable[[TData], Awaitable[float]],
+                        max_concurrency: int = 16, **kwargs) \
+        -> Callable[[Sequence[TData]], Awaitable[list[SolutionQualityInfo]]]:
+    """
+    Creates async metric, which concurrently evaluates every solution with coroutine function `evaluation`
+    (e.g. a request to an evaluation service). Should be used with `TabuSearch.optimize_async`.
+    :param name: Name of the metric.
+    :param evaluation: Async function of single solution data, which returns its value.
+    :param max_concurrency: Maximal number of evaluations, awaited at once (per evaluated batch).
+    :param kwargs: Other arguments for `SolutionQualityInfo`.
+    :return: Async metric.
+    """
+    if max_concurrency < 1:
+        raise ValueError(f'max_concurrency should be positive. Was {max_concurrency}.')
+    single_factory = partial(SolutionQualityInfo, name=name, **kwargs)
+    batch_factory = _batch_factory(name, single_factory, **kwargs)
+
+    async def iter_metric(x: Sequence[TData]) -> list[SolutionQualityInfo]:
+        return (await batch_metric(x)).qualities(x)
+
+    async def batch_metric(x: Sequence[TData]) -> QualityBatch:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded_evaluation(data: TData) -> float:
+            async with semaphore:
+                return await evaluation(data)
+
+        values = await asyncio.gather(*map(bounded_evaluation, x))
+        return batch_factory(np.array(values, dtype=np.float64).reshape(len(values)))
+
+    iter_metric.evaluate_batch_async = batch_metric
 
     return iter_metric
 
+
+def _delta_evaluation(batch_factory: Callable[[NDArray[float]], QualityBatch],
+                      batch_delta: Callable[[float, NDArray[int], NDArray, NDArray], NDArray[float]]) \
+        -> Callable[[float, NDArray[int], NDArray, NDArray], QualityBatch]:
+    """
+    Creates `evaluate_delta` of a metric: evaluates moves as `pivot value + delta` into `QualityBatch`.
+    """
+    def evaluate_delta(base_value: float, idx: NDArray[int], old: NDArray, new: NDArray) -> QualityBatch:
+        return batch_factory(base_value + np.asarray(batch_delta(base_value, idx, old, new), dtype=np.float64))
+
+    return evaluate_delta
+
+
+def _batch_factory(name: str, single_factory: Callable[..., SolutionQualityInfo], minimized: bool | None = False,
+                   **_) -> Callable[[NDArray[float]], QualityBatch]:
+    """
+    Creates factory of metric `QualityBatch`es, which materializes qualities with `single_factory`.
+    """
+    return partial(QualityBatch, name=name, minimized=bool(minimized), quality_factory=single_factory)
@@ -0,0 +1,99 @@
+import numpy as np
+from numpy.typing import NDArray
+
+
+def domination_matrix(scores: NDArray[float]) -> NDArray[bool]:
+    """
+    Pairwise Pareto dominance of the solutions.
+    :param scores: (n_solutions, n_metrics) matrix of metrics float representations (greater is better).
+    :return: (n_solutions, n_solutions) boolean matrix, where `[i, j]` is whether i-th solution dominates j-th one
+      (not worse by every metric and better by some).
+    """
+    n = len(scores)
+    not_worse = np.ones((n, n), dtype=bool)
+    better = np.zeros((n, n), dtype=bool)
+    # accumulated per metric, so that no (n, n, n_metrics) array is allocated
+    for column in np.asarray(scores, dtype=np.float64).T:
+        not_worse &= column[:, np.newaxis] >= column
+        better |= column[:, np.newaxis] > column
+    return not_worse & better
+
+
+def non_dominated_sort(scores: NDArray[float], max_count: int | None = None) -> NDArray[int]:
+    """
+    Fast non-dominated sorting: assigns every solution the index of its Pareto front
+    (0 - non-dominated solutions, 1 - solutions, dominated only by the front 0, etc.).
+    :param scores: (n_solutions, n_metrics) matrix of metrics float representations (greater is better).
+    :param max_count: If passed, the sorting stops, once the sorted fronts contain at least `max_count` solutions.
+      The rest of solutions get rank -1.
+    :return: Front indices of the solutions.
+    """
+    dominates = domination_matrix(scores)
+    domination_count = dominates.sum(axis=0)
+    ranks = np.full(len(scores), -1)
+
+    rank, ranked = 0, 0
+    front = np.flatnonzero(domination_count == 0)
+    while len(front) and (max_count is None or ranked < max_count):
+        ranks[front] = rank
+        ranked += len(front)
+        domination_count = domination_count - dominates[front].sum(axis=0)
+        domination_count[front] = -1
+        front = np.flatnonzero(domination_count == 0)
+        rank += 1
+    return ranks
+
+
+def pareto_front(scores: NDArray[float]) -> NDArray[int]:
+    """
+    Indices of the non-dominated solutions.
+    :param scores: (n_solutions, n_metrics) matrix of metrics float representations (greater is better).
+    """
+    return np.flatnonzero(~domination_matrix(scores).any(axis=0))
+
+
+def pareto_order(scores: NDArray[float], max_count: int | None = None) -> NDArray[int]:
+    """
+    Orders solutions from the best front to the worst one.
+    Solutions of the same front are ordered from the latest to the first (as equal ones in reversed `SortedList`).
+    :param scores: (n_solutions, n_metrics) matrix of metrics float representations (greater is better).
+    :param max_count: If passed, only the first (at least) `max_count` solutions are ordered and returned.
+    :return: Indices of the solutions.
+    """
+    ranks = non_dominated_sort(scores, max_count)[::-1]
+    ranked = np.flatnonzero(ranks >= 0)
+    return len(scores) - 1 - ranked[np.argsort(ranks[ranked], kind='stable')]
+
+
+def crowding_distance(scores: NDArray[float]) -> NDArray[float]:
+    """
+    Crowding distance of the solutions of a front (as in NSGA-II): sum over metrics of the normalized distance
+    between the neighbours of a solution. Boundary solutions get infinite distance.
+    :param scores: (n_solutions, n_metrics) matrix of metrics float representations.
+    """
+    n, n_metrics = scores.shape
+    distance = np.zeros(n)
+    if n <= 2:
+        return np.full(n, np.inf)
+
+    for j in range(n_metrics):
+        order = np.argsort(scores[:, j], kind='stable')
+        column = scores[order, j]
+        distance[order[[0, -1]]] = np.inf
+        if column[-1] > column[0]:
+            distance[order[1:-1]] += (column[2:] - column[:-2]) / (column[-1] - column[0])
+    return distance
+
+
+def hypervolume_contributions(front: NDArray[float], reference: NDArray[float] | tuple[float, float]) -> NDArray[float]:
+    """
+    Exclusive hypervolume contributions of the solutions of a 2-metric front.
+    :param front: (n_solutions, 2) matrix of non-dominated solutions, sorted by ascending first metric
+      (so the second one is descending).
+    :param reference: Reference point, dominated by all the solutions.
+    :return: Area, dominated only by each of the solutions.
+    """
+    x, y = front[:, 0], front[:, 1]
+    previous_x = np.concatenate([[reference[0]], x[:-1]])
+    next_y = np.concatenate([y[1:], [reference[1]]])
+    return (x - previous_x) * (y - next_y)
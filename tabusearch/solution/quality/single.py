@@ -13,19 +13,26 @@ class SolutionQualityInfo(BaseSolutionQualityInfo, Generic[TData]):
                  float_: float | int | Callable[[TData], float],
                  minimized: bool | None = False,
                  value_str: str | Callable[[TData], str] | None = str):
-        value_str = value_str(data) if callable(value_str) else value_str
+        # the function is kept to render qualities like this one (with possibly other data)
+        self._value_str_f = value_str if callable(value_str) else None
+        value_str = partial(value_str, data) if callable(value_str) else value_str
         super().__init__(f'{name}({"min" if minimized else "max"})', value_str)
 
         self._data = data
         self._float_f, self._float_n = (partial(float_, data), NAN) if callable(float_) else (None, float_)
         self._minimized = minimized
 
+    def __getstate__(self):
+        # the evaluation and str functions can be local, so the quality is pickled evaluated and rendered
+        return dict(self.__dict__, _float_f=None, _float_n=self._float, _value_str=self._str,
+                    _value_str_f=None)
+
     def quality_like(self, **kwargs):
         return SolutionQualityInfo(**dict(dict(data=self._data,
                                                name=self.name,
                                                float_=self._float,
                                                minimized=self._minimized,
-                                               value_str=self._str), **kwargs))
+                                               value_str=self._value_str_f or self._str), **kwargs))
 
     @property
     def value(self):
@@ -0,0 +1,143 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Literal, TypeVar
+
+import numpy as np
+
+from tabusearch.mutation.base import MutationBatch
+from tabusearch.solution.base import Solution
+from tabusearch.solution.neighbourhood import Neighbourhood
+from tabusearch.solution.selection import SolutionSelection, RunningTop
+
+TMutations = TypeVar('TMutations', MutationBatch, list)
+
+
+class NeighbourhoodScan(ABC):
+    """
+    Strategy of early-terminated scanning of the neighbourhood, streamed in chunks.
+    Chunks are evaluated lazily, so the neighbours after the termination are not evaluated at all.
+    Generation is terminated early per mutation behaviour only: behaviours after the termination are not mutated,
+    but each mutated behaviour generates (and, for random order, permutes) its full set of mutations.
+    """
+    def __init__(self, order: Literal['random', 'generation'] = 'random',
+                 seed: int | np.random.Generator | None = None):
+        """
+        Initializes neighbourhood scanning.
+        :param order: Order of scanning: random permutation of the neighbourhood or the order of generation.
+        :param seed: Seed or generator of random numbers.
+        """
+        if order not in ('random', 'generation'):
+            raise ValueError(f'Argument order should be "random" or "generation". Was "{order}".')
+        self._shuffled = order == 'random'
+        self._rng = np.random.default_rng(seed)
+
+    def order_behaviours(self, behaviours: list) -> list:
+        """
+        Orders mutation behaviours for scanning.
+        """
+        return [behaviours[i] for i in self._rng.permutation(len(behaviours))] if self._shuffled else behaviours
+
+    def order(self, mutations: TMutations) -> TMutations:
+        """
+        Orders mutations of a single behaviour for scanning.
+        The mutations are already generated, so this is O(len(mutations)) even if few of them are scanned.
+        :param mutations: List of mutations or `MutationBatch`.
+        """
+        if not self._shuffled:
+            return mutations
+        permutation = self._rng.permutation(len(mutations))
+        return mutations.take(permutation) if isinstance(mutations, MutationBatch) \
+            else [mutations[i] for i in permutation]
+
+    def __call__(self, chunks: Iterable[Neighbourhood], pivot: Solution,
+                 selection: SolutionSelection) -> Solution | None:
+        """
+        Scans admissible neighbours and selects one of them.
+        :param chunks: Filtered (admissible) neighbourhood chunks in order of scanning.
+        :param pivot: The current solution.
+        :param selection: Selection, applied to the scanned neighbours.
+        :return: Selected solution or None, if no neighbours were scanned.
+        """
+        top = selection.running_top()
+        threshold = float(pivot.quality)
+        for chunk in chunks:
+            scanned, terminated = self._scan(chunk, threshold, top.size)
+            top.push(scanned)
+            if terminated:
+                break
+        return self._select(top, threshold, selection)
+
+    @abstractmethod
+    def _scan(self, chunk: Neighbourhood, threshold: float, scanned: int) -> tuple[Neighbourhood, bool]:
+        """
+        Scans next chunk.
+        :param chunk: Admissible neighbours.
+        :param threshold: Score of the current solution.
+        :param scanned: Number of neighbours, scanned before the chunk.
+        :return: Scanned part of the chunk and whether the scanning is terminated.
+        """
+        ...
+
+    def _select(self, top: RunningTop, threshold: float, selection: SolutionSelection) -> Solution | None:
+        return selection.select_top(top)
+
+
+class FirstImprovementScan(NeighbourhoodScan):
+    """
+    Selects the first admissible neighbour, which is better than the current solution.
+    If there is no such neighbour, selects from the whole neighbourhood.
+    """
+    def _scan(self, chunk: Neighbourhood, threshold: float, scanned: int) -> tuple[Neighbourhood, bool]:
+        improving = np.flatnonzero(chunk.qualities.scores > threshold)
+        if len(improving):
+            return chunk.take(improving[:1]), True
+        return chunk, False
+
+    def _select(self, top: RunningTop, threshold: float, selection: SolutionSelection) -> Solution | None:
+        neighbourhood = top.neighbourhood
+        if neighbourhood is not None and len(neighbourhood) and neighbourhood.qualities.scores[-1] > threshold:
+            # the improving neighbour is always the last pushed one
+            return neighbourhood.solution(len(neighbourhood) - 1)
+        return super()._select(top, threshold, selection)
+
+
+class AspirationPlusScan(NeighbourhoodScan):
+    """
+    Aspiration plus strategy: after the first admissible neighbour, better than the current solution, is found,
+    scans `plus` more neighbours and selects from all the scanned ones.
+    The number of scanned neighbours is bounded by `min_candidates` and `max_candidates`.
+    """
+    def __init__(self, plus: int, min_candidates: int = 0, max_candidates: int | None = None,
+                 order: Literal['random', 'generation'] = 'random',
+                 seed: int | np.random.Generator | None = None):
+        """
+        Initializes aspiration plus scanning.
+        :param plus: Number of neighbours to scan after the first improving one.
+        :param min_candidates: Minimal number of neighbours to scan.
+        :param max_candidates: Maximal number of neighbours to scan (unbounded by default).
+        :param order: See `NeighbourhoodScan`.
+        :param seed: See `NeighbourhoodScan`.
+        """
+        if plus < 0 or min_candidates < 0 or max_candidates is not None and max_candidates < max(min_candidates, 1):
+            raise ValueError('Scanning bounds should be non-negative and max_candidates should be positive'
+                             f' and not less than min_candidates. Were {plus}, {min_candidates}, {max_candidates}.')
+        super().__init__(order, seed)
+        self._plus = plus
+        self._min_candidates = min_candidates
+        self._max_candidates = max_candidates
+
+        self._limit: int | None = None
+
+    def __call__(self, chunks: Iterable[Neighbourhood], pivot: Solution,
+                 selection: SolutionSelection) -> Solution | None:
+        self._limit = self._max_candidates
+        return super().__call__(chunks, pivot, selection)
+
+    def _scan(self, chunk: Neighbourhood, threshold: float, scanned: int) -> tuple[Neighbourhood, bool]:
+        improving = np.flatnonzero(chunk.qualities.scores > threshold)
+        if len(improving):
+            limit = max(scanned + improving[0] + 1 + self._plus, self._min_candidates)
+            self._limit = limit if self._limit is None else min(self._limit, limit)
+
+        if self._limit is not None and scanned + len(chunk) >= self._limit:
+            return chunk.take(np.arange(self._limit - scanned)), True
+        return chunk, False
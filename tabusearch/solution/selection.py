@@ -1,23 +1,49 @@
-from operator import itemgetter
-from typing import Callable
+from heapq import nlargest
+from operator import itemgetter, attrgetter
+from typing import Callable, Iterable
+
+import numpy as np
 
 from sortedcontainers import SortedList
 
 from tabusearch.solution.base import Solution
+from tabusearch.solution.neighbourhood import Neighbourhood
+from tabusearch.solution.quality.pareto import pareto_order
+
+
+def select_best(_: int) -> int:
+    """
+    Index selector, which always selects the best solution.
+    """
+    return 0
 
 
 class SolutionSelection:
     _idx_selector: Callable[[int], int]
+    _max_idx: int | None
 
-    def __init__(self, idx_selector: Callable[[int], int] = None):
+    def __init__(self, idx_selector: Callable[[int], int] = None, max_idx: int | None = None):
         """
         Initializes solution selection strategy.
         :param idx_selector: A function to select solution from the best.
         It takes length of solution space and returns an index of solution to select
         (0 - actual best with higher quality, 1 - second best, etc.).
         Defaults to selection of the best solution.
+        :param max_idx: The maximal index, `idx_selector` can return (greater indices are clamped to it).
+        If known, only `max_idx + 1` best solutions are selected from the solution space instead of sorting it.
+        Defaults to 0 for the default `idx_selector`, otherwise, to None (unknown).
+        """
+        assert max_idx is None or max_idx >= 0, f'max_idx should be non-negative, was {max_idx}.'
+
+        self._idx_selector = idx_selector if idx_selector is not None else select_best
+        self._max_idx = max_idx if idx_selector is not None else 0
+
+    @property
+    def max_idx(self) -> int | None:
         """
-        self._idx_selector = idx_selector if idx_selector is not None else lambda: 0
+        The maximal index, the selection can return, if known.
+        """
+        return self._max_idx
 
     def __call__(self, solutions: SortedList[Solution]) -> Solution:
         """
@@ -26,3 +52,107 @@ class SolutionSelection:
         :return: The "best" solution in the collection.
         """
         return itemgetter(self._idx_selector(len(solutions)))(list(reversed(solutions)))
+
+    def select(self, solutions: Iterable[Solution] | Neighbourhood) -> Solution | None:
+        """
+        Selects the "best" solution from unordered `solutions`.
+        If `max_idx` is known, only the top of solutions is selected in linear time, otherwise, solutions are sorted.
+        :param solutions: Collection of `Solution` objects or columnar `Neighbourhood`.
+          Only the selected solution is materialized from `Neighbourhood`.
+        :return: The "best" solution in the collection or None, if it is empty.
+        """
+        if isinstance(solutions, Neighbourhood):
+            return self._select_columnar(solutions)
+
+        solutions = solutions if isinstance(solutions, list) else list(solutions)
+        if not solutions:
+            return None
+        if self._max_idx is None:
+            return self(SortedList(solutions, key=attrgetter('quality')))
+
+        idx = min(self._idx_selector(len(solutions)), self._max_idx)
+        # reversed - to order solutions of equal quality as in reversed SortedList (the latest first)
+        top = nlargest(idx + 1, reversed(solutions), key=attrgetter('quality'))
+        return top[min(idx, len(top) - 1)]
+
+    def select_stream(self, chunks: Iterable[Neighbourhood]) -> Solution | None:
+        """
+        Selects the "best" solution from the neighbourhood, streamed in chunks.
+        Only running top of `max_idx + 1` solutions is kept, so `max_idx` should be known.
+        :param chunks: Columnar neighbourhoods of the chunks.
+        :return: The "best" solution in the chunks or None, if they are empty.
+        """
+        top = self.running_top()
+        for chunk in chunks:
+            top.push(chunk)
+        return self.select_top(top)
+
+    def running_top(self) -> 'RunningTop':
+        """
+        Creates running top of streamed solutions, which is enough to select from them.
+        """
+        assert self._max_idx is not None, 'Streaming selection requires known max_idx.'
+        return RunningTop(self._max_idx + 1)
+
+    def select_top(self, top: 'RunningTop') -> Solution | None:
+        """
+        Selects the "best" solution from the streamed solutions, kept by `top` (see `running_top`).
+        """
+        if not top.size:
+            return None
+        return self._select_columnar(top.neighbourhood, top.size)
+
+    def _select_columnar(self, neighbourhood: Neighbourhood, size: int | None = None) -> Solution | None:
+        if not len(neighbourhood):
+            return None
+
+        idx = self._idx_selector(size or len(neighbourhood))
+        if self._max_idx is not None:
+            idx = min(idx, self._max_idx)
+        top = neighbourhood.qualities.top(idx + 1)
+        return neighbourhood.solution(top[min(idx, len(top) - 1)])
+
+
+class ParetoSolutionSelection(SolutionSelection):
+    """
+    Selection of solutions with qualities, compared per metric (see `per_metric_comparison_aggregation`),
+    which are not totally ordered, so cannot be sorted.
+    Solutions are ordered by non-dominated sorting of their metrics matrix instead:
+    Pareto front first, solutions of the same front - from the latest to the first.
+    If `max_idx` is known, only the fronts, containing `max_idx + 1` solutions, are sorted.
+    """
+    def select(self, solutions: Iterable[Solution]) -> Solution | None:
+        solutions = solutions if isinstance(solutions, list) else list(solutions)
+        if not solutions:
+            return None
+
+        idx = self._idx_selector(len(solutions))
+        if self._max_idx is not None:
+            idx = min(idx, self._max_idx)
+        order = pareto_order(np.stack([solution.quality.floats for solution in solutions]), idx + 1)
+        return solutions[order[min(idx, len(order) - 1)]]
+
+
+class RunningTop:
+    """
+    Running top-k of a neighbourhood, streamed in chunks.
+    """
+    k: int
+    size: int
+    neighbourhood: Neighbourhood | None
+
+    def __init__(self, k: int):
+        self.k = k
+        self.size = 0
+        self.neighbourhood = None
+
+    def push(self, chunk: Neighbourhood):
+        """
+        Accounts next chunk of the neighbourhood.
+        """
+        self.size += len(chunk)
+        top = chunk if self.neighbourhood is None else Neighbourhood.concatenate([self.neighbourhood, chunk])
+        if len(top) > self.k:
+            # keep the generation order, so that solutions of equal quality are ordered as in whole neighbourhood
+            top = top.take(np.sort(top.qualities.top(self.k)))
+        self.neighbourhood = top
@@ -1,12 +1,16 @@
 from _operator import attrgetter
 from abc import ABC
-from copy import copy
-from typing import Generic, Iterable, Callable
+from itertools import count
+from typing import Generic, Generator, Iterable, Iterator, Callable
 
+import numpy as np
 from sortedcontainers import SortedList
 
 from tabusearch.convergence import IterativeConvergence
 from tabusearch.convergence.base import ConvergenceCriterion
+from tabusearch.history import HistoryRecorder, SolutionHistory
+from tabusearch.instrumentation import SearchObserver
+from tabusearch.memory.archive import ParetoArchive
 from tabusearch.memory.filtering.base import BaseFilteringMemoryCriterion
 from tabusearch.memory.filtering.aspiration import AspirationCriterion, AspirationBoundType
 from tabusearch.memory.filtering.tabu import TabuList
@@ -14,12 +18,15 @@ from tabusearch.memory.evaluating.base import BaseEvaluatingMemoryCriterion
 from tabusearch.mutation.base import MutationBehaviour
 from tabusearch.solution.base import Solution
 from tabusearch.solution.factory import SolutionFactory
+from tabusearch.solution.neighbourhood import Neighbourhood
 from tabusearch.solution.quality.aggregated import BaseAggregatedSolutionQualityInfo
 from tabusearch.solution.quality.base import BaseSolutionQualityInfo
+from tabusearch.solution.quality.cache import QualityCache
 from tabusearch.solution.quality.single import SolutionQualityInfo
+from tabusearch.solution.scanning import NeighbourhoodScan
 from tabusearch.solution.quality.lib.aggregated import normalized_weighted_metrics_aggregation
 from tabusearch.solution.quality.lib.complex import complex_metric
-from tabusearch.solution.selection import SolutionSelection
+from tabusearch.solution.selection import SolutionSelection, ParetoSolutionSelection
 from tabusearch.typing_ import TData
 
 
@@ -29,19 +36,22 @@ from tabusearch.typing_ import TData
 class TabuSearch(ABC, Generic[TData]):
     hall_of_fame_size: int
 
-    hall_of_fame: SortedList[Solution[TData]]  # sorted by ascending quality
+    hall_of_fame: SortedList[Solution[TData]] | ParetoArchive[TData]  # sorted by ascending quality (first metric)
     convergence_criterion: ConvergenceCriterion
     solution_factory: SolutionFactory[TData]
     mutation_behaviour: Iterable[MutationBehaviour[TData]]
     aspiration: AspirationCriterion
-    tabu: TabuList
+    tabu: BaseFilteringMemoryCriterion
     solution_selection: SolutionSelection
+    columnar_evaluation: bool
+    streaming_chunk_size: int | None
+    scan: NeighbourhoodScan | None
+    history: HistoryRecorder
+    observers: list[SearchObserver]
 
     _filtering_memory: BaseFilteringMemoryCriterion
     _evaluating_memory: list[BaseEvaluatingMemoryCriterion]
 
-    _history: list
-
     # TODO: consider further ctor conveniences
     def __init__(self, mutation_behaviour: MutationBehaviour | list[MutationBehaviour],
                  metric: Callable[[list[TData]], list[SolutionQualityInfo]]
@@ -50,19 +60,32 @@ class TabuSearch(ABC, Generic[TData]):
                  convergence_criterion: ConvergenceCriterion | int = 100,
                  tabu_time: Callable[[Solution[TData]], int] | int = 5,
                  aspiration_bound_type: AspirationBoundType = AspirationBoundType.Greater,
-                 selection: Callable[[], int] | None = None,
+                 selection: Callable[[int], int] | None = None,
                  metric_aggregation: Callable[[Iterable[Iterable[BaseSolutionQualityInfo]]],
                                               Iterable[BaseAggregatedSolutionQualityInfo]]
                                      | None = None,
                  additional_evaluation: list[BaseEvaluatingMemoryCriterion] | None = None,
                  additional_evaluation_weights: list[float] | None = None,
-                 use_simple_solution_ids: bool = False):
+                 use_simple_solution_ids: bool = False,
+                 evaluation_cache: QualityCache | None = None,
+                 tabu_memory: BaseFilteringMemoryCriterion | None = None,
+                 selection_depth: int | None = None,
+                 columnar_evaluation: bool = False,
+                 streaming_chunk_size: int | None = None,
+                 scan: NeighbourhoodScan | None = None,
+                 history: HistoryRecorder | None = None,
+                 pareto_selection: bool = False,
+                 pareto_archive: ParetoArchive | None = None,
+                 observers: list[SearchObserver] | None = None):
         assert not isinstance(metric, Iterable) or metric_aggregation, \
             'Should provide metrics_aggregation, if passing several items in metric arg.'
 
         self.hall_of_fame_size = hall_of_fame_size
 
-        self.hall_of_fame = SortedList(key=attrgetter('quality'))
+        # qualities of Pareto selection are partially ordered, so they can't be kept in a sorted list
+        if pareto_archive is None and pareto_selection:
+            pareto_archive = ParetoArchive()
+        self.hall_of_fame = pareto_archive if pareto_archive is not None else SortedList(key=attrgetter('quality'))
         # TODO: move convergence to arguments
         self.convergence_criterion = IterativeConvergence(convergence_criterion) \
             if isinstance(convergence_criterion, int) \
@@ -74,7 +97,8 @@ class TabuSearch(ABC, Generic[TData]):
             metric = (metric,)
         self.solution_factory = SolutionFactory(*metric,
                                                 metrics_aggregation=metric_aggregation,
-                                                use_simple_ids=use_simple_solution_ids)
+                                                use_simple_ids=use_simple_solution_ids,
+                                                cache=evaluation_cache)
         if additional_evaluation:
             if not additional_evaluation_weights \
                     or len(additional_evaluation) != len(additional_evaluation_weights) \
@@ -92,52 +116,202 @@ class TabuSearch(ABC, Generic[TData]):
                                                                                 *additional_evaluation_weights])))
 
         self.aspiration = AspirationCriterion(aspiration_bound_type)
-        self.tabu = TabuList(tabu_time)
-        self.solution_selection = SolutionSelection(selection or (lambda _: 0))
+        self.tabu = tabu_memory or TabuList(tabu_time)
+        self.solution_selection = (ParetoSolutionSelection if pareto_selection else SolutionSelection)(
+            selection, selection_depth)
+        if pareto_selection and (columnar_evaluation or streaming_chunk_size is not None):
+            raise ValueError('Pareto selection does not support columnar and streaming evaluation.')
+        if additional_evaluation and (columnar_evaluation or streaming_chunk_size is not None):
+            # the additional evaluation layer aggregates qualities, which are not ordered by their float representation
+            raise ValueError('Additional evaluation does not support columnar and streaming evaluation.')
+        self.columnar_evaluation = columnar_evaluation
+        self.streaming_chunk_size = streaming_chunk_size
+        if streaming_chunk_size is not None and self.solution_selection.max_idx is None:
+            raise ValueError('Streaming evaluation requires selection_depth for custom selection.')
+        self.scan = scan
+        if scan is not None and streaming_chunk_size is None:
+            raise ValueError('Neighbourhood scanning requires streaming_chunk_size.')
+        self.history = history if history is not None else SolutionHistory()
+        self.observers = list(observers) if observers else []
 
     @property
     def filtering_memory_criterion(self):
         if not hasattr(self, '_filtering_memory') or self._filtering_memory is None:
-            self._filtering_memory = self.tabu.unite(self.aspiration)
+            self._filtering_memory = self.tabu.otherwise(self.aspiration)
         return self._filtering_memory
 
     def optimize(self, x0: TData) -> Solution[TData]:
-        # TODO: move to memorize_move
-        history = []
+        for _ in self.iterate(x0):
+            pass
+
+        return self.hall_of_fame[-1]
+
+    def iterate(self, x0: TData) -> Generator[Solution[TData], Solution[TData] | None, None]:
+        """
+        Runs the search step by step until convergence.
+        Yields the current solution: the initial one and then the one after every iteration.
+        A solution, sent to the generator, replaces the current one and is memorized as a move
+        (e.g., to restart the search from an elite solution).
+        :param x0: Initial solution data.
+        """
+        # observers are checked once, so that the search without them has no instrumentation overhead
+        observed = bool(self.observers)
+        get_neighbours = self._get_observed_neighbours if observed else self.get_neighbours
+
+        self.history.reset()
+        try:
+            x = self.solution_factory.initial(x0)
+            self.history.record(x)
 
-        x = self.solution_factory.initial(x0)
-        history.append(copy(x))
+            for iteration in count():
+                restart = yield x
+                if restart is not None:
+                    x = restart
+                    self.memorize_move(x)
 
-        while True:
-            neighbours = self.get_neighbours(x)
-            choice = self.choose(neighbours)
-            if choice is not None:
-                x = choice
-                self.memorize_move(x)
+                if observed:
+                    self._notify('on_iteration_start', iteration, x)
+                x, converged = self._advance(x, get_neighbours(x), observed)
+                if converged:
+                    break
+        finally:
+            self.history.close()
 
-            # Memorize None, if choice failed
-            history.append(copy(choice))
+    async def optimize_async(self, x0: TData) -> Solution[TData]:
+        """
+        Like `optimize`, but supports async metrics (`async def metric(x)`, e.g. created with `custom_async_metric`),
+        evaluating each neighbourhood concurrently. Streaming evaluation is not supported.
+        :param x0: Initial solution data.
+        """
+        if self.streaming_chunk_size is not None:
+            raise ValueError('Async optimization does not support streaming_chunk_size.')
 
-            if self.converged(x):
-                break
+        observed = bool(self.observers)
+
+        self.history.reset()
+        try:
+            x = await self.solution_factory.initial_async(x0)
+            self.history.record(x)
+
+            for iteration in count():
+                if observed:
+                    self._notify('on_iteration_start', iteration, x)
+                x, converged = self._advance(x, await self.get_neighbours_async(x), observed)
+                if converged:
+                    break
+        finally:
+            self.history.close()
 
-        self._history = history
         return self.hall_of_fame[-1]
 
-    def get_neighbours(self, x: Solution) -> Iterable[Solution]:
-        generated = [(behaviour.mutation_type, behaviour.mutate(x)) for behaviour in self.mutation_behaviour]
-        solutions = self.solution_factory(generated)
-        return self.filtering_memory_criterion.filter(solutions)
+    def _advance(self, x: Solution[TData], neighbours: Iterable[Solution] | Neighbourhood | Iterator[Neighbourhood],
+                 observed: bool) -> tuple[Solution[TData], bool]:
+        """
+        Iteration step, shared by `iterate` and `optimize_async`: chooses the next solution among the neighbours of `x`,
+        memorizes and records it.
+        :return: The current solution after the step and whether the search is converged.
+        """
+        choice = self.choose(neighbours, x)
+        if observed:
+            self._notify('on_selected', choice)
+        if choice is not None:
+            x = choice
+            self.memorize_move(x)
+
+        # Memorize None, if choice failed
+        self.history.record(choice)
+
+        converged = self.converged(x)
+        if converged and observed:
+            self._notify('on_converged', x)
+        return x, converged
+
+    async def get_neighbours_async(self, x: Solution) -> Iterable[Solution] | Neighbourhood:
+        """
+        Like `get_neighbours`, but evaluates the neighbourhood with async metrics.
+        """
+        generated = self._generate(x)
+        filter_ = self._filter
+        if self.observers:
+            self._notify('on_neighbours_generated', generated)
+            filter_ = self._observed_filter
 
-    def choose(self, neighbours: Iterable[Solution]) -> Solution:
-        neighbours = SortedList(neighbours, key=attrgetter('quality'))
-        return self.solution_selection(neighbours) if neighbours else None
+        if self.columnar_evaluation:
+            return filter_(await self.solution_factory.neighbourhood_async(generated, pivot=x))
+        return filter_(await self.solution_factory.call_async(generated, pivot=x))
+
+    def get_neighbours(self, x: Solution) -> Iterable[Solution] | Neighbourhood | Iterator[Neighbourhood]:
+        generated = self._generate(x)
+        if self.streaming_chunk_size is not None:
+            return (self._filter(chunk)
+                    for chunk in self.solution_factory.stream(generated, self.streaming_chunk_size, pivot=x))
+        if self.columnar_evaluation:
+            return self._filter(self.solution_factory.neighbourhood(generated, pivot=x))
+        return self._filter(self.solution_factory(generated, pivot=x))
+
+    def _get_observed_neighbours(self, x: Solution) -> Iterable[Solution] | Neighbourhood | Iterator[Neighbourhood]:
+        """
+        Like `get_neighbours`, but notifies the observers after generation, evaluation and filtering.
+        """
+        generated = self._generate(x)
+        self._notify('on_neighbours_generated', generated)
+        if self.streaming_chunk_size is not None:
+            return (self._observed_filter(chunk)
+                    for chunk in self.solution_factory.stream(generated, self.streaming_chunk_size, pivot=x))
+        if self.columnar_evaluation:
+            return self._observed_filter(self.solution_factory.neighbourhood(generated, pivot=x))
+        return self._observed_filter(self.solution_factory(generated, pivot=x))
+
+    def _generate(self, x: Solution) -> list[tuple[str, list | object]] | Iterator[tuple[str, list | object]]:
+        """
+        Mutations of `x` along with names of their generators. Lazy (and ordered by the scan, if any) for streaming.
+        """
+        if self.streaming_chunk_size is None:
+            return [(behaviour.mutation_type, behaviour.mutate(x)) for behaviour in self.mutation_behaviour]
+        if self.scan is None:
+            return ((behaviour.mutation_type, behaviour.mutate(x)) for behaviour in self.mutation_behaviour)
+        return ((behaviour.mutation_type, self.scan.order(behaviour.mutate(x)))
+                for behaviour in self.scan.order_behaviours(list(self.mutation_behaviour)))
+
+    def _filter(self, neighbours: list[Solution] | Neighbourhood) -> list[Solution] | Neighbourhood:
+        if isinstance(neighbours, Neighbourhood):
+            return neighbours.take(self.filtering_memory_criterion.mask(neighbours))
+        return self.filtering_memory_criterion.filter(neighbours)
+
+    def _observed_filter(self, neighbours: list[Solution] | Neighbourhood) -> list[Solution] | Neighbourhood:
+        self._notify('on_evaluated', neighbours)
+        admissible = self._filter(neighbours)
+        self._notify('on_filtered', admissible)
+        return admissible
+
+    def _notify(self, hook: str, *args):
+        for observer in self.observers:
+            getattr(observer, hook)(self, *args)
+
+    def choose(self, neighbours: Iterable[Solution] | Neighbourhood | Iterator[Neighbourhood],
+               pivot: Solution | None = None) -> Solution:
+        if self.scan is not None:
+            return self.scan(neighbours, pivot, self.solution_selection)
+        if self.streaming_chunk_size is not None:
+            return self.solution_selection.select_stream(neighbours)
+        return self.solution_selection.select(neighbours)
 
     def memorize_move(self, move: Solution):
-        self._filtering_memory.memorize(move)
-        self.hall_of_fame.add(move)
+        if isinstance(move.position, np.ndarray) and move.position.base is not None:
+            # detach the chosen neighbour from the batch matrix, so that the whole batch is not kept in memory
+            move.position = move.position.copy()
+
+        self.filtering_memory_criterion.memorize(move)
+        self.add_to_hall_of_fame(move)
+
+    def add_to_hall_of_fame(self, solution: Solution):
+        """
+        Adds solution to the hall of fame, dropping the worst solution, if it is overflowed.
+        Pareto archive keeps only non-dominated solutions and is bounded by its own capacity.
+        """
+        self.hall_of_fame.add(solution)
 
-        if len(self.hall_of_fame) > self.hall_of_fame_size:
+        if not isinstance(self.hall_of_fame, ParetoArchive) and len(self.hall_of_fame) > self.hall_of_fame_size:
             self.hall_of_fame.pop(0)
 
     def converged(self, move: Solution):
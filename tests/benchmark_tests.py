@@ -0,0 +1,17 @@
+from benchmarks.suite import cases, main, regressions, run
+
+
+def test_benchmark_cases_run():
+    timings = run(quick=True, min_time=0., repeat=1)
+
+    assert set(timings) == {case.id for case in cases(quick=True)}
+    assert all(seconds > 0 for seconds in timings.values())
+
+
+def test_regressions_are_detected(tmp_path):
+    assert regressions({'a': 1.3, 'b': 1.1, 'c': 5.}, {'a': 1., 'b': 1.}, 0.25) == {'a': 1.3}
+
+    baseline = tmp_path / 'baseline.json'
+    assert main(['--quick', '--filter', 'choose', '--min-time', '0', '--repeat', '1', '--save', str(baseline)]) == 0
+    assert main(['--quick', '--filter', 'choose', '--min-time', '0', '--repeat', '1',
+                 '--compare', str(baseline), '--tolerance', '1000']) == 0
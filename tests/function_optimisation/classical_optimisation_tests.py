@@ -15,7 +15,7 @@ from matplotlib import pyplot as plt
 from tabusearch.mutation.neighbourhood import NearestNeighboursMutation, FullAxisShiftMutation
 from tabusearch.solution.quality.lib import custom_metric
 from tabusearch import TabuSearch
-from tabusearch.solution.base import Solution
+from tabusearch.history import SolutionHistory
 from experiments.function_optimisation.functions import rosenbrock, styblinski_tang, mccormick, michalewicz, zakharov
 
 DEFAULT_TEST_SIZE = 10
@@ -58,7 +58,7 @@ def test_optimisation(setup_func_x0):
                            tabu_time=np.prod(x0.shape),
                            selection=lambda collection_len: min(expon.rvs(size=1).astype(int)[0], collection_len - 1))
     s = optimiser.optimize(x0)
-    h: list[Solution] = optimiser._history
+    h: SolutionHistory = optimiser.history
     print('\n', s.position)
     print(s.quality)
     fig, ax = plt.subplots()
@@ -0,0 +1,96 @@
+import csv
+import pickle
+
+import numpy as np
+import pytest
+
+from tabusearch import TabuSearch
+from tabusearch.history import HistoryRecorder, NoHistory, SolutionHistory, ColumnarHistory, StreamingHistory
+from tabusearch.mutation.neighbourhood import NearestNeighboursMutation, FullAxisShiftMutation
+from tabusearch.solution.quality.lib import custom_metric, per_metric_comparison_aggregation
+
+
+def optimize(history: HistoryRecorder | None = None, iterations: int = 30) -> TabuSearch:
+    search = TabuSearch([NearestNeighboursMutation(), FullAxisShiftMutation()],
+                        custom_metric('sq', lambda x: (x ** 2).sum(), minimized=True),
+                        convergence_criterion=iterations, tabu_time=3, history=history)
+    search.optimize(np.array([7, -5, 3]))
+    return search
+
+
+def expected_records(solutions: list) -> list[tuple]:
+    return [(i, np.nan, None, False) if s is None else (i, float(s.quality), s.id.parent_name, True)
+            for i, s in enumerate(solutions)]
+
+
+def as_tuples(records: np.ndarray, history: ColumnarHistory) -> list[tuple]:
+    return [(i, q, history.move_name(m), a) for i, q, m, a in records.tolist()]
+
+
+def read_records(history: StreamingHistory) -> list[tuple]:
+    if history.path.suffix == '.npy':
+        # the file is read back without the recorder, as after the process exit
+        move_names = StreamingHistory.load_move_names(history.path)
+        return [(i, q, move_names[m] if m >= 0 else None, a)
+                for i, q, m, a in StreamingHistory.load(history.path).tolist()]
+    with open(history.path, newline='') as file:
+        return [(int(r['iteration']), float(r['quality']), r['move'] or None, r['accepted'] == 'True')
+                for r in csv.DictReader(file)]
+
+
+def test_solution_history_is_kept_by_default():
+    search = optimize()
+
+    assert isinstance(search.history, SolutionHistory)
+    assert len(search.history) == search.history.iterations == 31
+    assert str(search.history[0].id) == 'Init'
+    assert [s.quality.value for s in search.history[-2:]] == [s.quality.value for s in list(search.history)[-2:]]
+
+
+def test_ring_history_keeps_last_solutions():
+    full = optimize()
+    ring = optimize(SolutionHistory(5))
+
+    assert len(ring.history) == 5 and ring.history.iterations == 31
+    assert [str(s.id) for s in ring.history] == [str(s.id) for s in full.history[-5:]]
+
+
+def test_no_history_only_counts_iterations():
+    search = optimize(NoHistory())
+    assert search.history.iterations == 31
+
+
+def test_columnar_history_equals_solution_history():
+    solutions = list(optimize().history)
+    search = optimize(ColumnarHistory(initial_capacity=4))
+
+    np.testing.assert_equal(as_tuples(search.history.records, search.history), expected_records(solutions))
+    assert search.history.move_names[0] == 'Init'
+    assert set(search.history.move_names[1:]) <= {'NN', 'FullShift'}
+
+
+def test_columnar_history_of_aggregated_qualities():
+    search = TabuSearch(NearestNeighboursMutation(),
+                        [custom_metric('close_to_2', lambda x: abs(x - 2).sum(), minimized=True),
+                         custom_metric('close_to_5', lambda x: abs(x - 5).sum(), minimized=True)],
+                        metric_aggregation=per_metric_comparison_aggregation('pareto'),
+                        convergence_criterion=5, tabu_time=2, pareto_selection=True, history=ColumnarHistory())
+    search.optimize(np.array([-3, 9]))
+
+    # aggregated qualities have no float order, so only the moves are recorded
+    records = search.history.records
+    assert len(records) == 6 and np.isnan(records['quality']).all() and records['accepted'].all()
+
+
+@pytest.mark.parametrize('file_format', ['csv', 'npy'])
+def test_streaming_history_writes_all_records(tmp_path, file_format):
+    solutions = list(optimize().history)
+    history = StreamingHistory(tmp_path / f'history.{file_format}', file_format, chunk_size=7)
+    optimize(history)
+
+    assert len(history) == 31 and len(history.records) <= 7
+    np.testing.assert_equal(read_records(history), expected_records(solutions))
+
+    # the recorder is picklable and rewrites the file on the next run
+    optimize(pickle.loads(pickle.dumps(history)), iterations=3)
+    assert len(read_records(history)) == 4
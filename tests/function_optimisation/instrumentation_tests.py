@@ -0,0 +1,96 @@
+import re
+
+import numpy as np
+import pytest
+
+from tabusearch import TabuSearch
+from tabusearch.history import NoHistory
+from tabusearch.instrumentation import SearchObserver, SearchProfiler
+from tabusearch.mutation.neighbourhood import NearestNeighboursMutation, FullAxisShiftMutation
+from tabusearch.solution.quality.cache import QualityCache
+from tabusearch.solution.quality.lib import custom_metric
+
+
+class EventLog(SearchObserver):
+    def __init__(self):
+        self.events = []
+
+    def on_iteration_start(self, search, iteration, x):
+        self.events.append(('start', iteration))
+
+    def on_neighbours_generated(self, search, generated):
+        self.events.append(('generated',))
+
+    def on_evaluated(self, search, neighbours):
+        self.events.append(('evaluated', len(neighbours)))
+
+    def on_filtered(self, search, admissible):
+        self.events.append(('filtered', len(admissible)))
+
+    def on_selected(self, search, choice):
+        self.events.append(('selected', choice is not None))
+
+    def on_converged(self, search, x):
+        self.events.append(('converged',))
+
+
+def search(columnar: bool = False, streaming: bool = False, observers: list | None = None, **kwargs) -> TabuSearch:
+    return TabuSearch([NearestNeighboursMutation(columnar), FullAxisShiftMutation(columnar)],
+                      custom_metric('sq', lambda x: (x ** 2).sum(), minimized=True),
+                      convergence_criterion=10, tabu_time=3, columnar_evaluation=columnar,
+                      streaming_chunk_size=4 if streaming else None, observers=observers,
+                      history=NoHistory(), **kwargs)
+
+
+@pytest.mark.parametrize('columnar, streaming', [(False, False), (True, False), (True, True)])
+def test_hooks_are_called_in_order(columnar, streaming):
+    log = EventLog()
+    search(columnar, streaming, [log]).optimize(np.array([7, -5, 3]))
+
+    names = [event[0] for event in log.events]
+    assert names[-1] == 'converged' and names.count('start') == names.count('selected') == 10
+    assert [event[1] for event in log.events if event[0] == 'start'] == list(range(10))
+    iterations = ' '.join(names[:-1]).split('start')[1:]
+    assert all(re.fullmatch(r'generated( evaluated filtered)+ selected', it.strip()) for it in iterations)
+
+
+@pytest.mark.parametrize('columnar, streaming', [(False, False), (True, False), (True, True)])
+def test_profiler_counters(columnar, streaming):
+    profiler = SearchProfiler()
+    optimiser = search(columnar, streaming, [profiler])
+    best = optimiser.optimize(np.array([7, -5, 3]))
+    plain = search(columnar, streaming).optimize(np.array([7, -5, 3]))
+
+    counters = profiler.counters
+    assert np.array_equal(best.position, plain.position)
+    assert counters['iterations'] == 10 and counters['neighbours'] == 10 * 8
+    assert counters['admissible'] + counters['tabu_hits'] - counters['aspiration_overrides'] == counters['neighbours']
+    assert counters['tabu_hits'] > 0 and counters['aspiration_overrides'] <= counters['tabu_hits']
+    assert all(seconds >= 0 for seconds in profiler.timers.values()) and sum(profiler.timers.values()) > 0
+
+
+def test_profiler_counts_cache_usage():
+    profiler = SearchProfiler()
+    search(observers=[profiler], evaluation_cache=QualityCache()).optimize(np.array([7, -5, 3]))
+
+    counters = profiler.counters
+    # revisited positions are evaluated once
+    assert counters['cache_hits'] > 0 and counters['cache_hits'] + counters['cache_misses'] == counters['neighbours']
+
+
+def test_profiler_export():
+    ticks = iter(range(1000))
+    profiler = SearchProfiler(clock=lambda: float(next(ticks)))
+    search(observers=[profiler]).optimize(np.array([7, -5, 3]))
+
+    summary = profiler.summary()
+    assert summary['counters'] == profiler.counters and set(summary['timers']) == \
+           {'mutation', 'evaluation', 'filtering', 'selection'}
+    # every phase takes one tick of the clock
+    assert summary['timers']['mutation'] == summary['timers']['selection'] == 10
+
+    text = profiler.prometheus('ts')
+    assert 'ts_phase_seconds_total{phase="selection"} 10.0\n' in text
+    assert 'ts_iterations_total 10\n' in text and '# TYPE ts_tabu_hits_total counter\n' in text
+    samples = [line for line in text.splitlines() if not line.startswith('#')]
+    assert len(samples) == len(summary['timers']) + len(summary['counters'])
@@ -0,0 +1,146 @@
+import os
+import pickle
+import queue
+import threading
+from functools import partial
+from itertools import count
+
+import numpy as np
+import pytest
+
+from tabusearch import TabuSearch
+from tabusearch.memory.filtering.attribute import AttributeTabuList
+from tabusearch.memory.filtering.tabu import TabuList
+from tabusearch.mutation.neighbourhood import NearestNeighboursMutation
+from tabusearch.parallel import ParallelTabuSearch, CooperativeTabuSearch, _Exchange, _run_cooperatively
+from tabusearch.solution.factory import SolutionFactory
+from tabusearch.solution.id import SolutionId
+from tabusearch.solution.quality.lib import custom_metric
+from tabusearch.solution.selection import SolutionSelection
+
+
+def create_search(iterations: int) -> TabuSearch:
+    return TabuSearch(NearestNeighboursMutation(), custom_metric('sq', lambda x: (x ** 2).sum(), minimized=True),
+                      convergence_criterion=iterations, tabu_time=3)
+
+
+def random_x0(rng: np.random.Generator):
+    return rng.integers(-10, 10, 5)
+
+
+def test_search_components_are_picklable():
+    solution = SolutionFactory(custom_metric('sq', lambda x: (x ** 2).sum())).initial(np.arange(3))
+    restored = pickle.loads(pickle.dumps(solution))
+
+    assert restored.quality == solution.quality and str(restored.quality) == str(solution.quality)
+    assert restored.id == SolutionId('Init') and str(restored.id) == 'Init'
+    for component in (TabuList(5), AttributeTabuList(5), SolutionSelection()):
+        pickle.loads(pickle.dumps(component))
+
+
+@pytest.mark.parametrize('executor', ['process', 'thread'])
+def test_parallel_search_returns_best_run(executor):
+    x0 = [np.random.randint(-10, 10, 5) for _ in range(3)]
+    runner = ParallelTabuSearch(partial(create_search, 5), executor, max_workers=2)
+
+    best = runner.optimize(x0)
+
+    assert len(runner.results) == len(runner.histories) == 3
+    assert [h[0].position.tolist() for h in runner.histories] == [x.tolist() for x in x0]
+    assert best.quality.value == min(r.best.quality.value for r in runner.results)
+
+
+def test_parallel_search_rejects_mismatched_number_of_runs():
+    runner = ParallelTabuSearch(partial(create_search, 5), 'thread')
+
+    with pytest.raises(ValueError, match='n_runs'):
+        runner.optimize([np.arange(3), np.arange(3)], n_runs=1)
+    with pytest.raises(ValueError, match='n_runs'):
+        runner.optimize(random_x0)
+
+
+def test_parallel_search_is_reproducible_with_seed():
+    def optimize():
+        runner = ParallelTabuSearch(partial(create_search, 5), max_workers=2)
+        runner.optimize(random_x0, n_runs=3, seed=42)
+        return [[str(s.id) for s in h] for h in runner.histories], [r.seed for r in runner.results]
+
+    histories, seeds = optimize()
+    assert (histories, seeds) == optimize()
+    assert len(set(seeds)) == 3
+
+
+@pytest.mark.parametrize('runner_type', [ParallelTabuSearch, CooperativeTabuSearch])
+def test_thread_runs_do_not_seed_global_generators(runner_type):
+    state = np.random.get_state()[1].copy()
+    runner = runner_type(partial(create_search, 5), 'thread')
+
+    runner.optimize(random_x0, n_runs=3, seed=42)
+    initial = [h[0].position.tolist() for h in runner.histories]
+
+    # the global generator is shared by the threads, while every x0 gets its own generator
+    assert np.array_equal(np.random.get_state()[1], state)
+    runner.optimize(random_x0, n_runs=3, seed=42)
+    assert [h[0].position.tolist() for h in runner.histories] == initial
+
+
+@pytest.mark.parametrize('adopt', ['best', 'random', 'none'])
+def test_cooperative_search_adopts_received_elites(adopt):
+    elite = create_search(1).optimize(np.zeros(5, dtype=int))
+    inbox = queue.SimpleQueue()
+    inbox.put([elite])
+
+    result = _run_cooperatively(0, partial(create_search, 3), np.full(5, 10), 0, _Exchange([inbox], [], 1, 1, adopt))
+
+    # the elite gets to the hall of fame anyway, but the search continues from it only if adopted
+    assert result.best.quality.value <= elite.quality.value
+    chosen_values = [s.quality.value for s in result.history[1:]]
+    if adopt == 'none':
+        assert min(chosen_values) > 100
+    else:
+        assert max(chosen_values) < 10
+
+
+@pytest.mark.parametrize('executor', ['process', 'thread'])
+@pytest.mark.parametrize('topology', ['ring', 'broadcast'])
+def test_cooperative_search_runs_all_searches(executor, topology):
+    runner = CooperativeTabuSearch(partial(create_search, 6), executor, exchange_interval=2, topology=topology)
+
+    best = runner.optimize(random_x0, n_runs=3, seed=0)
+
+    assert len(runner.results) == 3 and all(len(h) == 7 for h in runner.histories)
+    assert best.quality.value == min(r.best.quality.value for r in runner.results)
+
+
+def failing_first_search(calls) -> TabuSearch:
+    if next(calls) == 0:
+        raise KeyError('failed')
+    return create_search(10 ** 6)
+
+
+def crashing_search() -> TabuSearch:
+    os._exit(3)
+
+
+def test_cooperative_search_stops_other_searches_on_error():
+    runner = CooperativeTabuSearch(partial(failing_first_search, count()), 'thread')
+    n_threads = threading.active_count()
+
+    with pytest.raises(KeyError, match='failed'):
+        runner.optimize(random_x0, n_runs=3, seed=0)
+    # the other searches (practically endless) are stopped and joined
+    assert threading.active_count() == n_threads
+
+
+def test_cooperative_search_detects_crashed_worker():
+    runner = CooperativeTabuSearch(crashing_search, 'process')
+
+    with pytest.raises(RuntimeError, match='exit code 3'):
+        runner.optimize(random_x0, n_runs=2, seed=0)
+
+
+def test_cooperative_search_rejects_runs_above_max_workers():
+    runner = CooperativeTabuSearch(partial(create_search, 5), 'thread', max_workers=2)
+
+    with pytest.raises(ValueError, match='max_workers'):
+        runner.optimize(random_x0, n_runs=3)
@@ -0,0 +1,69 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from tabusearch import TabuSearch
+from tabusearch.history import NoHistory
+from tabusearch.memory.archive import ParetoArchive
+from tabusearch.mutation.neighbourhood import NearestNeighboursMutation
+from tabusearch.solution.base import Solution
+from tabusearch.solution.id import SolutionId
+from tabusearch.solution.quality.lib import custom_metric, per_metric_comparison_aggregation
+from tabusearch.solution.quality.pareto import pareto_front, domination_matrix
+
+
+def position_scores(solution: Solution) -> np.ndarray:
+    return solution.position
+
+
+def fill(archive: ParetoArchive, points: np.ndarray) -> ParetoArchive:
+    for i, point in enumerate(points):
+        archive.add(Solution(SolutionId('P', i), point, None))
+    return archive
+
+
+@pytest.mark.parametrize('n_metrics', [2, 3])
+def test_archive_keeps_pareto_front(n_metrics):
+    points = np.random.randint(0, 20, (300, n_metrics)).astype(float)
+    archive = fill(ParetoArchive(1000, scores=position_scores), points)
+
+    expected = {tuple(p) for p in points[pareto_front(points)]}
+    assert {tuple(s.position) for s in archive} == expected and len(archive) == len(expected)
+    assert archive.scores[:, 0].tolist() == sorted(archive.scores[:, 0].tolist())
+    assert archive[-1].position[0] == points[:, 0].max()
+
+
+@pytest.mark.parametrize('truncation', ['crowding', 'hypervolume'])
+def test_archive_is_bounded(truncation):
+    angles = np.random.uniform(0, np.pi / 2, 200)
+    points = np.stack([np.cos(angles), np.sin(angles)], axis=1)
+    archive = fill(ParetoArchive(10, truncation, reference=(0., 0.), scores=position_scores), points)
+
+    assert len(archive) == 10
+    assert not domination_matrix(archive.scores).any()
+    if truncation == 'crowding':
+        # boundary solutions have infinite crowding distance
+        assert archive.scores[0, 0] == points[:, 0].min() and archive.scores[-1, 0] == points[:, 0].max()
+    assert len(pickle.loads(pickle.dumps(archive))) == 10
+
+
+def test_hypervolume_truncation_requires_2d_reference():
+    with pytest.raises(ValueError):
+        ParetoArchive(10, 'hypervolume')
+
+
+def test_search_keeps_trade_off_front():
+    archive = ParetoArchive(50)
+    search = TabuSearch(NearestNeighboursMutation(),
+                        [custom_metric('close_to_2', lambda x: abs(x - 2).sum(), minimized=True),
+                         custom_metric('close_to_5', lambda x: abs(x - 5).sum(), minimized=True)],
+                        metric_aggregation=per_metric_comparison_aggregation('pareto'),
+                        convergence_criterion=30, tabu_time=3, pareto_selection=True,
+                        pareto_archive=archive, history=NoHistory())
+    best = search.optimize(np.array([-3, 9]))
+
+    assert search.hall_of_fame is archive and best is archive[-1]
+    assert not domination_matrix(archive.scores).any()
+    # the front of the two targets: every coordinate is between them
+    assert len(archive) > 1 and all(2 <= v <= 5 for s in archive for v in s.position.tolist())
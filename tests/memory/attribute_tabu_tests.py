@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from tabusearch.memory.filtering.attribute import AttributeTabuList, SwapTabuMatrix
+from tabusearch.mutation.base import MutationBatch
+from tabusearch.mutation.neighbourhood import NearestNeighboursMutation
+from tabusearch.mutation.pemutation import Swap2Mutation
+from tabusearch.solution.factory import SolutionFactory
+from tabusearch.solution.quality.lib import custom_metric
+
+
+def neighbours(mutation, position):
+    solution_factory = SolutionFactory(custom_metric('sum', np.sum))
+    pivot = solution_factory.initial(position)
+    return solution_factory([(mutation.mutation_type, mutation.mutate(pivot))], pivot)
+
+
+def test_reversal_attributes_forbid_restoring_old_values():
+    tabu = AttributeTabuList(2)
+    nn = NearestNeighboursMutation(batched=True)
+    [*_, move] = neighbours(nn, np.zeros(3, int))  # NN(+,2)
+    tabu.memorize(move)
+
+    allowed = tabu.filter(neighbours(nn, move.position))
+    assert [str(s.id) for s in allowed if s.move.idx[0] == 2] == ['NN(+,2)']
+
+    tabu.memorize(allowed[0])
+    assert len(tabu.filter(neighbours(nn, move.position))) == 5
+    tabu.memorize(allowed[0])
+    assert len(tabu.filter(neighbours(nn, move.position))) == 6
+
+
+@pytest.mark.parametrize('inverted', [False, True])
+def test_swap_matrix_equals_indices_attributes(inverted):
+    x = np.random.permutation(10)
+    swap = Swap2Mutation(batched=True)
+    matrix, indices = SwapTabuMatrix(len(x), 5), AttributeTabuList(5, 'indices')
+    if inverted:
+        matrix, indices = matrix.inverted(), indices.inverted()
+
+    for _ in range(20):
+        solutions = neighbours(swap, x)
+        allowed = matrix.filter(solutions)
+        assert [s.id for s in allowed] == [s.id for s in indices.filter(solutions)]
+        assert matrix._filter_mask(solutions).tolist() == indices._filter_mask(solutions).tolist()
+
+        move = solutions[np.random.randint(len(solutions))]
+        matrix.memorize(move)
+        indices.memorize(move)
+        x = move.position
+
+
+def test_attribute_tabu_requires_moves():
+    nn = NearestNeighboursMutation()
+    with pytest.raises(ValueError):
+        AttributeTabuList(2).filter(neighbours(nn, np.zeros(3, int)))
+
+
+@pytest.mark.parametrize('tabu', [AttributeTabuList(3), AttributeTabuList(3, 'indices'), SwapTabuMatrix(8, 3)])
+def test_neighbourhood_mask_reads_batch_arrays(tabu, monkeypatch):
+    factory = SolutionFactory(custom_metric('sum', np.sum))
+    mutations = [NearestNeighboursMutation(batched=True), Swap2Mutation(batched=True)]
+    x = np.random.permutation(8)
+
+    for _ in range(10):
+        pivot = factory.initial(x)
+        generated = [(m.mutation_type, m.mutate(pivot)) for m in mutations[isinstance(tabu, SwapTabuMatrix):]]
+        solutions = factory(generated, pivot)
+        with monkeypatch.context() as patch:
+            # moves of the neighbourhood are not materialized
+            patch.setattr(MutationBatch, 'move', None)
+            mask = tabu.mask(factory.neighbourhood(generated, pivot))
+        assert mask.tolist() == tabu._filter_mask(solutions).tolist()
+
+        move = solutions[np.random.randint(len(solutions))]
+        tabu.memorize(move)
+        x = move.position
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from tabusearch.memory.filtering.aspiration import AspirationCriterion
+from tabusearch.memory.filtering.tabu import TabuList
+from tabusearch.mutation.neighbourhood import NearestNeighboursMutation
+from tabusearch.solution.factory import SolutionFactory
+from tabusearch.solution.quality.factory import SolutionQualityFactory
+from tabusearch.solution.quality.lib import custom_metric
+
+
+def ids(criterion, solutions):
+    return {s.id for s in criterion.filter(solutions)}
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_filter_algebra_equals_set_algebra(columnar):
+    factory = SolutionFactory(custom_metric('sq', lambda x: float((x ** 2).sum()), minimized=True))
+    tabu, aspiration = TabuList(4), AspirationCriterion()
+    x = factory.initial(np.random.randint(-5, 5, 6))
+
+    for _ in range(15):
+        generated = [('NN', NearestNeighboursMutation(batched=True).mutate(x))]
+        solutions = factory(generated)
+        all_ids = {s.id for s in solutions}
+        allowed, aspired = ids(tabu, solutions), ids(aspiration, solutions)
+        expected = [allowed | aspired, allowed & aspired, (all_ids - allowed) | (all_ids - aspired),
+                    all_ids - (allowed & (all_ids - aspired))]
+        combinations = [tabu.unite(aspiration), tabu.intersect(aspiration),
+                        tabu.inverted().unite(aspiration.inverted()),
+                        tabu.intersect(aspiration.inverted()).inverted()]
+
+        for combination, expected_ids in zip(combinations, expected):
+            if columnar:
+                neighbourhood = factory.neighbourhood(generated)
+                assert set(neighbourhood.take(combination.mask(neighbourhood)).ids) == expected_ids
+            else:
+                assert ids(combination, solutions) == expected_ids
+
+        x = solutions[np.random.randint(len(solutions))]
+        tabu.memorize(x)
+        aspiration.memorize(x)
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_otherwise_checks_aspiration_of_tabu_rejected_only(columnar):
+    metric = custom_metric('sq', lambda x: float((x ** 2).sum()), minimized=True)
+    factory = SolutionFactory(metric)
+    aspired = []
+
+    class CountingQualityFactory(SolutionQualityFactory):
+        def __call__(self, x):
+            aspired.extend(x)
+            return super().__call__(x)
+
+    move_aspiration = CountingQualityFactory(metric)
+    tabu, aspiration = TabuList(4), AspirationCriterion(move_aspiration=lambda s: move_aspiration([s.position])[0])
+    ordered, united = tabu.otherwise(aspiration), tabu.unite(aspiration)
+    x = factory.initial(np.random.randint(-5, 5, 6))
+
+    for _ in range(15):
+        generated = [('NN', NearestNeighboursMutation(batched=True).mutate(x))]
+        solutions = factory(generated)
+        rejected = len(solutions) - len(tabu.filter(solutions))
+
+        aspired.clear()
+        if columnar:
+            neighbourhood = factory.neighbourhood(generated)
+            allowed = set(neighbourhood.take(ordered.mask(neighbourhood)).ids)
+        else:
+            allowed = ids(ordered, solutions)
+        assert len(aspired) == (rejected if aspiration._aspiration_bound is not np.NAN else 0)
+        assert allowed == ids(united, solutions)
+        assert ids(ordered.inverted(), solutions) == ids(united.inverted(), solutions)
+
+        x = solutions[np.random.randint(len(solutions))]
+        ordered.memorize(x)
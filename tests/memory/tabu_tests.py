@@ -0,0 +1,35 @@
+import random
+
+from tabusearch.memory.filtering.tabu import TabuList
+from tabusearch.solution.base import Solution
+from tabusearch.solution.id import SolutionId
+
+
+def countdown_tabu_list(moves, tabu_time):
+    """
+    Reference implementation, which counts down timers of all the entries on every memorization.
+    """
+    timers = {}
+    for move in moves:
+        for k, v in list(timers.items()):
+            if v == 1:
+                del timers[k]
+            else:
+                timers[k] -= 1
+        timers[move.id] = tabu_time(move)
+        yield set(timers)
+
+
+def test_tabu_list_equals_countdown():
+    ids = [SolutionId('Test', str(i)) for i in range(20)]
+    moves = [Solution(random.choice(ids), None, None) for _ in range(500)]
+    tenures = {id_: random.randint(1, 15) for id_ in ids}
+
+    def tabu_time(move):
+        return tenures[move.id]
+
+    tabu = TabuList(tabu_time)
+    candidates = [Solution(id_, None, None) for id_ in ids]
+    for move, expected_tabu in zip(moves, countdown_tabu_list(moves, tabu_time)):
+        tabu.memorize(move)
+        assert {s.id for s in tabu.filter(candidates)} == set(ids) - expected_tabu
@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+
+from tabusearch.mutation.base import MutationBatch
+from tabusearch.mutation.candidate import SampledMutation, EliteCandidateMutation, DontLookBitsMutation
+from tabusearch.mutation.custom import CustomMutation
+from tabusearch.mutation.neighbourhood import NearestNeighboursMutation
+from tabusearch.mutation.pemutation import Swap2Mutation, Swap3Mutation
+from tabusearch.solution.factory import SolutionFactory
+from tabusearch.solution.quality.lib import custom_metric
+
+WEIGHTS = np.random.random(10)
+
+
+def weighted_sum(x):
+    return (WEIGHTS * x).sum()
+
+
+@pytest.mark.parametrize('batched', [False, True])
+def test_sampled_mutation_is_bounded_subset(batched):
+    pivot = SolutionFactory(custom_metric('sum', np.sum)).initial(np.random.permutation(10))
+    full = Swap2Mutation(batched=True).mutate(pivot)
+    sampled = SampledMutation(Swap2Mutation(batched=batched), 7, seed=0)
+
+    mutations = sampled.mutate(pivot)
+    suffixes = list(mutations.suffixes()) if batched else [tuple(s) for _, *s in mutations]
+
+    assert isinstance(mutations, MutationBatch) == batched
+    assert sampled.mutation_type == 'Swap2' and len(mutations) == 7
+    assert set(suffixes) <= set(full.suffixes()) and suffixes == sorted(suffixes, key=lambda s: tuple(map(int, s)))
+
+
+@pytest.mark.parametrize('batched', [False, True])
+def test_elite_candidates_are_best_and_kept_between_refreshes(batched):
+    metric = custom_metric('ws', weighted_sum)
+    factory = SolutionFactory(metric)
+    pivot = factory.initial(np.random.permutation(10))
+    elite = EliteCandidateMutation(Swap2Mutation(batched=batched), metric, size=5, refresh_every=2)
+
+    def names(mutations):
+        return list(mutations.suffixes()) if batched else [tuple(s) for _, *s in mutations]
+
+    full = Swap2Mutation().mutate(pivot)
+    best = sorted(full, key=lambda m: weighted_sum(m[0]))[-5:]
+    assert set(names(elite.mutate(pivot))) == {tuple(s) for _, *s in best}
+
+    kept = names(elite.mutate(factory.initial(pivot.position[::-1].copy())))
+    assert set(kept) == {tuple(s) for _, *s in best}
+
+
+def test_dont_look_bits_restricts_to_improved_elements():
+    factory = SolutionFactory(custom_metric('ws', weighted_sum))
+    mutation = DontLookBitsMutation(NearestNeighboursMutation(batched=True))
+    x0 = np.zeros(10, dtype=int)
+
+    assert len(mutation.mutate(factory.initial(x0))) == 20
+    x1 = x0.copy()
+    x1[3] += 1
+    assert list(mutation.mutate(factory.initial(x1)).suffixes()) == [('-', '3'), ('+', '3')]
+    x2 = x1.copy()
+    x2[3] -= 1
+    # not improved - all the bits are reset
+    assert len(mutation.mutate(factory.initial(x2))) == 20
+
+
+@pytest.mark.parametrize('mutation', [Swap2Mutation(batched=True), Swap3Mutation(batched=True)])
+def test_sampled_mutation_samples_without_full_neighbourhood(mutation, monkeypatch):
+    pivot = SolutionFactory(custom_metric('sum', np.sum)).initial(np.random.permutation(300))
+    monkeypatch.setattr(type(mutation), '_generate_batch', None)
+
+    batch = SampledMutation(mutation, 50, seed=0).mutate(pivot)
+    idx = batch.idx.tolist()
+
+    # generation order: the mutations are ordered by their indices
+    assert len(batch) == 50 and idx == sorted(idx) and len(set(batch.suffixes())) == 50
+    # every sampled mutation permutes distinct elements
+    assert np.array_equal(np.sort(batch.positions, axis=1), np.tile(np.arange(300), (50, 1)))
+    assert (np.sort(batch.old, axis=1) == np.sort(batch.values, axis=1)).all() and (batch.old != batch.values).all()
+
+
+def test_sampled_mutation_of_equal_elements_is_enumerated():
+    pivot = SolutionFactory(custom_metric('sum', np.sum)).initial(np.array([0] * 40 + [1]))
+
+    batch = SampledMutation(Swap2Mutation(batched=True), 10, seed=0).mutate(pivot)
+
+    # only 40 of 820 pairs can be swapped, so the random pairs are rejected, and the swappable ones are enumerated
+    assert len(batch) == 10 and (batch.idx[:, 1] == 40).all() and len(np.unique(batch.idx[:, 0])) == 10
+
+
+@pytest.mark.parametrize('mutation', [Swap2Mutation(), Swap2Mutation(batched=True),
+                                      CustomMutation(Swap2Mutation()._generate_mutations, 'Swap2')])
+def test_candidate_lists_are_nested(mutation):
+    pivot = SolutionFactory(custom_metric('ws', weighted_sum)).initial(np.random.permutation(10))
+    nested = SampledMutation(DontLookBitsMutation(SampledMutation(mutation, 5, seed=0)), 100, seed=0)
+
+    mutations = nested.mutate(pivot)
+    suffixes = list(mutations.suffixes()) if mutation.batched else [tuple(s) for _, *s in mutations]
+
+    # the outer budget does not extend the inner candidate list
+    assert len(suffixes) == 5 and set(suffixes) <= {tuple(s) for _, *s in Swap2Mutation().mutate(pivot)}
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from tabusearch.mutation.base import MutationBatch
+from tabusearch.mutation.directed import MutationDirection
+from tabusearch.mutation.neighbourhood import NearestNeighboursMutation, FullAxisShiftMutation
+from tabusearch.solution.factory import SolutionFactory
+from tabusearch.solution.quality.lib import custom_metric, custom_vectorized_metric
+
+
+@pytest.fixture(params=[NearestNeighboursMutation, FullAxisShiftMutation])
+def mutation_type(request):
+    return request.param
+
+
+@pytest.mark.parametrize('direction', list(MutationDirection))
+def test_batch_equals_list_mutations(mutation_type, direction):
+    x0 = np.random.randint(-10, 10, 7)
+    solution_factory = SolutionFactory(custom_metric('sum', np.sum))
+    pivot = solution_factory.initial(x0)
+
+    listed = mutation_type()
+    batched = mutation_type(batched=True)
+    listed.direction = batched.direction = direction
+
+    mutations = listed.mutate(pivot)
+    batch = batched.mutate(pivot)
+
+    assert isinstance(batch, MutationBatch)
+    assert len(batch) == len(mutations)
+    assert np.array_equal(batch.positions, np.stack([position for position, *_ in mutations]))
+    assert list(batch.suffixes()) == [tuple(suffix) for _, *suffix in mutations]
+
+
+def test_solution_factory_consumes_batch_matrix():
+    x0 = np.random.randint(-10, 10, 5)
+    consumed = []
+
+    def evaluation(x):
+        consumed.append(x)
+        return x.sum(axis=1)
+
+    solution_factory = SolutionFactory(custom_vectorized_metric('sum', evaluation))
+    pivot = solution_factory.initial(x0)
+    mutations = [NearestNeighboursMutation(batched=True), FullAxisShiftMutation(batched=True)]
+    solutions = solution_factory([(m.mutation_type, m.mutate(pivot)) for m in mutations])
+
+    assert len(solutions) == 2 * len(x0) + 2
+    assert consumed[-1].shape == (len(solutions), len(x0))
+    assert str(solutions[0].id) == 'NN(-,0)' and str(solutions[-1].id) == 'FullShift(+)'
+    assert all(s.quality.value == s.position.sum() for s in solutions)
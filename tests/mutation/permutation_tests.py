@@ -0,0 +1,71 @@
+import tracemalloc
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from tabusearch import TabuSearch
+from tabusearch.history import NoHistory
+from tabusearch.mutation.directed import MutationDirection
+from tabusearch.mutation.pemutation import Swap3Mutation, swap2_indices, swap3_indices
+from tabusearch.solution.factory import SolutionFactory
+from tabusearch.solution.quality.lib import custom_metric, custom_vectorized_metric
+
+
+@pytest.mark.parametrize('n', [0, 2, 3, 9])
+def test_swap_kernels_equal_combinations(n):
+    x = np.random.randint(0, 3, n)
+    pairs = [c for c in combinations(range(n), 2) if len(set(x[list(c)])) == 2]
+    triples = [c for c in combinations(range(n), 3) if len(set(x[list(c)])) == 3]
+
+    assert swap2_indices(x).reshape(-1, 2).tolist() == [list(c) for c in pairs]
+    assert swap3_indices(x).reshape(-1, 3).tolist() == [list(c) for c in triples]
+
+
+@pytest.mark.parametrize('direction', list(MutationDirection))
+def test_swap3_batch_rotates_triples(direction):
+    x0 = np.random.permutation(6)
+    pivot = SolutionFactory(custom_metric('sum', np.sum)).initial(x0)
+    mutation = Swap3Mutation(batched=True)
+    mutation.direction = direction
+
+    batch = mutation.mutate(pivot)
+    mutations = [(position.tolist(), suffix) for position, suffix in zip(batch.positions, batch.suffixes())]
+
+    expected = []
+    for idx in combinations(range(len(x0)), 3):
+        for rotation, shift in (('l', -1), ('r', 1)):
+            if rotation == 'l' and direction.is_negative or rotation == 'r' and direction.is_positive:
+                x = x0.copy()
+                x[list(idx)] = np.roll(x0[list(idx)], shift)
+                expected.append((x.tolist(), (rotation, *map(str, idx))))
+    assert mutations == expected
+
+
+def test_swap3_search_memory_per_neighbour_is_bounded():
+    n = 40
+    costs = np.random.random((n, n))
+
+    def cost(x):
+        return costs[np.arange(n), x].sum(axis=1)
+
+    def cost_delta(base_value, idx, old, new):
+        return (costs[idx, new] - costs[idx, old]).sum(axis=1)
+
+    search = TabuSearch(Swap3Mutation(batched=True),
+                        custom_vectorized_metric('assignment', cost, batch_delta=cost_delta, minimized=True),
+                        convergence_criterion=1, columnar_evaluation=True, history=NoHistory())
+    x0 = np.random.permutation(n)
+    n_neighbours = len(swap3_indices(x0)) * 2
+
+    tracemalloc.start()
+    try:
+        best = search.optimize(x0)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    # the positions matrix alone would take 8 * n = 320 bytes per neighbour
+    assert peak < 640 * n_neighbours
+    assert np.array_equal(np.sort(best.position), np.arange(n))
+    assert best.quality.value == pytest.approx(cost(best.position[np.newaxis])[0])
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from tabusearch import TabuSearch
+from tabusearch.mutation.neighbourhood import NearestNeighboursMutation, FullAxisShiftMutation
+from tabusearch.solution.quality.batch import QualityBatch
+from tabusearch.solution.quality.factory import SolutionQualityFactory
+from tabusearch.solution.quality.lib import custom_metric, custom_vectorized_metric, sum_metrics_aggregation
+from tabusearch.solution.quality.lib.aggregated import normalized_weighted_metrics_aggregation, metrics_matrix
+
+
+def metrics(minimized: bool = True):
+    return (custom_metric('sq', lambda x: float((x ** 2).sum()), minimized=minimized),
+            custom_vectorized_metric('abs', lambda x: np.abs(x).max(axis=1).astype(float)))
+
+
+def reference_normalized(matrix: np.ndarray, weights: list[float]) -> list[float]:
+    if len(matrix) == 1:
+        return [float(np.count_nonzero(row)) for row in matrix]
+    normalized = np.nan_to_num((matrix - matrix.min(axis=0)) / np.ptp(matrix, axis=0))
+    return [sum(w * v for w, v, m in zip(weights, row, metrics_row) if m)
+            for row, metrics_row in zip(normalized, matrix)]
+
+
+@pytest.mark.parametrize('n', [1, 2, 10])
+def test_normalized_aggregation_of_matrix(n):
+    x = list(np.random.randint(1, 6, (n, 3)) * np.random.choice([-1, 1], (n, 3)))
+    evaluated = list(zip(*[metric(x) for metric in metrics()]))
+    aggregation = normalized_weighted_metrics_aggregation('agg', [0.7, 0.3])
+
+    aggregated = aggregation(evaluated)
+    matrix = metrics_matrix(evaluated)
+
+    assert matrix.tolist() == [[float(m) for m in row] for row in evaluated]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.testing.assert_allclose([q.value for q in aggregated], reference_normalized(matrix, [0.7, 0.3]))
+    np.testing.assert_array_equal(aggregation.aggregate_matrix(matrix), [q.value for q in aggregated])
+    assert [m.value for m in aggregated[0]._data] == [m.value for m in evaluated[0]]
+    assert aggregation([]) == []
+
+
+@pytest.mark.parametrize('aggregation', [sum_metrics_aggregation('sum', [2, 1]),
+                                         normalized_weighted_metrics_aggregation('norm', [0.5, 0.5])])
+def test_batch_of_aggregated_metrics_equals_qualities(aggregation):
+    x = np.random.randint(-5, 5, (20, 3))
+    factory = SolutionQualityFactory(*metrics(), metrics_aggregation=aggregation)
+
+    batch = factory.batch(x)
+    qualities = list(factory(x))
+
+    assert not batch.materialized
+    np.testing.assert_array_equal(batch.scores, [float(q) for q in qualities])
+    assert [str(q) for q in batch.qualities(x)] == [str(q) for q in qualities]
+    assert batch.quality(3, x[3]) == qualities[3]
+
+
+def test_aggregated_batch_materializes_qualities_without_evaluation():
+    calls = []
+
+    def counted(name, f):
+        return custom_vectorized_metric(name, lambda x: calls.append(len(x)) or f(x), minimized=True)
+
+    x = np.random.randint(-5, 5, (20, 3))
+    factory = SolutionQualityFactory(counted('sum', lambda x: x.sum(axis=1).astype(float)),
+                                     counted('abs', lambda x: np.abs(x).max(axis=1).astype(float)),
+                                     metrics_aggregation=sum_metrics_aggregation('agg'))
+    batch = QualityBatch.concatenate([factory.batch(x[:10]), factory.batch(x[10:])]).take(np.arange(5, 15))
+    assert calls == [10, 10, 10, 10]
+
+    expected = list(factory(x[5:15]))
+    assert [str(batch.quality(i, data)) for i, data in enumerate(x[5:15])] == [str(q) for q in expected]
+    assert [str(q) for q in batch.qualities(x[5:15])] == [str(q) for q in expected]
+    assert calls == [10, 10, 10, 10, 10, 10]
+
+
+def test_columnar_search_with_aggregated_metrics_equals_object_search():
+    x0 = np.random.randint(-5, 5, 6)
+
+    def optimize(columnar):
+        optimiser = TabuSearch(mutation_behaviour=[NearestNeighboursMutation(True), FullAxisShiftMutation()],
+                               metric=metrics(), metric_aggregation=sum_metrics_aggregation('sum'),
+                               convergence_criterion=20, tabu_time=3, columnar_evaluation=columnar)
+        optimiser.optimize(x0)
+        return [(str(s.id), float(s.quality)) for s in optimiser.history[1:]]
+
+    assert optimize(True) == optimize(False)
@@ -0,0 +1,101 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from tabusearch import TabuSearch
+from tabusearch.mutation.neighbourhood import NearestNeighboursMutation
+from tabusearch.solution.factory import SolutionFactory
+from tabusearch.solution.quality.lib import custom_metric, custom_async_metric
+
+
+class StubEvaluationServer:
+    """
+    Local evaluation service: evaluates sum of squares of a space separated line of numbers.
+    Tracks the maximal number of requests, being evaluated at once.
+    """
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        line = await reader.readline()
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+
+        writer.write(f'{sum(int(v) ** 2 for v in line.split())}\n'.encode())
+        await writer.drain()
+        writer.close()
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_server(self.handle, '127.0.0.1', 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *_):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def evaluate(self, x: np.ndarray) -> float:
+        reader, writer = await asyncio.open_connection('127.0.0.1', self.port)
+        writer.write((' '.join(map(str, x.tolist())) + '\n').encode())
+        await writer.drain()
+        value = float(await reader.readline())
+        writer.close()
+        await writer.wait_closed()
+        return value
+
+
+def create_search(metric, columnar_evaluation: bool = False) -> TabuSearch:
+    return TabuSearch(NearestNeighboursMutation(), metric, convergence_criterion=5, tabu_time=3,
+                      columnar_evaluation=columnar_evaluation)
+
+
+@pytest.mark.parametrize('columnar_evaluation', [False, True])
+def test_async_search_equals_sync_search(columnar_evaluation):
+    x0 = np.array([3, -4, 5, 1])
+
+    async def optimize_async():
+        async with StubEvaluationServer() as server:
+            search = create_search(custom_async_metric('sq', server.evaluate, max_concurrency=4, minimized=True),
+                                   columnar_evaluation)
+            return search, await search.optimize_async(x0)
+
+    search, best = asyncio.run(optimize_async())
+    expected_search = create_search(custom_metric('sq', lambda x: (x ** 2).sum(), minimized=True),
+                                    columnar_evaluation)
+    expected = expected_search.optimize(x0)
+
+    assert best.quality.value == expected.quality.value
+    assert [str(s.id) for s in search.history] == [str(s.id) for s in expected_search.history]
+
+
+def test_async_metric_bounds_concurrency():
+    x = [np.array([i, -i]) for i in range(20)]
+
+    async def evaluate():
+        async with StubEvaluationServer() as server:
+            factory = SolutionFactory(custom_async_metric('sq', server.evaluate, max_concurrency=3))
+            solutions = await factory.call_async([('Gen', [(data, str(i)) for i, data in enumerate(x)])])
+            return server, solutions
+
+    server, solutions = asyncio.run(evaluate())
+
+    assert [s.quality.value for s in solutions] == [2.0 * i ** 2 for i in range(20)]
+    assert server.requests == 20
+    assert 1 < server.max_in_flight <= 3
+
+
+def test_async_and_sync_metrics_are_evaluated_together():
+    async def evaluation(x):
+        return float(x.sum())
+
+    factory = SolutionFactory(custom_async_metric('async', evaluation), custom_metric('sync', np.max),
+                              metrics_aggregation=lambda metrics: list(metrics))
+    [quality] = asyncio.run(factory.quality_factory.evaluate_async([np.array([1, 2, 3])]))
+
+    assert [q.value for q in quality] == [6.0, 3]
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from sortedcontainers import SortedList
+
+from tabusearch import TabuSearch
+from tabusearch.mutation.neighbourhood import NearestNeighboursMutation, FullAxisShiftMutation
+from tabusearch.solution.quality.batch import QualityBatch
+from tabusearch.solution.quality.cache import QualityCache
+from tabusearch.solution.quality.complex import ComplexSolutionQualityInfo
+from tabusearch.solution.quality.lib import custom_metric, sum_metrics_aggregation
+from tabusearch.solution.quality.single import SolutionQualityInfo
+
+
+def rosenbrock(x):
+    return (100.0*(x[1:] - x[:-1]**2.0)**2.0 + (1-x[:-1])**2.0).sum()
+
+
+@pytest.mark.parametrize('minimized', [False, True])
+def test_top_equals_reversed_sorted_order(minimized):
+    values = np.random.randint(0, 5, 40)
+    batch = QualityBatch(values, 'q', minimized)
+    qualities = batch.qualities(values)
+    expected = list(reversed(SortedList(range(len(values)), key=qualities.__getitem__)))
+
+    for k in [1, 3, 10, 40, 50]:
+        assert batch.top(k).tolist() == expected[:k]
+
+
+def test_batch_requires_float_ordered_qualities():
+    main = SolutionQualityInfo(0, 'main', 1.)
+    full = sum_metrics_aggregation('agg')([[main]])[0]
+
+    assert QualityBatch.from_qualities([main, full]).values.tolist() == [1., 1.]
+    with pytest.raises(TypeError):
+        QualityBatch.from_qualities([ComplexSolutionQualityInfo(main, full)])
+
+
+@pytest.mark.parametrize('batched', [False, True])
+@pytest.mark.parametrize('cache', [None, QualityCache])
+def test_columnar_search_equals_object_search(batched, cache):
+    x0 = np.random.randint(-5, 5, 8)
+
+    def optimize(columnar):
+        optimiser = TabuSearch(mutation_behaviour=[NearestNeighboursMutation(batched), FullAxisShiftMutation()],
+                               metric=custom_metric('r', rosenbrock, minimized=True),
+                               convergence_criterion=30,
+                               tabu_time=len(x0),
+                               selection=lambda n: min(2, n - 1),
+                               selection_depth=2,
+                               evaluation_cache=cache and cache(),
+                               columnar_evaluation=columnar)
+        optimiser.optimize(x0)
+        return [(str(s.id), s.quality.value) for s in optimiser.history[1:]]
+
+    assert optimize(True) == optimize(False)
+
+
+@pytest.mark.parametrize('evaluation', [dict(columnar_evaluation=True), dict(streaming_chunk_size=4)])
+def test_columnar_search_rejects_additional_evaluation(evaluation):
+    def novelty(x):
+        return [SolutionQualityInfo(data, 'novelty', 0.) for data, _ in x]
+
+    with pytest.raises(ValueError, match='Additional evaluation'):
+        TabuSearch(NearestNeighboursMutation(), custom_metric('r', rosenbrock, minimized=True),
+                   additional_evaluation=[novelty], additional_evaluation_weights=[0.1], **evaluation)
@@ -0,0 +1,66 @@
+import numpy as np
+
+from tabusearch.mutation.neighbourhood import NearestNeighboursMutation, FullAxisShiftMutation
+from tabusearch.solution.factory import SolutionFactory
+from tabusearch.solution.quality.cache import QualityCache, position_key
+from tabusearch.solution.quality.lib import custom_vectorized_metric
+
+
+def test_position_key_accounts_dtype_and_shape():
+    x = np.arange(6)
+    assert position_key(x) == position_key(np.arange(6))
+    assert position_key(x) != position_key(x.reshape(2, 3))
+    assert position_key(x) != position_key(x.astype(np.int8))
+
+
+def test_cache_skips_revisited_positions():
+    evaluated = []
+
+    def evaluation(x):
+        evaluated.append(len(x))
+        return x.sum(axis=1)
+
+    cache = QualityCache()
+    solution_factory = SolutionFactory(custom_vectorized_metric('sum', evaluation), cache=cache)
+    pivot = solution_factory.initial(np.zeros(4, int))
+    mutations = [NearestNeighboursMutation(batched=True), FullAxisShiftMutation()]
+    generated = [(m.mutation_type, m.mutate(pivot)) for m in mutations]
+
+    first = solution_factory(generated)
+    second = solution_factory(generated)
+
+    # the pivot and 10 neighbours are evaluated once
+    assert evaluated == [1, 10]
+    assert [s.quality for s in first] == [s.quality for s in second]
+    info = solution_factory.quality_factory.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (10, 11, 11)
+
+
+def test_cache_evicts_least_recently_used():
+    cache = QualityCache(maxsize=2)
+    metric = custom_vectorized_metric('sum', lambda x: x.sum(axis=1))
+    a, b, c = np.zeros(3), np.ones(3), np.full(3, 2.)
+
+    cache.evaluate(metric, [a, b])
+    cache.evaluate(metric, [a])
+    cache.evaluate(metric, [c])
+    cache.evaluate(metric, [a, b])
+
+    assert cache.cache_info().hits == 2
+    assert cache.cache_info().misses == 4
+
+    sized = QualityCache(maxsize=None, maxbytes=2 * a.nbytes)
+    sized.evaluate(metric, [a, b, c])
+    assert sized.cache_info().currbytes == 2 * a.nbytes
+
+
+def test_cached_rows_do_not_keep_batch_alive():
+    cache = QualityCache(maxsize=None, maxbytes=10 * 8 * 100)
+    metric = custom_vectorized_metric('sum', lambda x: x.sum(axis=1))
+    batch = np.random.random((1000, 100))
+
+    qualities = cache.evaluate(metric, batch)
+
+    assert cache.cache_info().currsize == 10 and cache.cache_info().currbytes == 10 * batch[0].nbytes
+    # the kept qualities reference copies of the rows, not views of the batch
+    assert all(q._data.base is None for q in qualities[-10:])
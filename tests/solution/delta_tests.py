@@ -0,0 +1,85 @@
+import numpy as np
+
+from tabusearch.mutation.neighbourhood import NearestNeighboursMutation, FullAxisShiftMutation
+from tabusearch.mutation.pemutation import Swap2Mutation
+from tabusearch.solution.factory import SolutionFactory
+from tabusearch.solution.neighbourhood import LazyColumn
+from tabusearch.solution.quality.lib import custom_metric
+
+WEIGHTS = np.random.random(12)
+
+
+def weighted_sum(x):
+    return (WEIGHTS * x).sum()
+
+
+def weighted_sum_delta(base_value, move):
+    return (WEIGHTS[move.idx] * (move.new - move.old)).sum()
+
+
+def test_swap2_batch_equals_list_mutations():
+    x0 = np.random.randint(0, 4, 12)
+    pivot = SolutionFactory(custom_metric('sum', np.sum)).initial(x0)
+
+    mutations = Swap2Mutation().mutate(pivot)
+    batch = Swap2Mutation(batched=True).mutate(pivot)
+
+    assert np.array_equal(batch.positions, np.stack([position for position, *_ in mutations]))
+    assert list(batch.suffixes()) == [tuple(suffix) for _, *suffix in mutations]
+
+
+def test_delta_evaluation_equals_full_evaluation():
+    x0 = np.random.randint(-10, 10, 12)
+    calls = []
+
+    def counted_weighted_sum(x):
+        calls.append(x)
+        return weighted_sum(x)
+
+    delta_factory = SolutionFactory(custom_metric('ws', counted_weighted_sum, weighted_sum_delta, minimized=True))
+    full_factory = SolutionFactory(custom_metric('ws', weighted_sum, minimized=True))
+    pivot = delta_factory.initial(x0)
+    # list-based mutation is evaluated fully along with batched ones
+    mutations = [NearestNeighboursMutation(batched=True), FullAxisShiftMutation(), Swap2Mutation(batched=True)]
+    generated = [(m.mutation_type, m.mutate(pivot)) for m in mutations]
+
+    pivot.quality.value
+    calls.clear()
+    delta_solutions = delta_factory(generated, pivot=pivot)
+    full_solutions = full_factory(generated)
+    delta_values = [s.quality.value for s in delta_solutions]
+
+    # only FullAxisShiftMutation neighbours are evaluated fully
+    assert len(calls) == 2
+    assert [str(s.id) for s in delta_solutions] == [str(s.id) for s in full_solutions]
+    assert np.allclose(delta_values, [s.quality.value for s in full_solutions])
+
+
+def weighted_sum_batch_delta(base_value, idx, old, new):
+    return (WEIGHTS[idx] * (new - old)).sum(axis=1)
+
+
+def test_vectorized_delta_keeps_positions_lazy():
+    x0 = np.random.randint(-10, 10, 12)
+    delta_factory = SolutionFactory(custom_metric('ws', weighted_sum, batch_delta=weighted_sum_batch_delta,
+                                                  minimized=True))
+    full_factory = SolutionFactory(custom_metric('ws', weighted_sum, minimized=True))
+    pivot = delta_factory.initial(x0)
+    batches = [NearestNeighboursMutation(batched=True).mutate(pivot), Swap2Mutation(batched=True).mutate(pivot)]
+    generated = [('NN', batches[0]), ('FullShift', FullAxisShiftMutation().mutate(pivot)), ('Swap2', batches[1])]
+
+    neighbourhood = delta_factory.neighbourhood(generated, pivot=pivot)
+    full = full_factory.neighbourhood([(name, m.take(np.arange(len(m))) if name != 'FullShift' else m)
+                                       for name, m in generated])
+
+    # neither positions matrices nor moves of the batches are built
+    assert isinstance(neighbourhood.positions, LazyColumn) and isinstance(neighbourhood.moves, LazyColumn)
+    assert not any('positions' in batch.__dict__ for batch in batches)
+    assert np.allclose(neighbourhood.qualities.values, full.qualities.values)
+
+    idx = np.array([30, 2, 3, 25, 13, 12])
+    taken, full_taken = neighbourhood.take(idx), full.take(idx)
+    assert np.array_equal(np.stack(list(taken.positions)), full_taken.positions)
+    assert [m and m.idx.tolist() for m in taken.moves] == [m and m.idx.tolist() for m in full_taken.moves]
+    assert all(np.array_equal(neighbourhood.solution(i).position, full.positions[i]) for i in idx.tolist())
+    assert not any('positions' in batch.__dict__ for batch in batches)
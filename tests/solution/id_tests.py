@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from tabusearch.mutation.neighbourhood import NearestNeighboursMutation, FullAxisShiftMutation, SIGN_MARKS
+from tabusearch.mutation.pemutation import Swap2Mutation, Swap3Mutation
+from tabusearch.solution.factory import SolutionFactory
+from tabusearch.solution.id import SolutionId
+from tabusearch.solution.quality.lib import custom_metric
+
+
+def test_solution_id_renders_lazily():
+    id_ = SolutionId('NN', -1, 3, marks=SIGN_MARKS)
+    assert id_._str is None
+    assert str(id_) == 'NN(-,3)'
+    assert str(SolutionId('Swap2', 1, 2)) == 'Swap2(1,2)'
+    assert str(SolutionId('FullShift', '+')) == 'FullShift(+)'
+    assert str(SolutionId('Init')) == 'Init'
+
+
+def test_solution_id_equality_compares_components():
+    assert SolutionId('Swap2', 1, 2) == SolutionId('Swap2', 1, 2)
+    assert SolutionId('Swap2', 1, 2) != SolutionId('Swap2', 2, 1)
+    assert SolutionId('Swap2', 1, 2) != SolutionId('Swap3Single', 1, 2)
+    assert len({SolutionId('NN', 1, i, marks=SIGN_MARKS) for i in [0, 1, 1, 2]}) == 3
+
+
+@pytest.mark.parametrize('mutation', [NearestNeighboursMutation, FullAxisShiftMutation, Swap2Mutation, Swap3Mutation])
+def test_batched_and_list_ids_are_equal(mutation):
+    factory = SolutionFactory(custom_metric('sum', np.sum))
+    pivot = factory.initial(np.random.permutation(6))
+    list_ids = [s.id for s in factory([('M', mutation().mutate(pivot))])]
+    batch_ids = [s.id for s in factory([('M', mutation(batched=True).mutate(pivot))])]
+
+    assert list_ids == batch_ids and list(map(hash, list_ids)) == list(map(hash, batch_ids))
+    assert list(map(str, list_ids)) == list(map(str, batch_ids))
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from tabusearch.solution.quality.lib import ParallelMetric, custom_metric
+
+
+def rosenbrock(x):
+    return (100.0*(x[1:] - x[:-1]**2.0)**2.0 + (1-x[:-1])**2.0).sum()
+
+
+@pytest.mark.parametrize('executor', ['process', 'thread'])
+@pytest.mark.parametrize('stacked', [True, False])
+def test_parallel_metric_equals_serial(executor, stacked):
+    x = np.random.randint(-10, 10, (50, 8))
+    expected = [q.value for q in custom_metric('r', rosenbrock, minimized=True)(x)]
+
+    with ParallelMetric('r', rosenbrock, executor, max_workers=2, chunksize=7, minimized=True) as metric:
+        qualities = metric(x if stacked else list(x))
+
+    assert [q.value for q in qualities] == expected
+    assert all(q.name == 'r(min)' for q in qualities)
+    assert metric._executor is None
+
+
+def test_parallel_metric_restarts_after_close():
+    metric = ParallelMetric('r', rosenbrock, 'thread', max_workers=2)
+    metric.close()
+    assert metric.evaluate([np.zeros(3)]) == [1.0 * 2]
+    metric.close()
@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from tabusearch import TabuSearch
+from tabusearch.memory.archive import ParetoArchive
+from tabusearch.mutation.neighbourhood import NearestNeighboursMutation
+from tabusearch.solution.base import Solution
+from tabusearch.solution.id import SolutionId
+from tabusearch.solution.quality.lib import custom_metric, per_metric_comparison_aggregation
+from tabusearch.solution.quality.lib.aggregated import most
+from tabusearch.solution.quality.pareto import domination_matrix, non_dominated_sort, pareto_front, pareto_order
+from tabusearch.solution.quality.single import SolutionQualityInfo
+from tabusearch.solution.selection import ParetoSolutionSelection
+
+
+def naive_ranks(scores: np.ndarray) -> list[int]:
+    ranks, remaining, rank = [-1] * len(scores), set(range(len(scores))), 0
+    while remaining:
+        front = {i for i in remaining
+                 if not any((scores[j] >= scores[i]).all() and (scores[j] > scores[i]).any() for j in remaining)}
+        for i in front:
+            ranks[i] = rank
+        remaining -= front
+        rank += 1
+    return ranks
+
+
+def test_non_dominated_sort_equals_naive_sort():
+    scores = np.random.randint(0, 6, (60, 3)).astype(float)
+    ranks = non_dominated_sort(scores)
+
+    assert ranks.tolist() == naive_ranks(scores)
+    assert domination_matrix(scores)[0, 0] == False
+    assert pareto_front(scores).tolist() == np.flatnonzero(ranks == 0).tolist()
+
+    partial = non_dominated_sort(scores, max_count=10)
+    assert (partial[partial >= 0] == ranks[partial >= 0]).all()
+    assert np.count_nonzero(partial >= 0) >= 10
+
+
+def test_pareto_order_is_ordered_by_fronts_then_latest_first():
+    scores = np.array([[1., 1.], [2., 0.], [0., 2.], [2., 2.], [0., 0.]])
+
+    assert pareto_order(scores).tolist() == [3, 2, 1, 0, 4]
+    assert pareto_order(scores, max_count=1).tolist() == [3]
+
+
+def qualities(scores: np.ndarray, aggregation='all'):
+    metrics = [[SolutionQualityInfo(None, f'm{j}', v) for j, v in enumerate(row)] for row in scores.tolist()]
+    return per_metric_comparison_aggregation('pareto', aggregation)(metrics)
+
+
+def test_per_metric_comparison_uses_metrics_matrix():
+    dominating, dominated, incomparable = qualities(np.array([[2., 2., 2.], [1., 0., 1.], [3., 0., 0.]]))
+
+    np.testing.assert_array_equal(dominated.floats, [1., 0., 1.])
+    assert dominated < dominating and not dominating < dominated
+    assert not incomparable < dominating and not dominating < incomparable
+
+    first, second = qualities(np.array([[1., 1., 3.], [2., 2., 0.]]), 'most')
+    assert first < second and not second < first
+    assert most(np.array([True, False])) == False
+
+
+@pytest.mark.parametrize('selection, max_idx, expected', [(None, None, 3), (lambda n: 1, 2, 2), (lambda n: 3, 3, 0)])
+def test_pareto_selection_selects_by_fronts(selection, max_idx, expected):
+    scores = np.array([[1., 1.], [2., 0.], [0., 2.], [2., 2.], [0., 0.]])
+    solutions = [Solution(SolutionId('S', i), i, quality) for i, quality in enumerate(qualities(scores))]
+
+    assert ParetoSolutionSelection(selection, max_idx).select(solutions).position == expected
+    assert ParetoSolutionSelection().select([]) is None
+
+
+def test_search_with_pareto_selection():
+    search = TabuSearch(NearestNeighboursMutation(),
+                        [custom_metric('close_to_2', lambda x: abs(x - 2).sum(), minimized=True),
+                         custom_metric('close_to_5', lambda x: abs(x - 5).sum(), minimized=True)],
+                        metric_aggregation=per_metric_comparison_aggregation('pareto'),
+                        convergence_criterion=10, tabu_time=2, pareto_selection=True)
+    search.optimize(np.array([-3, 9]))
+
+    # the walk reaches the trade-off front between the two targets
+    assert all(2 <= v <= 5 for v in search.history[-1].position.tolist())
+    with pytest.raises(ValueError):
+        TabuSearch(NearestNeighboursMutation(), custom_metric('m', sum), pareto_selection=True,
+                   columnar_evaluation=True)
+
+
+def test_pareto_selection_keeps_hall_of_fame_in_archive():
+    search = TabuSearch(NearestNeighboursMutation(),
+                        [custom_metric('close_to_2', lambda x: abs(x - 2).sum(), minimized=True),
+                         custom_metric('close_to_5', lambda x: abs(x - 5).sum(), minimized=True)],
+                        metric_aggregation=per_metric_comparison_aggregation('pareto'),
+                        convergence_criterion=20, tabu_time=2, pareto_selection=True)
+    search.optimize(np.array([-3, 9]))
+
+    assert isinstance(search.hall_of_fame, ParetoArchive)
+    # the front has neither duplicates nor dominated solutions
+    scores = np.stack([s.quality.floats for s in search.hall_of_fame])
+    assert len(np.unique(scores, axis=0)) == len(scores)
+    assert (non_dominated_sort(scores) == 0).all()
@@ -0,0 +1,40 @@
+import numpy as np
+
+from tabusearch.solution.quality.aggregated import CompareAggregatedSolutionQualityInfo
+from tabusearch.solution.quality.lib.aggregated import per_metric_comparison_aggregation
+from tabusearch.solution.quality.single import SolutionQualityInfo
+
+
+def test_value_str_is_rendered_lazily_once():
+    calls = []
+
+    def value_str(data):
+        calls.append(data)
+        return 'rendered'
+
+    quality = SolutionQualityInfo(np.arange(5), 'q', 1., value_str=value_str)
+    assert calls == []
+    assert quality._str == 'rendered'
+    assert quality._str == 'rendered'
+    assert len(calls) == 1
+
+    default = SolutionQualityInfo(np.arange(3), 'q', 1.)
+    assert default._str == str(np.arange(3))
+    assert default.quality_like(float_=2.)._str == str(np.arange(3))
+
+
+def test_quality_like_renders_value_str_of_its_data():
+    quality = SolutionQualityInfo(np.arange(3), 'q', 1.)
+
+    # the string of the original quality is never rendered before
+    assert quality.quality_like(float_=2.)._str == str(np.arange(3))
+    assert quality.quality_like(data=np.arange(2))._str == str(np.arange(2))
+    assert quality._str == str(np.arange(3))
+
+
+def test_aggregated_value_str_joins_metrics_on_demand():
+    metrics = [SolutionQualityInfo(np.zeros(2), 'a', 1.), SolutionQualityInfo(np.ones(2), 'b', 2.)]
+    for quality in (CompareAggregatedSolutionQualityInfo(iter(metrics), 'agg', sum),
+                    per_metric_comparison_aggregation('agg')([metrics])[0]):
+        assert callable(quality._value_str)
+        assert quality._str == 'a(max) (1.0)\nb(max) (2.0)'
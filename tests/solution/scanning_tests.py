@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from tabusearch import TabuSearch
+from tabusearch.mutation.neighbourhood import NearestNeighboursMutation
+from tabusearch.solution.factory import SolutionFactory
+from tabusearch.solution.quality.lib import custom_vectorized_metric
+from tabusearch.solution.scanning import FirstImprovementScan, AspirationPlusScan
+from tabusearch.solution.selection import SolutionSelection
+
+WEIGHTS = np.array([-1., 0., 3., -2., 5., 4.])
+
+
+@pytest.fixture
+def evaluated():
+    return []
+
+
+@pytest.fixture
+def factory(evaluated):
+    def evaluation(x):
+        evaluated.append(len(x))
+        return x @ WEIGHTS
+
+    return SolutionFactory(custom_vectorized_metric('w', evaluation))
+
+
+def scan(factory, scanning, chunk_size=2):
+    pivot = factory.initial(np.zeros(len(WEIGHTS), dtype=int))
+    mutation = NearestNeighboursMutation(batched=True)
+    chunks = factory.stream([('NN', scanning.order(mutation.mutate(pivot)))], chunk_size, pivot=pivot)
+    return scanning(chunks, pivot, SolutionSelection())
+
+
+def test_first_improvement_stops_at_first_improving_neighbour(factory, evaluated):
+    # negative moves go first: -1 * -1 improves the pivot at index 0
+    chosen = scan(factory, FirstImprovementScan(order='generation'))
+
+    assert str(chosen.id) == 'NN(-,0)'
+    assert evaluated[1:] == [2]
+
+
+def test_aspiration_plus_selects_best_of_scanned(factory, evaluated):
+    chosen = scan(factory, AspirationPlusScan(plus=3, order='generation'))
+
+    # NN(-,0) improves, NN(-,1), NN(-,2) and NN(-,3) are scanned additionally
+    assert str(chosen.id) == 'NN(-,3)'
+    assert sum(evaluated[1:]) == 4
+    assert str(scan(factory, AspirationPlusScan(plus=0, min_candidates=11, order='generation')).id) == 'NN(+,4)'
+    assert str(scan(factory, AspirationPlusScan(plus=0, max_candidates=1, order='generation')).id) == 'NN(-,0)'
+
+
+@pytest.mark.parametrize('scanning', [FirstImprovementScan(seed=0), AspirationPlusScan(2, seed=0)])
+def test_scanning_search_improves_solution(scanning):
+    x0 = np.random.randint(-5, 5, 20)
+    optimiser = TabuSearch(NearestNeighboursMutation(batched=True),
+                           custom_vectorized_metric('sq', lambda x: (x ** 2).sum(axis=1), minimized=True),
+                           convergence_criterion=60, streaming_chunk_size=4, scan=scanning)
+
+    assert optimiser.optimize(x0).quality.value < (x0 ** 2).sum()
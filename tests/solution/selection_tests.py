@@ -0,0 +1,34 @@
+import random
+from operator import attrgetter
+
+import pytest
+from sortedcontainers import SortedList
+
+from tabusearch.solution.base import Solution
+from tabusearch.solution.id import SolutionId
+from tabusearch.solution.quality.single import SolutionQualityInfo
+from tabusearch.solution.selection import SolutionSelection
+
+
+def random_solutions(n):
+    # few distinct values to check order of equal qualities
+    return [Solution(SolutionId('Test', i), i, SolutionQualityInfo(i, 'q', random.randint(0, 5)))
+            for i in range(n)]
+
+
+@pytest.mark.parametrize('max_idx', [0, 1, 3])
+def test_partial_selection_equals_sorting(max_idx):
+    for _ in range(50):
+        solutions = random_solutions(random.randint(1, 30))
+        idx = random.randint(0, max_idx)
+        selection = SolutionSelection(lambda n: min(idx, n - 1), max_idx)
+
+        expected = selection(SortedList(solutions, key=attrgetter('quality')))
+        assert selection.select(solutions) is expected
+        assert SolutionSelection(lambda n: min(idx, n - 1)).select(solutions) is expected
+
+
+def test_default_selection_selects_best():
+    solutions = random_solutions(20)
+    assert SolutionSelection().select(solutions).quality == max(s.quality for s in solutions)
+    assert SolutionSelection().select([]) is None
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from tabusearch import TabuSearch
+from tabusearch.mutation.neighbourhood import NearestNeighboursMutation, FullAxisShiftMutation
+from tabusearch.mutation.pemutation import Swap2Mutation
+from tabusearch.solution.factory import SolutionFactory
+from tabusearch.solution.quality.lib import custom_metric
+
+
+def abs_sum(x):
+    # many neighbours of equal quality check that ties are broken as without streaming
+    return np.abs(x).sum()
+
+
+def test_stream_chunks_neighbourhood():
+    factory = SolutionFactory(custom_metric('sum', np.sum))
+    pivot = factory.initial(np.random.permutation(6))
+    generated = [('Swap2', Swap2Mutation(batched=True).mutate(pivot)), ('Swap2', Swap2Mutation().mutate(pivot))]
+
+    chunks = list(factory.stream(iter(generated), 4, pivot=pivot))
+    whole = factory.neighbourhood(generated, pivot=pivot)
+
+    assert [len(c) for c in chunks] == [4, 4, 4, 3] * 2
+    assert [str(i) for c in chunks for i in c.ids] == list(map(str, whole.ids))
+    assert np.concatenate([c.qualities.values for c in chunks]).tolist() == whole.qualities.values.tolist()
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 1000])
+@pytest.mark.parametrize('batched', [False, True])
+def test_streaming_search_equals_columnar_search(chunk_size, batched):
+    x0 = np.random.randint(-5, 5, 8)
+
+    def optimize(streaming_chunk_size):
+        optimiser = TabuSearch(mutation_behaviour=[NearestNeighboursMutation(batched), FullAxisShiftMutation()],
+                               metric=custom_metric('abs', abs_sum, minimized=True),
+                               convergence_criterion=20,
+                               tabu_time=3,
+                               selection=lambda n: min(2, n - 1),
+                               selection_depth=2,
+                               columnar_evaluation=True,
+                               streaming_chunk_size=streaming_chunk_size)
+        optimiser.optimize(x0)
+        return [(str(s.id), s.quality.value) for s in optimiser.history[1:]]
+
+    assert optimize(chunk_size) == optimize(None)
+
+
+def test_streaming_requires_selection_depth():
+    with pytest.raises(ValueError):
+        TabuSearch(NearestNeighboursMutation(), custom_metric('abs', abs_sum),
+                   selection=lambda n: n - 1, streaming_chunk_size=10)